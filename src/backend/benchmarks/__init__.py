@@ -0,0 +1,3 @@
+# backend/benchmarks/__init__.py
+# Micro-benchmarks for the recommender hot paths.
+# Run from src/, e.g.: python -m backend.benchmarks.bench_overlap
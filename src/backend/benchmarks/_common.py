@@ -0,0 +1,87 @@
+# src/backend/benchmarks/_common.py
+import os
+import statistics
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from ..services.ingredient_index import to_word_set
+
+DEFAULT_CSV = os.path.join("data", "final", "appetite_with_categories.csv")
+CURRENT_CORPUS_SIZE = 13495
+
+SAMPLE_PANTRIES = [
+    "olive oil, onion, tomato, rice",
+    "chicken, yogurt, garlic, lemon",
+    "chocolate, butter, sugar",
+    "eggs, flour, milk",
+    "salmon, soy sauce, ginger, scallions",
+]
+
+
+def time_call(fn: Callable, repeat: int = 20, warmup: int = 2) -> Dict[str, float]:
+    """Run ``fn`` a few times and return latency stats in milliseconds."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    samples.sort()
+    return {
+        "mean_ms": statistics.mean(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+    }
+
+
+def print_row(label: str, stats: Dict[str, float]):
+    print(
+        f"{label:40s} mean={stats['mean_ms']:9.3f} ms  "
+        f"p50={stats['p50_ms']:9.3f} ms  p95={stats['p95_ms']:9.3f} ms"
+    )
+
+
+def load_ingredient_texts(csv_path: Optional[str]) -> Optional[List[str]]:
+    """Ingredient strings of the categorized dataset, or None if it is not on disk."""
+    if not csv_path or not os.path.exists(csv_path):
+        return None
+    import pandas as pd
+
+    df = pd.read_csv(csv_path, usecols=["ingredients_text"])
+    return df["ingredients_text"].fillna("").astype(str).str.lower().tolist()
+
+
+def synthetic_ingredient_texts(n: int, vocab_size: int = 3000,
+                               words_per_recipe: int = 30, seed: int = 0) -> List[str]:
+    """Zipf-ish fake ingredient lists, used when the real CSV is not available."""
+    rng = np.random.default_rng(seed)
+    # real pantry words take the most frequent slots so sample queries hit
+    real_words = sorted(to_word_set(" ".join(SAMPLE_PANTRIES)))
+    vocab = real_words + [f"ing{i}" for i in range(vocab_size - len(real_words))]
+    probs = 1.0 / np.arange(1, vocab_size + 1)
+    probs /= probs.sum()
+    out = []
+    for _ in range(n):
+        ids = rng.choice(vocab_size, size=words_per_recipe, p=probs)
+        out.append(", ".join(vocab[i] for i in ids))
+    return out
+
+
+def clustered_embeddings(n: int, dim: int = 384, clusters: int = 200,
+                         spread: float = 0.35, seed: int = 0) -> np.ndarray:
+    """Gaussian blobs around random centres: closer to real sentence embeddings than pure noise."""
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=n)
+    noise = rng.standard_normal((n, dim)).astype(np.float32) * spread
+    return centres[labels] + noise
+
+
+def load_embeddings(path: Optional[str], n: int, seed: int = 0) -> np.ndarray:
+    """Real embedding matrix if ``path`` exists, else a clustered synthetic one with ``n`` rows."""
+    if path and os.path.exists(path):
+        return np.load(path)
+    return clustered_embeddings(n, seed=seed)
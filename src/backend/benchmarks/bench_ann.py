@@ -0,0 +1,64 @@
+# src/backend/benchmarks/bench_ann.py
+"""
+Recall@k vs. latency of the IVF index against exact dot-product search.
+
+    python -m backend.benchmarks.bench_ann --embeddings model/recommender_embeddings.npy
+    python -m backend.benchmarks.bench_ann --n 134950          # synthetic, 10x corpus
+"""
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from ..services.ann_index import IVFIndex
+from ..services.ranking import cosine_scores, l2_normalize_rows, top_k_indices
+from ._common import CURRENT_CORPUS_SIZE, load_embeddings, print_row, time_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--embeddings", default=None)
+    parser.add_argument("--n", type=int, default=CURRENT_CORPUS_SIZE)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--nlist", type=int, default=None)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64])
+    args = parser.parse_args()
+
+    emb = l2_normalize_rows(load_embeddings(args.embeddings, args.n))
+    rng = np.random.default_rng(1)
+    # queries: perturbed corpus rows, like a pantry close to some recipes
+    queries = emb[rng.choice(len(emb), args.queries, replace=False)]
+    queries = queries + rng.standard_normal(queries.shape).astype(np.float32) * 0.05
+
+    start = time.perf_counter()
+    index = IVFIndex.build(emb, nlist=args.nlist)
+    print(f"N={len(emb)} dim={emb.shape[1]} nlist={index.nlist} "
+          f"build={time.perf_counter() - start:.1f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index.save(tmp)
+        index = IVFIndex.load(tmp, mmap=True)
+
+        exact = [set(top_k_indices(cosine_scores(emb, q), args.k)[0].tolist()) for q in queries]
+        print_row(f"exact k={args.k}", time_call(
+            lambda: [top_k_indices(cosine_scores(emb, q), args.k) for q in queries], repeat=3))
+
+        for nprobe in args.nprobe:
+            if nprobe > index.nlist:
+                break
+            hits = 0
+            for q, truth in zip(queries, exact):
+                ids, _ = index.search(q, args.k, nprobe=nprobe)
+                hits += len(truth & set(ids.tolist()))
+            recall = hits / float(args.k * len(queries))
+            stats = time_call(
+                lambda: [index.search(q, args.k, nprobe=nprobe) for q in queries], repeat=3)
+            print_row(f"ivf nprobe={nprobe:<3d} recall@{args.k}={recall:.3f}", stats)
+
+    print(f"(latencies are per batch of {args.queries} queries)")
+
+
+if __name__ == "__main__":
+    main()
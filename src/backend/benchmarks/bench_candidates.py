@@ -0,0 +1,87 @@
+# src/backend/benchmarks/bench_candidates.py
+"""
+Candidate pre-selection: score every recipe vs. only recipes sharing >= k
+pantry tokens (inverted ingredient index).
+
+    python -m backend.benchmarks.bench_candidates --csv data/final/appetite_with_categories.csv \
+        --embeddings model/recommender_embeddings.npy --min-shared 1 2
+"""
+import argparse
+
+import numpy as np
+
+from ..services.ingredient_index import IngredientMatrix, InvertedIngredientIndex, to_word_set
+from ..services.ranking import cosine_scores, l2_normalize_rows, top_k_indices
+from ._common import (
+    CURRENT_CORPUS_SIZE,
+    DEFAULT_CSV,
+    SAMPLE_PANTRIES,
+    load_embeddings,
+    load_ingredient_texts,
+    print_row,
+    synthetic_ingredient_texts,
+    time_call,
+)
+
+
+def _hybrid_scores(embeddings, word_matrix, words, query, rows=None):
+    # mirrors recommender.recommend_recipes: cosine + overlap on the candidate rows
+    if rows is None:
+        cos = cosine_scores(embeddings, query)
+    else:
+        cos = cosine_scores(embeddings[rows], query)
+    overlap = word_matrix.overlap_scores(words, rows=rows)
+    return 0.6 * overlap + 0.4 * cos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--csv", default=DEFAULT_CSV)
+    parser.add_argument("--embeddings", default=None)
+    parser.add_argument("--min-shared", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    texts = load_ingredient_texts(args.csv)
+    source = args.csv
+    if texts is None:
+        texts = synthetic_ingredient_texts(CURRENT_CORPUS_SIZE)
+        source = "synthetic"
+
+    word_matrix = IngredientMatrix.from_word_sets(to_word_set(t) for t in texts)
+    n = word_matrix.num_recipes
+    embeddings = l2_normalize_rows(load_embeddings(args.embeddings, n))[:n]
+    inverted = InvertedIngredientIndex.from_matrix(word_matrix)
+    print(
+        f"corpus={source} recipes={n} vocab={len(inverted.vocab)} "
+        f"postings={inverted.deltas.size} ({inverted.deltas.dtype}, {inverted.nbytes / 2**20:.2f} MiB; "
+        f"csr indices {word_matrix.matrix.indices.nbytes / 2**20:.2f} MiB)"
+    )
+
+    rng = np.random.default_rng(0)
+    for pantry in SAMPLE_PANTRIES:
+        words = to_word_set(pantry)
+        query = embeddings[rng.integers(n)]
+        full_top, _ = top_k_indices(_hybrid_scores(embeddings, word_matrix, words, query), args.k)
+
+        print(f"\npantry: {pantry}")
+        print_row("  full scan", time_call(
+            lambda: _hybrid_scores(embeddings, word_matrix, words, query), args.repeat))
+
+        for k in args.min_shared:
+            ids = inverted.candidates(words, k)
+            assert np.array_equal(ids, np.flatnonzero(word_matrix.overlap_counts(words) >= min(k, len(words))))
+            if ids.size < args.k:
+                print(f"  >={k} shared: {ids.size} candidates (< top_k, recommender scans everything)")
+                continue
+            top_pos, _ = top_k_indices(_hybrid_scores(embeddings, word_matrix, words, query, ids), args.k)
+            kept = len(set(ids[top_pos].tolist()) & set(full_top.tolist())) / float(args.k)
+            print(f"  >={k} shared: {ids.size} candidates ({ids.size / n:.1%}), top{args.k} agreement={kept:.2f}")
+            print_row(f"    pre-select + score (k={k})", time_call(
+                lambda: _hybrid_scores(embeddings, word_matrix, words, query,
+                                       inverted.candidates(words, k)), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
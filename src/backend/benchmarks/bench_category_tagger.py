@@ -0,0 +1,107 @@
+# src/backend/benchmarks/bench_category_tagger.py
+"""
+Category tagging: pickled TF-IDF + classifier vs. the compiled keyword rules.
+
+Reports per-text latency of both (the classifier also batched), per-label agreement of the rules with the
+dataset's ``categories`` column (notebook 3 output), and how often the two
+taggers agree on meat / seafood (the only concept both taxonomies share).
+
+    python -m backend.benchmarks.bench_category_tagger \
+        --csv data/final/appetite_with_categories.csv --model-dir model
+"""
+import argparse
+import os
+import time
+
+from ..services.category_index import parse_categories
+from ..services.category_rules import RULE_CATEGORIES, RULE_TAGGER
+from ._common import CURRENT_CORPUS_SIZE, DEFAULT_CSV, print_row, synthetic_ingredient_texts, time_call
+
+# classifier labels that mean "contains meat or fish"
+_ANIMAL_CLASSES = {"poultry", "red_meat", "seafood"}
+
+
+def _load(csv_path, limit):
+    if not csv_path or not os.path.exists(csv_path):
+        return None
+    import pandas as pd
+
+    df = pd.read_csv(csv_path, usecols=["ingredients_text", "target_text", "categories"],
+                     dtype=str, keep_default_na=False, nrows=limit)
+    return df
+
+
+def _per_text_us(fn, texts, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for t in texts:
+            fn(t)
+        best = min(best, time.perf_counter() - start)
+    return best / len(texts) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default=DEFAULT_CSV)
+    parser.add_argument("--model-dir", default="model", help="category_classifier.pkl + category_vectorizer.pkl")
+    parser.add_argument("--limit", type=int, default=None, help="rows of the CSV to use")
+    parser.add_argument("--latency-texts", type=int, default=2000)
+    args = parser.parse_args()
+
+    df = _load(args.csv, args.limit)
+    if df is None:
+        texts = synthetic_ingredient_texts(min(CURRENT_CORPUS_SIZE, args.latency_texts))
+        print("corpus=synthetic (no labels: latency only)")
+    else:
+        texts = df["ingredients_text"].str.lower().tolist()
+        print(f"corpus={args.csv} recipes={len(df)}")
+    sample = texts[:args.latency_texts]
+
+    print(f"\nrules: {len(RULE_CATEGORIES)} labels, "
+          f"per text {_per_text_us(RULE_TAGGER.tag, sample):.1f} us (ingredients only, {len(sample)} texts)")
+    print_row("  rules, whole sample", time_call(lambda: [RULE_TAGGER.tag(t) for t in sample], 5))
+
+    classifier = None
+    clf_path = os.path.join(args.model_dir, "category_classifier.pkl")
+    vec_path = os.path.join(args.model_dir, "category_vectorizer.pkl")
+    if os.path.exists(clf_path) and os.path.exists(vec_path):
+        import joblib
+
+        classifier, vectorizer = joblib.load(clf_path), joblib.load(vec_path)
+        ml = lambda t: classifier.predict(vectorizer.transform([t]))
+        ml_sample = sample[:max(1, len(sample) // 10)]
+        print(f"model: per text {_per_text_us(ml, ml_sample, repeat=1):.1f} us ({len(ml_sample)} texts, "
+              f"one transform + predict each)")
+        start = time.perf_counter()
+        classifier.predict(vectorizer.transform(sample))
+        print(f"model, batched: per text {(time.perf_counter() - start) / len(sample) * 1e6:.1f} us "
+              f"({len(sample)} texts in one sparse matrix, as tag_categories_batch)")
+    else:
+        print(f"model: no pickles in {args.model_dir}, skipped")
+
+    if df is None:
+        return
+
+    rules = [RULE_TAGGER.tag(i, x) for i, x in zip(df["ingredients_text"], df["target_text"])]
+    truth = [set(parse_categories(c)) for c in df["categories"]]
+
+    print("\nrules vs. dataset labels (target text, which starts with the title, as context)")
+    exact = sum(set(r) == t for r, t in zip(rules, truth)) / len(truth)
+    print(f"  exact label-set match: {exact:.1%}")
+    for label in RULE_CATEGORIES:
+        predicted = [label in r for r in rules]
+        actual = [label in t for t in truth]
+        tp = sum(p and a for p, a in zip(predicted, actual))
+        precision = tp / max(1, sum(predicted))
+        recall = tp / max(1, sum(actual))
+        print(f"  {label:16s} support={sum(actual):6d} precision={precision:.3f} recall={recall:.3f}")
+
+    if classifier is not None:
+        preds = classifier.predict(vectorizer.transform(texts))
+        agree = sum((p in _ANIMAL_CLASSES) == ("vegetarian" not in r) for p, r in zip(preds, rules))
+        print(f"\nmodel vs. rules on meat/seafood: {agree / len(rules):.1%} agree")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# src/backend/benchmarks/bench_embedding_store.py
+"""
+Per-worker memory and ranking fidelity: float32 np.load vs. mmapped float16/int8 store.
+
+    python -m backend.benchmarks.bench_embedding_store --embeddings model/recommender_embeddings.npy --workers 4
+
+Memory is read from /proc/self/smaps_rollup (Linux). PSS splits shared pages
+between the workers mapping them, so it is the honest "cost per worker".
+"""
+import argparse
+import multiprocessing as mp
+import os
+import tempfile
+
+import numpy as np
+
+from ..services.embedding_store import QuantizedEmbeddings
+from ..services.ranking import cosine_scores, l2_normalize_rows, top_k_indices
+from ._common import CURRENT_CORPUS_SIZE, load_embeddings, print_row, time_call
+
+
+def _memory_kb():
+    out = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Pss:"):
+                out[parts[0][:-1]] = int(parts[1])
+    return out
+
+
+def _load(kind: str, path: str):
+    if kind == "float32":
+        return l2_normalize_rows(np.load(os.path.join(path, "float32.npy")))
+    return QuantizedEmbeddings.load(os.path.join(path, kind), mmap=True)
+
+
+def _worker(kind, path, query, barrier, results):
+    before = _memory_kb()
+    emb = _load(kind, path)
+    emb @ query  # touch every page
+    barrier.wait()  # all workers mapped -> PSS reflects sharing
+    after = _memory_kb()
+    results.put({k: after[k] - before[k] for k in after})
+    barrier.wait()
+
+
+def _memory_per_worker(kind, path, query, workers):
+    ctx = mp.get_context("spawn")
+    barrier, results = ctx.Barrier(workers), ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(kind, path, query, barrier, results))
+             for _ in range(workers)]
+    for p in procs:
+        p.start()
+    stats = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return {k: sum(s[k] for s in stats) / len(stats) / 1024.0 for k in stats[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--embeddings", default=None)
+    parser.add_argument("--n", type=int, default=CURRENT_CORPUS_SIZE)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5)
+    args = parser.parse_args()
+
+    emb = l2_normalize_rows(load_embeddings(args.embeddings, args.n))
+    rng = np.random.default_rng(1)
+    queries = rng.standard_normal((args.queries, emb.shape[1])).astype(np.float32)
+    exact = [cosine_scores(emb, q) for q in queries]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        np.save(os.path.join(tmp, "float32.npy"), emb)
+        for dtype in ("float16", "int8"):
+            QuantizedEmbeddings.quantize(emb, dtype=dtype).save(os.path.join(tmp, dtype))
+
+        print(f"N={len(emb)} dim={emb.shape[1]} workers={args.workers}")
+        for kind in ("float32", "float16", "int8"):
+            store = _load(kind, tmp)
+
+            overlap, max_err = 0, 0.0
+            for q, ref in zip(queries, exact):
+                got = cosine_scores(store, q)
+                max_err = max(max_err, float(np.abs(got - ref).max()))
+                overlap += len(set(top_k_indices(got, args.k)[0].tolist())
+                               & set(top_k_indices(ref, args.k)[0].tolist()))
+
+            mem = _memory_per_worker(kind, tmp, queries[0], args.workers)
+            print(f"\n{kind}: rss/worker={mem['Rss']:.1f} MiB  pss/worker={mem['Pss']:.1f} MiB  "
+                  f"top{args.k} overlap={overlap / (args.k * len(queries)):.3f}  "
+                  f"max |score err|={max_err:.4f}")
+            print_row("  score one query", time_call(lambda: cosine_scores(store, queries[0])))
+
+
+if __name__ == "__main__":
+    main()
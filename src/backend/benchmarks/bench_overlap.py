@@ -0,0 +1,65 @@
+# src/backend/benchmarks/bench_overlap.py
+"""
+Ingredient-overlap scoring: per-row set intersection vs. sparse mat-vec.
+
+    python -m backend.benchmarks.bench_overlap --csv data/final/appetite_with_categories.csv
+"""
+import argparse
+
+import numpy as np
+
+from ..services.ingredient_index import IngredientMatrix, to_word_set
+from ._common import (
+    CURRENT_CORPUS_SIZE,
+    DEFAULT_CSV,
+    SAMPLE_PANTRIES,
+    load_ingredient_texts,
+    print_row,
+    synthetic_ingredient_texts,
+    time_call,
+)
+
+
+def _loop_overlap(pantry_words, word_sets):
+    # the pre-index implementation: one Python set intersection per recipe
+    scores = []
+    for recipe_words in word_sets:
+        if not pantry_words:
+            scores.append(0.0)
+            continue
+        scores.append(len(pantry_words & recipe_words) / float(len(pantry_words)))
+    return np.array(scores)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--csv", default=DEFAULT_CSV)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    texts = load_ingredient_texts(args.csv)
+    source = args.csv
+    if texts is None:
+        texts = synthetic_ingredient_texts(CURRENT_CORPUS_SIZE)
+        source = "synthetic"
+
+    word_sets = [to_word_set(t) for t in texts]
+    index = IngredientMatrix.from_word_sets(word_sets)
+    print(
+        f"corpus={source} recipes={index.num_recipes} vocab={len(index.vocab)} "
+        f"nnz={index.matrix.nnz}"
+    )
+
+    for pantry in SAMPLE_PANTRIES:
+        words = to_word_set(pantry)
+        expected = _loop_overlap(words, word_sets)
+        got = index.overlap_scores(words)
+        assert np.allclose(expected, got), f"score mismatch for {pantry!r}"
+
+        print(f"\npantry: {pantry}")
+        print_row("  python loop", time_call(lambda: _loop_overlap(words, word_sets), args.repeat))
+        print_row("  csr mat-vec", time_call(lambda: index.overlap_scores(words), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
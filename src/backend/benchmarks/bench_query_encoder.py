@@ -0,0 +1,86 @@
+# src/backend/benchmarks/bench_query_encoder.py
+"""
+Query encoder parity and latency: sentence-transformers (torch) vs. ONNX Runtime.
+
+    python -m backend.benchmarks.bench_query_encoder \
+        --model sentence-transformers/all-MiniLM-L6-v2 --onnx-dir model/recommender_encoder_onnx
+
+Parity is checked on cosine scores of sample pantries against recipe texts;
+the script exits non-zero if an ONNX variant drifts past its tolerance.
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+from ..services.onnx_encoder import DEFAULT_MODEL_FILE, INT8_MODEL_FILE, OnnxSentenceEncoder
+from ..services.query_embedding import pantry_key, pantry_query_text
+from ..services.ranking import l2_normalize_rows, top_k_indices
+from ._common import (
+    DEFAULT_CSV,
+    SAMPLE_PANTRIES,
+    load_ingredient_texts,
+    print_row,
+    synthetic_ingredient_texts,
+    time_call,
+)
+
+
+def _cosines(encoder, queries, recipes):
+    q = l2_normalize_rows(encoder.encode(queries))
+    r = l2_normalize_rows(encoder.encode(recipes, batch_size=64))
+    return q @ r.T
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default="sentence-transformers/all-MiniLM-L6-v2")
+    parser.add_argument("--onnx-dir", required=True)
+    parser.add_argument("--csv", default=DEFAULT_CSV)
+    parser.add_argument("--recipes", type=int, default=500)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=1e-3, help="max |cos diff| for fp32")
+    parser.add_argument("--int8-tolerance", type=float, default=0.05, help="max |cos diff| for int8")
+    args = parser.parse_args()
+
+    from sentence_transformers import SentenceTransformer
+
+    texts = load_ingredient_texts(args.csv) or synthetic_ingredient_texts(args.recipes)
+    recipes = [f"Ingredients: {t}" for t in texts[: args.recipes]]
+    queries = [pantry_query_text(pantry_key(p)) for p in SAMPLE_PANTRIES]
+
+    torch_encoder = SentenceTransformer(args.model, device="cpu")
+    reference = _cosines(torch_encoder, queries, recipes)
+    batch = queries * 7  # ~32 texts, like a full micro-batch
+
+    print(f"recipes={len(recipes)} queries={len(queries)}")
+    print_row("torch single query", time_call(lambda: torch_encoder.encode(queries[:1])))
+    print_row("torch batch of 35", time_call(lambda: torch_encoder.encode(batch), repeat=5))
+
+    failed = False
+    for model_file, tolerance in ((DEFAULT_MODEL_FILE, args.tolerance),
+                                  (INT8_MODEL_FILE, args.int8_tolerance)):
+        if not os.path.exists(os.path.join(args.onnx_dir, model_file)):
+            continue
+        encoder = OnnxSentenceEncoder(args.onnx_dir, model_file=model_file)
+        got = _cosines(encoder, queries, recipes)
+
+        max_diff = float(np.abs(got - reference).max())
+        agree = np.mean([
+            len(set(top_k_indices(g, args.k)[0].tolist()) & set(top_k_indices(r, args.k)[0].tolist()))
+            / float(args.k)
+            for g, r in zip(got, reference)
+        ])
+        ok = max_diff <= tolerance
+        failed |= not ok
+        print(f"\n{model_file}: max |cos diff|={max_diff:.5f} (tol {tolerance}) "
+              f"top{args.k} agreement={agree:.3f} {'OK' if ok else 'FAIL'}")
+        print_row("  onnx single query", time_call(lambda: encoder.encode(queries[:1])))
+        print_row("  onnx batch of 35", time_call(lambda: encoder.encode(batch), repeat=5))
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
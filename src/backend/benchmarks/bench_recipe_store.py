@@ -0,0 +1,103 @@
+# src/backend/benchmarks/bench_recipe_store.py
+"""
+Recipe metadata: joblib pickle + pandas vs. memory-mapped columnar store.
+
+    python -m backend.benchmarks.bench_recipe_store --metadata model/recommender_metadata.pkl
+
+Load time and RSS are measured in fresh spawned processes (including the
+imports each path needs); row access fetches 5 random rows per call.
+"""
+import argparse
+import multiprocessing as mp
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from ..services.recipe_store import RECIPE_COLUMNS, RecipeStore
+from ._common import CURRENT_CORPUS_SIZE, print_row, time_call
+
+
+def _rss_kb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def _load_worker(kind, path, results):
+    before = _rss_kb()
+    start = time.perf_counter()
+    if kind == "pickle":
+        import joblib
+        obj = joblib.load(os.path.join(path, "metadata.pkl"))
+    else:
+        from backend.services.recipe_store import RecipeStore as Store
+        obj = Store.load(os.path.join(path, "store"), mmap=True)
+    elapsed = time.perf_counter() - start
+    results.put((elapsed * 1000.0, (_rss_kb() - before) / 1024.0, len(obj)))
+
+
+def _measure_load(kind, path):
+    ctx = mp.get_context("spawn")
+    results = ctx.Queue()
+    p = ctx.Process(target=_load_worker, args=(kind, path, results))
+    p.start()
+    out = results.get()
+    p.join()
+    return out
+
+
+def _synthetic_metadata(n: int):
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    words = np.array(["chicken", "garlic", "onion", "butter", "flour", "sugar", "salt",
+                      "tomato", "rice", "lemon", "oil", "pepper", "cream", "eggs"])
+
+    def text(k):
+        return " ".join(rng.choice(words, size=k))
+
+    return pd.DataFrame({
+        "Title": [text(4) for _ in range(n)],
+        "ingredients_text": [text(60) for _ in range(n)],
+        "target_text": [text(250) for _ in range(n)],
+        "categories": ["|".join(sorted(set(rng.choice(["quick", "healthy", "dinner", "vegan"], 2))))
+                       for _ in range(n)],
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--metadata", default=None)
+    parser.add_argument("--n", type=int, default=CURRENT_CORPUS_SIZE)
+    args = parser.parse_args()
+
+    import joblib
+
+    if args.metadata and os.path.exists(args.metadata):
+        df = joblib.load(args.metadata)
+    else:
+        df = _synthetic_metadata(args.n)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        joblib.dump(df, os.path.join(tmp, "metadata.pkl"))
+        RecipeStore.from_dataframe(df).save(os.path.join(tmp, "store"))
+        store = RecipeStore.load(os.path.join(tmp, "store"))
+
+        print(f"rows={len(df)}")
+        for kind in ("pickle", "store"):
+            ms, rss, _ = _measure_load(kind, tmp)
+            print(f"  load {kind:6s}: {ms:8.1f} ms  rss +{rss:6.1f} MiB")
+
+        rows = np.random.default_rng(1).integers(0, len(df), size=5)
+        print_row("  5 rows via df.iloc", time_call(
+            lambda: [{c: df.iloc[i][c] for c in RECIPE_COLUMNS} for i in rows], repeat=200))
+        print_row("  5 rows via RecipeStore.row", time_call(
+            lambda: [store.row(i) for i in rows], repeat=200))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# src/backend/benchmarks/bench_sharded.py
+"""
+Sharded exact scoring: one process (mat-vec + top-k over the whole matrix)
+vs. ShardedScorer with 1..N shards / worker processes over shared memory.
+Prints a latency and speedup row per shard count (the scaling curve).
+
+    python -m backend.benchmarks.bench_sharded --n 1000000 --shards 1 2 4 8
+    python -m backend.benchmarks.bench_sharded --n 1000000 --quantize int8
+"""
+import argparse
+import os
+
+import numpy as np
+
+from ..services.embedding_store import QuantizedEmbeddings, SUPPORTED_DTYPES
+from ..services.ranking import cosine_scores, l2_normalize_rows, top_k_indices
+from ..services.sharded_scorer import ShardedScorer
+from ._common import clustered_embeddings, print_row, time_call
+
+
+def _default_shards():
+    cores = os.cpu_count() or 1
+    out, s = [], 1
+    while s < cores:
+        out.append(s)
+        s *= 2
+    return out + [cores]
+
+
+def _single(embeddings, query, k, allowed):
+    scores = cosine_scores(embeddings, query)
+    if allowed is None:
+        return top_k_indices(scores, k)
+    rows = np.flatnonzero(allowed)
+    top, top_scores = top_k_indices(scores[rows], k)
+    return rows[top], top_scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=200000, help="recipes (synthetic embeddings)")
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--shards", type=int, nargs="+", default=None, help="default 1, 2, 4 .. cpu count")
+    parser.add_argument("--k", type=int, default=200, help="shortlist size (ANN_CANDIDATES)")
+    parser.add_argument("--allowed", type=float, default=0.5, help="fraction kept by the category mask")
+    parser.add_argument("--quantize", choices=sorted(SUPPORTED_DTYPES), default=None)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    embeddings = l2_normalize_rows(clustered_embeddings(args.n, dim=args.dim))
+    if args.quantize:
+        embeddings = QuantizedEmbeddings.quantize(embeddings, args.quantize)
+    rng = np.random.default_rng(1)
+    query = embeddings[int(rng.integers(args.n))]
+    masks = {"all": None, f"{args.allowed:.0%} allowed": rng.random(args.n) < args.allowed}
+    print(f"N={args.n} dim={args.dim} store={args.quantize or 'float32'} k={args.k} cores={os.cpu_count()}")
+
+    baselines = {}
+    for label, allowed in masks.items():
+        baselines[label] = time_call(lambda: _single(embeddings, query, args.k, allowed), args.repeat)
+        print_row(f"  single process ({label})", baselines[label])
+
+    for shards in args.shards or _default_shards():
+        scorer = ShardedScorer(embeddings, shards)
+        try:
+            for label, allowed in masks.items():
+                ids, _ = scorer.search(query, args.k, allowed=allowed)
+                expected, _ = _single(embeddings, query, args.k, allowed)
+                assert set(ids.tolist()) == set(expected.tolist())
+                stats = time_call(lambda: scorer.search(query, args.k, allowed=allowed), args.repeat)
+                print_row(f"  {shards} shard(s) ({label})", stats)
+                print(f"{'':42s}speedup x{baselines[label]['p50_ms'] / stats['p50_ms']:.2f}")
+        finally:
+            scorer.close()
+
+
+if __name__ == "__main__":
+    main()
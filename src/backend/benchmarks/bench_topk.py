@@ -0,0 +1,41 @@
+# src/backend/benchmarks/bench_topk.py
+"""
+Top-k selection: full argsort / pandas sort_values vs. argpartition.
+
+    python -m backend.benchmarks.bench_topk --k 5
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from ..services.ranking import top_k_indices
+from ._common import CURRENT_CORPUS_SIZE, print_row, time_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for n in (CURRENT_CORPUS_SIZE, CURRENT_CORPUS_SIZE * 10):
+        scores = rng.random(n, dtype=np.float32)
+        df = pd.DataFrame({"Title": np.arange(n).astype(str), "final_score": scores})
+
+        idx, _ = top_k_indices(scores, args.k)
+        assert np.array_equal(idx, np.argsort(-scores, kind="stable")[: args.k])
+
+        print(f"\nN={n} k={args.k}")
+        print_row("  np.argsort()[::-1][:k]", time_call(
+            lambda: np.argsort(scores)[::-1][: args.k], args.repeat))
+        print_row("  df.copy().sort_values().head(k)", time_call(
+            lambda: df.copy().sort_values("final_score", ascending=False).head(args.k),
+            args.repeat))
+        print_row("  top_k_indices (argpartition)", time_call(
+            lambda: top_k_indices(scores, args.k), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
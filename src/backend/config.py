@@ -15,6 +15,106 @@ NUM_BEAMS = int(os.getenv("NUM_BEAMS", "4"))
 MODEL_DIR = os.getenv("APPETITE_MODEL_DIR", "/app/model/flan_t5_appetite_lora")
 DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
 
+# ---------------- Recommender ----------------
+RECOMMENDER_DIR = os.getenv("APPETITE_RECOMMENDER_DIR", "/app/model")
+RECOMMENDER_EMB_PATH = os.path.join(RECOMMENDER_DIR, "recommender_embeddings.npy")
+RECOMMENDER_EMB_STORE_DIR = os.path.join(RECOMMENDER_DIR, "recommender_embeddings_q")
+RECOMMENDER_META_PATH = os.path.join(RECOMMENDER_DIR, "recommender_metadata.pkl")
+RECOMMENDER_RECIPES_DIR = os.path.join(RECOMMENDER_DIR, "recommender_recipes")
+RECOMMENDER_INFO_PATH = os.path.join(RECOMMENDER_DIR, "recommender_model_info.json")
+# joblib mmap_mode for pickled artifacts (e.g. "r"): numpy arrays inside the
+# pickle are memory-mapped and shared between workers; empty loads them in full
+ARTIFACT_MMAP_MODE = os.getenv("APPETITE_ARTIFACT_MMAP_MODE", "") or None
+# How often (seconds) workers poll the index manifest for a new version
+# (appended segment, compaction, rebuild) and reload it in the background; 0 disables.
+INDEX_RELOAD_CHECK_S = float(os.getenv("INDEX_RELOAD_CHECK_S", "30"))
+
+# side indexes written by `python -m backend.tools.build_index` (derived at load if absent)
+RECOMMENDER_WORDS_DIR = os.path.join(RECOMMENDER_DIR, "recommender_ingredients")
+RECOMMENDER_CATEGORIES_DIR = os.path.join(RECOMMENDER_DIR, "recommender_categories")
+
+# Hybrid score = ALPHA * ingredient overlap + BETA * embedding cosine
+ALPHA_INGREDIENT = float(os.getenv("ALPHA_INGREDIENT", "0.6"))
+BETA_EMBEDDING = float(os.getenv("BETA_EMBEDDING", "0.4"))
+
+# /recommend serves retrieved recipes unless the best one's absolute hybrid
+# score (ALPHA * overlap + BETA * cosine, in [0, 1]) is below this; then FLAN-T5 generates.
+RETRIEVAL_MIN_CONFIDENCE = float(os.getenv("RETRIEVAL_MIN_CONFIDENCE", "0.35"))
+
+# LRU of pantry query embeddings (keyed by the normalized ingredient set)
+QUERY_EMBED_CACHE_SIZE = int(os.getenv("QUERY_EMBED_CACHE_SIZE", "2048"))
+
+# Micro-batching of concurrent query encodes (0 wait disables batching)
+EMBED_BATCH_MAX_SIZE = int(os.getenv("EMBED_BATCH_MAX_SIZE", "32"))
+EMBED_BATCH_MAX_WAIT_MS = float(os.getenv("EMBED_BATCH_MAX_WAIT_MS", "5"))
+
+# ANN (IVF) index: used only when the candidate set is larger than ANN_MIN_CORPUS.
+# ANN_NPROBE is the recall/latency knob (clusters scanned per query). For an
+# index built by backend.tools.build_index, the ANN dir of the manifest's
+# base_dir is used.
+ANN_INDEX_DIR = os.getenv("APPETITE_ANN_INDEX_DIR", os.path.join(RECOMMENDER_DIR, "recommender_ann"))
+ANN_MIN_CORPUS = int(os.getenv("ANN_MIN_CORPUS", "50000"))
+ANN_NPROBE = int(os.getenv("ANN_NPROBE", "8"))
+ANN_CANDIDATES = int(os.getenv("ANN_CANDIDATES", "200"))
+
+# Sharded exact scoring: with SCORING_SHARDS > 1 and more than
+# SCORING_SHARD_MIN_CORPUS candidates, the embedding matrix is split into that
+# many shards held in shared memory and scored by a pool of worker processes
+# (one per shard, capped at SCORING_SHARD_WORKERS when set); shard-local top
+# ANN_CANDIDATES are merged and hybrid-ranked. Takes precedence over the ANN index.
+SCORING_SHARDS = int(os.getenv("SCORING_SHARDS", "0"))
+SCORING_SHARD_WORKERS = int(os.getenv("SCORING_SHARD_WORKERS", "0"))
+SCORING_SHARD_MIN_CORPUS = int(os.getenv("SCORING_SHARD_MIN_CORPUS", "100000"))
+
+# Candidate pre-selection: only recipes sharing at least this many pantry
+# tokens (via the inverted ingredient index) are scored; 0 scores every recipe.
+# Used only when it keeps fewer than top_k..CANDIDATE_MAX_FRACTION of the
+# category's recipes -- gathering a large subset costs more than a full scan.
+CANDIDATE_MIN_SHARED_TOKENS = int(os.getenv("CANDIDATE_MIN_SHARED_TOKENS", "1"))
+CANDIDATE_MAX_FRACTION = float(os.getenv("CANDIDATE_MAX_FRACTION", "0.25"))
+
+# Diversity re-ranking: the top MMR_POOL_SIZE hybrid-scored candidates are
+# re-picked by maximal marginal relevance so near-duplicate recipes (title
+# variants) do not fill the top-k. MMR_LAMBDA weighs relevance vs. novelty;
+# 1.0 disables the stage (plain top-k).
+MMR_LAMBDA = float(os.getenv("MMR_LAMBDA", "1.0"))
+MMR_POOL_SIZE = int(os.getenv("MMR_POOL_SIZE", "100"))
+
+# Max pantries per /recommend/batch call, max num_recipes per request
+RECOMMEND_BATCH_MAX_PANTRIES = int(os.getenv("RECOMMEND_BATCH_MAX_PANTRIES", "5000"))
+RECOMMEND_MAX_RECIPES = int(os.getenv("RECOMMEND_MAX_RECIPES", "50"))
+# Memory cap for one /recommend/batch chunk's dense (recipes x pantries) score
+# matrices; pantries per chunk shrink as the corpus grows
+RECOMMEND_BATCH_SCORE_MB = float(os.getenv("RECOMMEND_BATCH_SCORE_MB", "256"))
+
+# Per-user /recommend results (stored pantry), refreshed in the background on
+# pantry changes; entries older than the TTL are recomputed on request
+# (bounds staleness when another worker changed the pantry).
+USER_RECS_CACHE_SIZE = int(os.getenv("USER_RECS_CACHE_SIZE", "10000"))
+USER_RECS_CACHE_TTL_S = float(os.getenv("USER_RECS_CACHE_TTL_S", "900"))
+# (category, num_recipes) views remembered (and refreshed) per user, most recent first
+USER_RECS_MAX_VIEWS = int(os.getenv("USER_RECS_MAX_VIEWS", "4"))
+
+# Hot reload: generation / embedding models are reloaded in the background when
+# their files change (poll interval in seconds; 0 disables) or via POST /admin/reload.
+ARTIFACT_WATCH_S = float(os.getenv("ARTIFACT_WATCH_S", "0"))
+
+# ---------------- Category tagging ----------------
+# TF-IDF vectorizer + classifier pickled by notebook 3, loaded on first use
+CATEGORY_MODEL_DIR = os.getenv("APPETITE_CATEGORY_MODEL_DIR", RECOMMENDER_DIR)
+CATEGORY_CLASSIFIER_PATH = os.path.join(CATEGORY_MODEL_DIR, "category_classifier.pkl")
+CATEGORY_VECTORIZER_PATH = os.path.join(CATEGORY_MODEL_DIR, "category_vectorizer.pkl")
+# "model": pickled TF-IDF + classifier (notebook 3); "rules": the notebook's
+# keyword sets compiled into a trie (multi-label, microseconds per text).
+CATEGORY_TAGGER_MODE = os.getenv("CATEGORY_TAGGER_MODE", "model")
+# LRU of tagged ingredient lists (keyed by tagger mode + normalized input text)
+CATEGORY_CACHE_SIZE = int(os.getenv("CATEGORY_CACHE_SIZE", "4096"))
+# Serve the stored categories when the ingredients are exactly a known recipe's
+# (lookup table over the recommender index) instead of running the rules; only
+# built and read when CATEGORY_TAGGER_MODE is "rules", since the stored labels
+# come from the notebook rules
+CATEGORY_RECIPE_TABLE = os.getenv("CATEGORY_RECIPE_TABLE", "1") == "1"
+
 # ---------------- Database ----------------
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:////app/data/appetite.db")
 
@@ -23,6 +123,10 @@ JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "super-secret-change-me")
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", str(60 * 24)))
 
+# ---------------- Admin ----------------
+# X-Admin-Token for /admin/* endpoints; empty disables them
+ADMIN_TOKEN = os.getenv("APPETITE_ADMIN_TOKEN", "")
+
 # ---------------- CORS ----------------
 CORS_ORIGINS: List[str] = [
     "http://localhost:3000",
@@ -28,28 +28,644 @@ def get_current_user_dep(
 
 # -------- Model lazy loader for generation --------
 import os
+import threading
 import torch
 from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 from .config import MODEL_DIR, DEVICE
+from .services.artifacts import record_load
 
-_model = None
-_tokenizer = None
+_generation = None  # (model, tokenizer), swapped as one pointer on hot reload
+_generation_lock = threading.Lock()
 
 
 def get_device():
     return DEVICE
 
 
+def _load_generation_model():
+    try:
+        tokenizer = AutoTokenizer.from_pretrained(MODEL_DIR)
+        model = AutoModelForSeq2SeqLM.from_pretrained(MODEL_DIR)
+    except Exception:
+        tokenizer = AutoTokenizer.from_pretrained("google/flan-t5-base")
+        model = AutoModelForSeq2SeqLM.from_pretrained("google/flan-t5-base")
+
+    model.to(DEVICE)
+    model.eval()
+    return model, tokenizer
+
+
 def get_model_and_tokenizer():
-    global _model, _tokenizer
-    if _model is None or _tokenizer is None:
+    global _generation
+    if _generation is None:
+        with _generation_lock:
+            if _generation is None:
+                with record_load("generation_model"):
+                    _generation = _load_generation_model()
+    return _generation
+
+
+# -------- Recommender lazy loaders (thread-safe, built once) --------
+import atexit
+import json
+import logging
+import time
+import weakref
+
+import numpy as np
+
+from .config import (
+    RECOMMENDER_DIR,
+    RECOMMENDER_EMB_PATH,
+    RECOMMENDER_EMB_STORE_DIR,
+    RECOMMENDER_META_PATH,
+    RECOMMENDER_RECIPES_DIR,
+    RECOMMENDER_INFO_PATH,
+    RECOMMENDER_WORDS_DIR,
+    RECOMMENDER_CATEGORIES_DIR,
+    ANN_INDEX_DIR,
+    ANN_NPROBE,
+    ARTIFACT_MMAP_MODE,
+    INDEX_RELOAD_CHECK_S,
+    EMBED_BATCH_MAX_SIZE,
+    EMBED_BATCH_MAX_WAIT_MS,
+    SCORING_SHARDS,
+    SCORING_SHARD_WORKERS,
+    SCORING_SHARD_MIN_CORPUS,
+    CATEGORY_RECIPE_TABLE,
+    CATEGORY_TAGGER_MODE,
+    CANDIDATE_MIN_SHARED_TOKENS,
+)
+from .services.ingredient_index import (
+    IngredientMatrix,
+    IngredientMatrixBuilder,
+    InvertedIngredientIndex,
+    to_word_set,
+    VOCAB_FILE as WORDS_VOCAB_FILE,
+)
+from .services.category_index import (
+    CategoryIndex,
+    CategoryIndexBuilder,
+    RecipeCategoryTable,
+    CATEGORIES_FILE,
+)
+from .services.ranking import l2_normalize_rows
+from .services.query_embedding import pantry_key
+from .services.recipe_store import ConcatRecipeStore, RecipeStore, META_FILE as RECIPE_STORE_META
+from .services.index_manifest import (
+    SEGMENTS_DIR,
+    SEGMENT_EMBEDDINGS_FILE,
+    SEGMENT_RECIPES_DIR,
+    base_dir,
+    read_manifest,
+)
+from .services.embedding_store import ConcatEmbeddings, QuantizedEmbeddings, META_FILE as EMB_STORE_META
+from .services.ann_index import IVFIndex, META_FILE as ANN_META_FILE
+from .services.embedding_batcher import EmbeddingBatcher
+from .services.artifacts import load_pickle
+from .services.sharded_scorer import ShardedScorer
+from .services.onnx_encoder import OnnxSentenceEncoder, DEFAULT_MODEL_FILE as ONNX_DEFAULT_MODEL_FILE
+
+logger = logging.getLogger(__name__)
+
+_recommender_lock = threading.Lock()
+_recommender_data = None
+_recommender_version = None
+_recommender_base = None
+_recommender_checked_at = 0.0
+_recommender_reloading = False
+_reload_listeners = []
+# word matrix -> its inverted index; built with the matrix at load, freed with it
+_inverted_indexes = weakref.WeakKeyDictionary()
+_category_table = None
+_embed_model = None
+_query_encoder = None
+_ann_index = None
+_ann_checked = False
+_sharded_scorer = None
+_sharded_lock = threading.Lock()
+
+
+def _base_path(base, configured: str) -> str:
+    # versioned builds keep the base artifacts in the manifest's base_dir;
+    # without one they sit at the configured paths
+    return os.path.join(base, os.path.basename(configured)) if base else configured
+
+
+def _load_recipe_store(base=None) -> RecipeStore:
+    path = _base_path(base, RECOMMENDER_RECIPES_DIR)
+    if os.path.exists(os.path.join(path, RECIPE_STORE_META)):
+        return RecipeStore.load(path, mmap=True)
+    return RecipeStore.from_dataframe(
+        load_pickle(RECOMMENDER_META_PATH, "recommender_metadata", mmap_mode=ARTIFACT_MMAP_MODE)
+    )
+
+
+def _load_recipe_embeddings(base=None):
+    store_dir = _base_path(base, RECOMMENDER_EMB_STORE_DIR)
+    if os.path.exists(os.path.join(store_dir, EMB_STORE_META)):
+        return QuantizedEmbeddings.load(store_dir, mmap=True)
+    return l2_normalize_rows(np.load(_base_path(base, RECOMMENDER_EMB_PATH)))
+
+
+
+def _load_word_matrix(recipes, base_rows: int, base=None) -> IngredientMatrix:
+    words_dir = _base_path(base, RECOMMENDER_WORDS_DIR)
+    if os.path.exists(os.path.join(words_dir, WORDS_VOCAB_FILE)):
+        word_matrix = IngredientMatrix.load(words_dir)
+        if word_matrix.num_recipes == len(recipes):
+            return word_matrix
+        if word_matrix.num_recipes == base_rows:
+            # only tokenize the appended segments
+            builder = IngredientMatrixBuilder.from_matrix(word_matrix)
+            builder.add(to_word_set(t) for t in recipes.column("ingredients_text", base_rows))
+            return builder.build()
+        logger.warning("Stale ingredient index in %s, rebuilding from recipes", words_dir)
+    return IngredientMatrix.from_word_sets(to_word_set(t) for t in recipes.column("ingredients_text"))
+
+
+def _load_category_index(recipes, base_rows: int, base=None) -> CategoryIndex:
+    categories_dir = _base_path(base, RECOMMENDER_CATEGORIES_DIR)
+    if os.path.exists(os.path.join(categories_dir, CATEGORIES_FILE)):
+        category_index = CategoryIndex.load(categories_dir)
+        if category_index.num_recipes == len(recipes):
+            return category_index
+        if category_index.num_recipes == base_rows:
+            builder = CategoryIndexBuilder.from_index(category_index)
+            builder.add(recipes.column("categories", base_rows))
+            return builder.build()
+        logger.warning("Stale category index in %s, rebuilding from recipes", categories_dir)
+    return CategoryIndex.from_category_strings(recipes.column("categories"))
+
+
+def _append_segments(recipes, embeddings, manifest):
+    """Base artifacts + the manifest's appended segments, as one row space."""
+    segments = (manifest or {}).get("segments", [])
+    if not segments:
+        return recipes, embeddings
+
+    stores = [recipes]
+    extra = []
+    for seg in segments:
+        seg_dir = os.path.join(RECOMMENDER_DIR, SEGMENTS_DIR, seg["name"])
+        stores.append(RecipeStore.load(os.path.join(seg_dir, SEGMENT_RECIPES_DIR), mmap=True))
+        extra.append(np.load(os.path.join(seg_dir, SEGMENT_EMBEDDINGS_FILE), mmap_mode="r"))
+
+    # segments are small next to the base: one in-memory block (quantized
+    # like the base), scored next to the untouched mmapped base until
+    # compaction folds them back into single files
+    extra = np.concatenate(extra)
+    if isinstance(embeddings, QuantizedEmbeddings):
+        extra = QuantizedEmbeddings.quantize(extra, str(embeddings.values.dtype))
+    else:
+        extra = l2_normalize_rows(extra)
+    return ConcatRecipeStore(stores), ConcatEmbeddings([embeddings, extra])
+
+
+def _load_recommender_data():
+    """((recipes, embeddings, word_matrix, category_index), manifest version, base dir or None)."""
+    manifest = read_manifest(RECOMMENDER_DIR)
+    base = base_dir(RECOMMENDER_DIR, manifest) if manifest and manifest.get("base_dir") else None
+    recipes = _load_recipe_store(base)
+    embeddings = _load_recipe_embeddings(base)
+    if len(embeddings) != len(recipes):
+        raise RuntimeError(
+            f"Recommender artifacts out of sync: {len(embeddings)} embeddings "
+            f"for {len(recipes)} recipes"
+        )
+    base_rows = len(recipes)
+    recipes, embeddings = _append_segments(recipes, embeddings, manifest)
+    word_matrix = _load_word_matrix(recipes, base_rows, base)
+    if CANDIDATE_MIN_SHARED_TOKENS > 0:
+        with record_load("inverted_index"):
+            _inverted_indexes[word_matrix] = InvertedIngredientIndex.from_matrix(word_matrix)
+    category_index = _load_category_index(recipes, base_rows, base)
+    version = manifest.get("version") if manifest else None
+    return (recipes, embeddings, word_matrix, category_index), version, base
+
+
+def on_recommender_reload(callback):
+    """Register ``callback()`` to run after a new index version is swapped in."""
+    _reload_listeners.append(callback)
+
+
+def _reload_recommender_data(version):
+    global _recommender_data, _recommender_version, _recommender_base, _recommender_reloading, _ann_checked
+    try:
+        start = time.time()
+        data, loaded_version, base = _load_recommender_data()
+        with _recommender_lock:
+            # in-flight requests keep the tuple they already hold
+            _recommender_data = data
+            _recommender_version = loaded_version
+            _recommender_base = base
+            _ann_checked = False
+        logger.info("Recommender index version %s loaded in %.1fs (%d recipes)",
+                    loaded_version, time.time() - start, len(data[0]))
+        _swap_sharded_scorer(data[1])
+        _build_category_table(data)
+        for callback in _reload_listeners:
+            callback()
+    except Exception as e:
+        logger.warning("Recommender index reload to version %s failed, keeping %s: %s",
+                       version, _recommender_version, e)
+    finally:
+        _recommender_reloading = False
+
+
+def _check_index_version():
+    # cheap manifest poll; a version bump (new segment, compaction, full
+    # rebuild) reloads in the background while requests use the old data
+    global _recommender_checked_at, _recommender_reloading
+    now = time.monotonic()
+    if INDEX_RELOAD_CHECK_S <= 0 or now - _recommender_checked_at < INDEX_RELOAD_CHECK_S:
+        return
+    _recommender_checked_at = now
+    try:
+        manifest = read_manifest(RECOMMENDER_DIR)
+    except (OSError, ValueError):
+        return
+    version = manifest.get("version") if manifest else None
+    with _recommender_lock:
+        if version == _recommender_version or _recommender_reloading:
+            return
+        _recommender_reloading = True
+    threading.Thread(target=_reload_recommender_data, args=(version,),
+                     name="recommender-reload", daemon=True).start()
+
+
+def get_recommender_data():
+    """
+    (recipes, recipe_embeddings, word_matrix, category_index), built once
+    and swapped in the background when the index manifest version changes.
+
+    recipe_embeddings are L2-normalized (float32 array or mmapped quantized
+    store); word_matrix and category_index come from the build_index side
+    indexes, or are derived from the recipe columns at load, so requests
+    only do vectorized lookups. Appended index segments follow the base
+    rows in manifest order.
+    """
+    global _recommender_data, _recommender_version, _recommender_base, _recommender_checked_at
+    if _recommender_data is None:
+        loaded = None
+        with _recommender_lock:
+            if _recommender_data is None:
+                with record_load("recommender_index"):
+                    _recommender_data, _recommender_version, _recommender_base = _load_recommender_data()
+                _recommender_checked_at = time.monotonic()
+                loaded = _recommender_data
+        if loaded is not None:
+            _swap_sharded_scorer(loaded[1])
+            _build_category_table(loaded)
+        return _recommender_data
+    _check_index_version()
+    return _recommender_data
+
+
+def get_inverted_index(word_matrix):
+    """
+    Token -> delta-encoded posting lists of ``word_matrix`` (the one from the
+    caller's recommender data), built when that index version was loaded;
+    None if pre-selection was disabled at load.
+    """
+    return _inverted_indexes.get(word_matrix)
+
+
+def _build_category_table(data):
+    """
+    Build the recipe category table for freshly loaded data in a background
+    thread. Skipped unless the default tagger mode is "rules", the only mode
+    that reads it (the stored labels are the notebook rules' output).
+    """
+    if not CATEGORY_RECIPE_TABLE or CATEGORY_TAGGER_MODE != "rules":
+        return
+    recipes, _, _, category_index = data
+
+    def build():
+        global _category_table
         try:
-            _tokenizer = AutoTokenizer.from_pretrained(MODEL_DIR)
-            _model = AutoModelForSeq2SeqLM.from_pretrained(MODEL_DIR)
-        except Exception:
-            _tokenizer = AutoTokenizer.from_pretrained("google/flan-t5-base")
-            _model = AutoModelForSeq2SeqLM.from_pretrained("google/flan-t5-base")
-
-        _model.to(DEVICE)
-        _model.eval()
-    return _model, _tokenizer
\ No newline at end of file
+            with record_load("recipe_category_table"):
+                table = RecipeCategoryTable.build(recipes, category_index, pantry_key)
+        except Exception as e:
+            logger.warning("Recipe category table build failed: %s", e)
+            return
+        with _recommender_lock:
+            # a newer index may have been swapped in meanwhile
+            if _recommender_data is not None and _recommender_data[0] is recipes:
+                _category_table = table
+
+    threading.Thread(target=build, name="recipe-category-table", daemon=True).start()
+
+
+def get_recipe_category_table():
+    """
+    Ingredient set -> stored categories of known recipes for the loaded index,
+    or None while it is being built (it is built off the request path on
+    every index load / reload).
+    """
+    recipes = get_recommender_data()[0]
+    table = _category_table
+    return table if table is not None and table.recipes is recipes else None
+
+
+def _load_embed_model(info: dict):
+    # "embedding_backend": "onnx" in recommender_model_info.json selects the
+    # ONNX Runtime encoder (fp32 or int8); anything else uses sentence-transformers.
+    if info.get("embedding_backend") == "onnx":
+        try:
+            return OnnxSentenceEncoder(
+                os.path.join(RECOMMENDER_DIR, info.get("onnx_model_dir", "recommender_encoder_onnx")),
+                model_file=info.get("onnx_model_file", ONNX_DEFAULT_MODEL_FILE),
+            )
+        except Exception as e:
+            logger.warning("ONNX encoder unavailable, falling back to sentence-transformers: %s", e)
+
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(info["embedding_model"], device=DEVICE)
+
+
+def get_embed_model():
+    global _embed_model
+    if _embed_model is None:
+        with _recommender_lock:
+            if _embed_model is None:
+                with open(RECOMMENDER_INFO_PATH, "r") as f:
+                    info = json.load(f)
+                with record_load("embedding_model"):
+                    _embed_model = _load_embed_model(info)
+    return _embed_model
+
+
+def get_query_encoder():
+    """
+    Encoder for request-time pantry queries: the embedding model behind the
+    micro-batcher, or the bare model when batching is disabled.
+    """
+    global _query_encoder
+    if _query_encoder is None:
+        model = get_embed_model()
+        with _recommender_lock:
+            if _query_encoder is None:
+                if EMBED_BATCH_MAX_SIZE > 1 and EMBED_BATCH_MAX_WAIT_MS > 0:
+                    _query_encoder = EmbeddingBatcher(
+                        model, EMBED_BATCH_MAX_SIZE, EMBED_BATCH_MAX_WAIT_MS
+                    )
+                else:
+                    _query_encoder = model
+    return _query_encoder
+
+
+def get_ann_index():
+    """IVF index over the recipe embeddings, or None if it has not been built."""
+    global _ann_index, _ann_checked
+    if not _ann_checked:
+        with _recommender_lock:
+            if not _ann_checked:
+                ann_dir = _base_path(_recommender_base, ANN_INDEX_DIR)
+                _ann_index = None
+                if os.path.exists(os.path.join(ann_dir, ANN_META_FILE)):
+                    _ann_index = IVFIndex.load(ann_dir, nprobe=ANN_NPROBE, mmap=True)
+                _ann_checked = True
+    return _ann_index
+
+
+def _swap_sharded_scorer(embeddings):
+    """
+    Build the sharded scorer for freshly loaded embeddings and swap it in;
+    runs in the load / reload path, never on a request. The replaced scorer
+    closes once the searches still using it finish.
+    """
+    global _sharded_scorer
+    with _sharded_lock:
+        scorer = None
+        if SCORING_SHARDS > 1 and len(embeddings) > SCORING_SHARD_MIN_CORPUS:
+            try:
+                with record_load("sharded_scorer"):
+                    scorer = ShardedScorer(embeddings, SCORING_SHARDS, workers=SCORING_SHARD_WORKERS or None)
+                logger.info("Sharded scorer: %d shards over %d recipes (%.0f MiB shared)",
+                            scorer.num_shards, scorer.num_vectors, scorer.nbytes / 2**20)
+            except Exception as e:
+                logger.warning("Sharded scorer unavailable, scoring in-process: %s", e)
+        old, _sharded_scorer = _sharded_scorer, scorer
+    if old is not None:
+        old.retire()
+
+
+def get_sharded_scorer():
+    """
+    Process-pool scorer over the loaded recipe embeddings (SCORING_SHARDS > 1
+    and a corpus above SCORING_SHARD_MIN_CORPUS), else None.
+    """
+    return _sharded_scorer
+
+
+@atexit.register
+def _close_sharded_scorer():
+    # unlink the shared-memory segments and stop the pool with the process
+    if _sharded_scorer is not None:
+        _sharded_scorer.close()
+
+
+def get_index_version():
+    """Manifest version of the loaded recommender index (None before load / without manifest)."""
+    return _recommender_version
+
+
+# -------- Hot reload of model / index artifacts --------
+import gc
+import hmac
+
+from fastapi import Header, HTTPException
+
+from .config import ADMIN_TOKEN, ARTIFACT_WATCH_S
+from .metrics import ARTIFACT_RELOAD_COUNT, ARTIFACT_RELOAD_SECONDS, ARTIFACT_RELOAD_RSS
+from .services.query_embedding import query_embedding_cache
+
+RELOAD_TARGETS = ("generation", "embedding", "index")
+
+_reload_lock = threading.Lock()
+_last_reload = None
+
+
+def _rss_bytes():
+    """Resident set size of this process (Linux /proc), or None elsewhere."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _warm_generation(model, tokenizer):
+    with torch.no_grad():
+        inputs = tokenizer("Ingredients: salt, water", return_tensors="pt").to(DEVICE)
+        model.generate(**inputs, max_new_tokens=4)
+
+
+def _embedding_dim(embeddings) -> int:
+    return int(embeddings.shape[1])
+
+
+def reload_in_progress() -> bool:
+    return _reload_lock.locked()
+
+
+def last_reload_report():
+    return _last_reload
+
+
+def reload_artifacts(targets=RELOAD_TARGETS) -> dict:
+    """
+    Load fresh copies of ``targets`` next to the live ones, warm them, then
+    swap the registry pointers together. Requests that already hold the old
+    model / data finish on it; the old copies are freed once they do.
+
+    Nothing is swapped if any target fails to load or the new embedding
+    model does not match the index dimension. Raises RuntimeError when a
+    reload is already running.
+    """
+    global _generation, _embed_model, _query_encoder, _ann_checked
+    global _recommender_data, _recommender_version, _recommender_base, _recommender_checked_at, _last_reload
+
+    unknown = set(targets) - set(RELOAD_TARGETS)
+    if unknown:
+        raise ValueError(f"Unknown reload targets: {sorted(unknown)}")
+    if not _reload_lock.acquire(blocking=False):
+        raise RuntimeError("A reload is already in progress")
+
+    report = {"targets": list(targets), "seconds": {}, "status": "ok"}
+    try:
+        rss_before = _rss_bytes()
+        loaded = {}
+        try:
+            for target in targets:
+                start = time.time()
+                if target == "generation":
+                    model, tokenizer = _load_generation_model()
+                    _warm_generation(model, tokenizer)
+                    loaded[target] = (model, tokenizer)
+                elif target == "embedding":
+                    with open(RECOMMENDER_INFO_PATH, "r") as f:
+                        info = json.load(f)
+                    model = _load_embed_model(info)
+                    dim = np.asarray(model.encode(["Ingredients: salt, water"])).shape[-1]
+                    loaded[target] = (model, dim)
+                else:
+                    loaded[target] = _load_recommender_data()
+                report["seconds"][target] = round(time.time() - start, 3)
+                ARTIFACT_RELOAD_SECONDS.labels(artifact=target).observe(time.time() - start)
+
+            if "embedding" in loaded:
+                data = loaded["index"][0] if "index" in loaded else _recommender_data
+                if data is not None and loaded["embedding"][1] != _embedding_dim(data[1]):
+                    raise ValueError(
+                        f"Embedding model dim {loaded['embedding'][1]} does not match the "
+                        f"index dim {_embedding_dim(data[1])}; reload 'index' together with it"
+                    )
+        except Exception as e:
+            for target in targets:
+                ARTIFACT_RELOAD_COUNT.labels(artifact=target, result="error").inc()
+            report.update(status="error", error=str(e))
+            logger.warning("Artifact reload of %s failed, keeping the live versions: %s", targets, e)
+            return report
+
+        rss_peak = _rss_bytes()
+
+        # ---- swap: plain pointer assignments under the loader locks ----
+        old_encoder = None
+        if "generation" in loaded:
+            with _generation_lock:
+                _generation = loaded["generation"]
+        with _recommender_lock:
+            if "embedding" in loaded:
+                _embed_model = loaded["embedding"][0]
+                old_encoder, _query_encoder = _query_encoder, None
+            if "index" in loaded:
+                _recommender_data, _recommender_version, _recommender_base = loaded["index"]
+                _recommender_checked_at = time.monotonic()
+                _ann_checked = False
+
+        if "embedding" in loaded:
+            # cached query vectors came from the old model
+            query_embedding_cache.clear()
+            if isinstance(old_encoder, EmbeddingBatcher):
+                # no join: requests still holding it finish their queued texts
+                # and encode any later ones inline
+                old_encoder.close(wait=False)
+        if "index" in loaded:
+            _swap_sharded_scorer(_recommender_data[1])
+            _build_category_table(_recommender_data)
+        if "embedding" in loaded or "index" in loaded:
+            for callback in _reload_listeners:
+                callback()
+        for target in targets:
+            ARTIFACT_RELOAD_COUNT.labels(artifact=target, result="ok").inc()
+
+        del loaded, old_encoder
+        gc.collect()
+        rss_after = _rss_bytes()
+
+        report["rss_mb"] = {}
+        for stage, value in (("before", rss_before), ("peak", rss_peak), ("after", rss_after)):
+            report["rss_mb"][stage] = None if value is None else round(value / 2 ** 20, 1)
+            if value is not None:
+                ARTIFACT_RELOAD_RSS.labels(stage=stage).set(value)
+        report["index_version"] = _recommender_version
+        logger.info("Reloaded %s: %s", targets, report)
+        return report
+    finally:
+        report["finished_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        _last_reload = report
+        _reload_lock.release()
+
+
+def _artifact_mtimes() -> dict:
+    # generation: newest file directly in MODEL_DIR (adapter / config / weights);
+    # embedding: recommender_model_info.json (rewritten by the export tools).
+    # The index has its own manifest poll.
+    def newest(paths):
+        times = [os.path.getmtime(p) for p in paths if os.path.isfile(p)]
+        return max(times) if times else None
+
+    model_files = []
+    if os.path.isdir(MODEL_DIR):
+        model_files = [os.path.join(MODEL_DIR, f) for f in os.listdir(MODEL_DIR)]
+    return {"generation": newest(model_files), "embedding": newest([RECOMMENDER_INFO_PATH])}
+
+
+def _watch_artifacts(interval: float):
+    seen = _artifact_mtimes()
+    pending = {}
+    while True:
+        time.sleep(interval)
+        try:
+            current = _artifact_mtimes()
+        except OSError:
+            continue
+        changed = [t for t in current if current[t] != seen.get(t)]
+        # reload once a change has been stable for a full interval (copy finished)
+        ready = [t for t in changed if pending.get(t) == current[t]]
+        pending = {t: current[t] for t in changed}
+        if ready and not reload_in_progress():
+            report = reload_artifacts(tuple(ready))
+            if report["status"] == "ok":
+                seen.update({t: current[t] for t in ready})
+
+
+def start_artifact_watch():
+    """Reload generation / embedding models when their files change (ARTIFACT_WATCH_S > 0)."""
+    if ARTIFACT_WATCH_S <= 0:
+        return None
+    thread = threading.Thread(target=_watch_artifacts, args=(ARTIFACT_WATCH_S,),
+                              name="artifact-watch", daemon=True)
+    thread.start()
+    return thread
+
+
+def require_admin_dep(x_admin_token: str = Header(default="")):
+    """Admin endpoints need ADMIN_TOKEN in X-Admin-Token; they are off when it is unset."""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled")
+    if not hmac.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
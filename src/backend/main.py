@@ -6,7 +6,7 @@ import json
 import time
 from typing import List
 
-from fastapi import FastAPI, Depends, HTTPException, status, Response, Request
+from fastapi import FastAPI, Depends, HTTPException, status, Response, Request, BackgroundTasks
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.responses import PlainTextResponse
 from sqlalchemy.orm import Session
@@ -15,12 +15,15 @@ from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 from . import models, schemas
 from .database import engine, Base
 from .auth import get_password_hash, authenticate_user, create_access_token
-from .deps import get_current_user_dep, get_db_dep
+from .deps import get_current_user_dep, get_db_dep, require_admin_dep
+from . import deps
 
 from .services import pantry as pantry_service
 from .services import recipes as recipes_service
 from .services import shopping as shopping_service
+from .services import user_recommendations
 
+from .config import RECOMMEND_BATCH_MAX_PANTRIES
 from .metrics import REQUEST_COUNT, REQUEST_LATENCY, IN_PROGRESS, USAGE_COUNT, FEEDBACK_COUNT
 
 Base.metadata.create_all(bind=engine)
@@ -140,21 +143,52 @@ def recommend(
     if req.ingredients:
         ing = req.ingredients
 
-    # Otherwise use pantry ingredients
+    # Otherwise use pantry ingredients (precomputed on pantry changes when possible)
     else:
+        cached = user_recommendations.get(current_user.id, req.category, req.num_recipes)
+        if cached is not None:
+            return cached
+        version = user_recommendations.pantry_version(current_user.id)
         pantry_items = pantry_service.list_pantry_items(db, current_user.id)
         ing = [item.name for item in pantry_items]
 
-    # Generate ONE recommended recipe
+    # Retrieve num_recipes real recipes; generate ONE only as a fallback
     results = recipes_service.recommend_recipes(
         ingredients=ing,
         category=req.category,
-        num_recipes=1,
+        num_recipes=req.num_recipes,
     )
 
+    if not req.ingredients:
+        user_recommendations.put(current_user.id, req.category, req.num_recipes, results, version)
     return results
 
 
+@app.post("/recommend/batch", response_model=schemas.BatchRecommendationResponse)
+def recommend_batch(
+    req: schemas.BatchRecommendationRequest,
+    current_user: models.User = Depends(get_current_user_dep),
+):
+    """
+    Retrieval-only recommendations for many pantries in one call (one batched
+    encode + one scoring pass). Pantries without a confident match get [].
+    """
+    USAGE_COUNT.labels(feature="recommend_batch").inc()
+
+    if len(req.pantries) > RECOMMEND_BATCH_MAX_PANTRIES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {RECOMMEND_BATCH_MAX_PANTRIES} pantries per request",
+        )
+
+    results = recipes_service.retrieve_recipes_many(
+        pantries=req.pantries,
+        category=req.category,
+        num_recipes=req.num_recipes,
+    )
+    return {"results": results}
+
+
 # ---------- Quick Generate ----------
 @app.post("/quick-generate", response_model=schemas.QuickGenerateResponse)
 def quick_generate(
@@ -289,6 +323,41 @@ def add_feedback(
     return {"status": "ok"}
 
 
+# ---------- Admin: hot reload ----------
+@app.on_event("startup")
+def start_artifact_watch():
+    deps.start_artifact_watch()
+
+
+@app.post("/admin/reload", status_code=202)
+def admin_reload(
+    req: schemas.ReloadRequest,
+    background_tasks: BackgroundTasks,
+    _: None = Depends(require_admin_dep),
+):
+    """
+    Load new model / index artifacts in the background, warm them and swap
+    them in; poll GET /admin/reload for the report (timings, RSS).
+    """
+    unknown = set(req.targets) - set(deps.RELOAD_TARGETS)
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown targets: {sorted(unknown)}")
+    if deps.reload_in_progress():
+        raise HTTPException(status_code=409, detail="A reload is already in progress")
+
+    background_tasks.add_task(deps.reload_artifacts, tuple(req.targets))
+    return {"status": "started", "targets": req.targets}
+
+
+@app.get("/admin/reload")
+def admin_reload_status(_: None = Depends(require_admin_dep)):
+    return {
+        "in_progress": deps.reload_in_progress(),
+        "last": deps.last_reload_report(),
+        "index_version": deps.get_index_version(),
+    }
+
+
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
\ No newline at end of file
@@ -40,4 +40,111 @@ FEEDBACK_COUNT = Counter(
     "appetite_feedback_total",
     "User feedback count by page and rating",
     ["page", "rating"],
-)
\ No newline at end of file
+)
+
+# -----------------------------------
+# Recommendation metrics
+# -----------------------------------
+RECOMMEND_PATH_COUNT = Counter(
+    "appetite_recommend_path_total",
+    "Recommendations served by path (retrieval or generation fallback)",
+    ["path"],
+)
+
+RECOMMEND_PATH_LATENCY = Histogram(
+    "appetite_recommend_path_latency_seconds",
+    "Latency of producing recommendations, by path",
+    ["path"],
+)
+
+# -----------------------------------
+# Cache metrics (services/caching.LRUCache)
+# -----------------------------------
+CACHE_REQUESTS = Counter(
+    "appetite_cache_requests_total",
+    "Cache lookups by cache name and result (hit/miss/expired)",
+    ["cache", "result"],
+)
+
+CACHE_HIT_RATIO = Gauge(
+    "appetite_cache_hit_ratio",
+    "Lifetime hit ratio of each in-process cache",
+    ["cache"],
+)
+
+CACHE_SIZE = Gauge(
+    "appetite_cache_entries",
+    "Number of entries currently held by each in-process cache",
+    ["cache"],
+)
+
+# -----------------------------------
+# Query-embedding micro-batcher
+# -----------------------------------
+EMBED_BATCH_SIZE = Histogram(
+    "appetite_embed_batch_size",
+    "Number of query texts encoded per micro-batch",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+
+EMBED_BATCH_WAIT = Histogram(
+    "appetite_embed_batch_wait_seconds",
+    "Time a query text waited in the micro-batcher before encoding started",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+
+# -----------------------------------
+# Per-user recommendation precompute
+# -----------------------------------
+USER_RECS_REFRESH_COUNT = Counter(
+    "appetite_user_recs_refresh_total",
+    "Background per-user recommendation refreshes by outcome",
+    ["result"],  # stored / empty / superseded / error
+)
+
+USER_RECS_REFRESH_LATENCY = Histogram(
+    "appetite_user_recs_refresh_seconds",
+    "Time from a pantry change to its refreshed recommendations being cached",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+# -----------------------------------
+# Hot reload of model / index artifacts
+# -----------------------------------
+ARTIFACT_RELOAD_COUNT = Counter(
+    "appetite_artifact_reload_total",
+    "Hot reloads by artifact (generation / embedding / index) and result",
+    ["artifact", "result"],
+)
+
+ARTIFACT_RELOAD_SECONDS = Histogram(
+    "appetite_artifact_reload_seconds",
+    "Time to load and warm a new artifact version before the swap",
+    ["artifact"],
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+
+ARTIFACT_RELOAD_RSS = Gauge(
+    "appetite_artifact_reload_rss_bytes",
+    "Process RSS during the last reload (before load, peak with both versions, after swap)",
+    ["stage"],
+)
+
+# -----------------------------------
+# Artifact loading (first use)
+# -----------------------------------
+ARTIFACT_LOAD_SECONDS = Histogram(
+    "appetite_artifact_load_seconds",
+    "Time to load a model / index artifact on first use (or reload)",
+    ["artifact"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+
+# -----------------------------------
+# Category tagging
+# -----------------------------------
+CATEGORY_TAG_COUNT = Counter(
+    "appetite_category_tags_total",
+    "Tagged ingredient lists by where the labels came from",
+    ["source"],  # cache / recipe_table / model / rules
+)
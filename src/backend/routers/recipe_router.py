@@ -8,7 +8,8 @@ from app.db.database import get_db
 
 from app.models import RecipeGenerateRequest, RecipeResponse
 from app.services.recipe_service import generate_recipe_from_ingredients
-from app.services.category_service import tag_categories
+from app.services.category_service import tag_categories_batch
+from app.services.category_index import parse_categories
 from app.services.recommender_service import recommend_recipes as recommend_engine
 
 router = APIRouter(prefix="/recipes", tags=["recipes"])
@@ -38,7 +39,7 @@ def generate_recipe(
 
     # Ensure correct input format for classifier
     ing_list = ensure_list(payload.ingredients)
-    categories = tag_categories(ing_list)
+    categories = tag_categories_batch([ing_list])[0]
 
     return RecipeResponse(
         title=title,
@@ -56,7 +57,7 @@ def get_categories(
     user=Depends(get_current_user),
 ):
     ing_list = ensure_list(payload.ingredients)
-    categories = tag_categories(ing_list)
+    categories = tag_categories_batch([ing_list])[0]
     return categories
 
 
@@ -76,7 +77,7 @@ def recommend(
     # If NO recommendations — fallback to model generation
     if not recs:
         title, instructions = generate_recipe_from_ingredients(payload.ingredients)
-        cats = tag_categories(ing_list)
+        cats = tag_categories_batch([ing_list])[0]
         return [
             RecipeResponse(
                 title=title,
@@ -85,13 +86,17 @@ def recommend(
             )
         ]
 
+    # Stored "a|b" labels; recipes without any are classified in one batch
+    cats_per_rec = [parse_categories(r["categories"]) for r in recs]
+    untagged = [i for i, cats in enumerate(cats_per_rec) if not cats]
+    if untagged:
+        tagged = tag_categories_batch([recs[i]["ingredients_text"] for i in untagged])
+        for i, cats in zip(untagged, tagged):
+            cats_per_rec[i] = cats
+
     # Build responses
     out = []
-    for r in recs:
-        cats = r["categories"]
-        if isinstance(cats, str):
-            cats = [cats]
-
+    for r, cats in zip(recs, cats_per_rec):
         out.append(
             RecipeResponse(
                 title=r["title"],
@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 from typing import Optional, List
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime, date
 
+from .config import RECOMMEND_MAX_RECIPES
+
 
 # ---------------- User ----------------
 class UserCreate(BaseModel):
@@ -51,7 +53,22 @@ class Recipe(BaseModel):
 class RecommendationRequest(BaseModel):
     ingredients: Optional[List[str]] = None
     category: Optional[str] = None
-    num_recipes: int = 5
+    num_recipes: int = Field(5, ge=1, le=RECOMMEND_MAX_RECIPES)
+
+
+class BatchRecommendationRequest(BaseModel):
+    pantries: List[List[str]]
+    category: Optional[str] = None
+    num_recipes: int = Field(5, ge=1, le=RECOMMEND_MAX_RECIPES)
+
+
+class BatchRecommendationResponse(BaseModel):
+    results: List[List[Recipe]]
+
+
+class ReloadRequest(BaseModel):
+    # any of "generation", "embedding", "index"
+    targets: List[str] = ["generation", "embedding", "index"]
 
 
 class QuickGenerateRequest(BaseModel):
@@ -0,0 +1,193 @@
+# src/backend/services/ann_index.py
+import json
+import os
+from typing import Optional
+
+import numpy as np
+from scipy import sparse
+
+from .ranking import l2_normalize, l2_normalize_rows, top_k_indices
+
+CENTROIDS_FILE = "centroids.npy"
+OFFSETS_FILE = "offsets.npy"
+IDS_FILE = "ids.npy"
+VECTORS_FILE = "vectors.npy"
+META_FILE = "meta.json"
+
+
+def _assign(x: np.ndarray, centroids: np.ndarray, batch_size: int = 65536) -> np.ndarray:
+    """Nearest centroid (max inner product) for every row of ``x``."""
+    out = np.empty(len(x), dtype=np.int32)
+    for start in range(0, len(x), batch_size):
+        out[start:start + batch_size] = np.argmax(x[start:start + batch_size] @ centroids.T, axis=1)
+    return out
+
+
+def _spherical_kmeans(x: np.ndarray, nlist: int, iters: int, seed: int,
+                      sample_size: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    train = x
+    if len(x) > sample_size:
+        train = x[np.sort(rng.choice(len(x), sample_size, replace=False))]
+
+    centroids = np.array(train[rng.choice(len(train), nlist, replace=False)], dtype=np.float32)
+    for _ in range(iters):
+        assign = _assign(train, centroids)
+        # cluster sums as one sparse (nlist x n) @ (n x d) product
+        onehot = sparse.csr_matrix(
+            (np.ones(len(train), dtype=np.float32), (assign, np.arange(len(train)))),
+            shape=(nlist, len(train)),
+        )
+        sums = np.asarray(onehot @ train, dtype=np.float32)
+        empty = np.flatnonzero(np.bincount(assign, minlength=nlist) == 0)
+        if empty.size:
+            sums[empty] = train[rng.choice(len(train), empty.size, replace=False)]
+        centroids = l2_normalize_rows(sums)
+    return centroids
+
+
+class IVFIndex:
+    """
+    Inverted-file (IVF-Flat) index over L2-normalized recipe embeddings.
+
+    Vectors are clustered offline with spherical k-means and stored grouped by
+    cluster, so a query scores only the ``nprobe`` closest clusters. ``nprobe``
+    is the recall/latency knob: nprobe == nlist is an exact search.
+    All arrays are plain .npy files and are memory-mapped on load.
+    """
+
+    def __init__(self, centroids: np.ndarray, offsets: np.ndarray, ids: np.ndarray,
+                 vectors: np.ndarray, nprobe: int = 8):
+        self.centroids = centroids
+        self.offsets = offsets
+        self.ids = ids
+        self.vectors = vectors
+        self.nprobe = nprobe
+
+    @property
+    def nlist(self) -> int:
+        return self.centroids.shape[0]
+
+    @property
+    def num_vectors(self) -> int:
+        return self.ids.shape[0]
+
+    @classmethod
+    def build(cls, embeddings: np.ndarray, nlist: Optional[int] = None, iters: int = 20,
+              seed: int = 0, sample_size: int = 200_000) -> "IVFIndex":
+        x = l2_normalize_rows(embeddings)
+        if nlist is None:
+            nlist = max(1, int(4 * np.sqrt(len(x))))
+        nlist = min(nlist, len(x))
+
+        centroids = _spherical_kmeans(x, nlist, iters, seed, sample_size)
+        assign = _assign(x, centroids)
+
+        order = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign, minlength=nlist)
+        offsets = np.zeros(nlist + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        return cls(centroids, offsets, order.astype(np.int64), np.ascontiguousarray(x[order]))
+
+    @classmethod
+    def build_to(cls, path: str, embeddings: np.ndarray, nlist: Optional[int] = None, iters: int = 20,
+                 seed: int = 0, sample_size: int = 200_000, chunk_rows: int = 65536) -> "IVFIndex":
+        """
+        ``build`` + ``save`` for corpora that do not fit in memory (e.g. a
+        memmapped matrix): k-means is trained on a sample, rows are assigned
+        and written to ``path`` chunk by chunk. Returns the index memory-mapped
+        from ``path``.
+        """
+        n = len(embeddings)
+        if nlist is None:
+            nlist = max(1, int(4 * np.sqrt(n)))
+        rng = np.random.default_rng(seed)
+        rows = np.sort(rng.choice(n, sample_size, replace=False)) if n > sample_size else np.arange(n)
+        train = l2_normalize_rows(embeddings[rows])
+        centroids = _spherical_kmeans(train, min(nlist, len(train)), iters, seed, sample_size)
+        del train
+
+        assign = np.empty(n, dtype=np.int32)
+        for start in range(0, n, chunk_rows):
+            assign[start:start + chunk_rows] = _assign(
+                l2_normalize_rows(embeddings[start:start + chunk_rows]), centroids)
+        order = np.argsort(assign, kind="stable").astype(np.int64)
+        counts = np.bincount(assign, minlength=len(centroids))
+        offsets = np.zeros(len(centroids) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        del assign
+
+        os.makedirs(path, exist_ok=True)
+        vectors = np.lib.format.open_memmap(os.path.join(path, VECTORS_FILE), mode="w+",
+                                            dtype=np.float32, shape=(n, centroids.shape[1]))
+        for start in range(0, n, chunk_rows):
+            vectors[start:start + chunk_rows] = l2_normalize_rows(embeddings[order[start:start + chunk_rows]])
+        vectors.flush()
+        del vectors
+        cls(centroids, offsets, order, None)._save_lists(path)
+        return cls.load(path)
+
+    def save(self, path: str):
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, VECTORS_FILE), self.vectors)
+        self._save_lists(path)
+
+    def _save_lists(self, path: str):
+        # everything but the vectors
+        np.save(os.path.join(path, CENTROIDS_FILE), self.centroids)
+        np.save(os.path.join(path, OFFSETS_FILE), self.offsets)
+        np.save(os.path.join(path, IDS_FILE), self.ids)
+        with open(os.path.join(path, META_FILE), "w") as f:
+            json.dump({
+                "type": "ivf_flat",
+                "metric": "cosine",
+                "nlist": self.nlist,
+                "dim": int(self.centroids.shape[1]),
+                "num_vectors": self.num_vectors,
+            }, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str, nprobe: int = 8, mmap: bool = True) -> "IVFIndex":
+        mode = "r" if mmap else None
+        return cls(
+            centroids=np.load(os.path.join(path, CENTROIDS_FILE)),
+            offsets=np.load(os.path.join(path, OFFSETS_FILE)),
+            ids=np.load(os.path.join(path, IDS_FILE), mmap_mode=mode),
+            vectors=np.load(os.path.join(path, VECTORS_FILE), mmap_mode=mode),
+            nprobe=nprobe,
+        )
+
+    def search(self, query, k: int, nprobe: Optional[int] = None,
+               allowed: Optional[np.ndarray] = None):
+        """
+        Approximate top-k recipe ids and cosine scores for one query vector.
+
+        ``allowed`` is an optional boolean mask over recipe ids (e.g. a
+        category filter); filtered-out recipes are dropped before ranking.
+        """
+        q = l2_normalize(query)
+        nprobe = min(nprobe or self.nprobe, self.nlist)
+
+        probe, _ = top_k_indices(self.centroids @ q, nprobe)
+
+        ids_parts, score_parts = [], []
+        for lst in probe:
+            start, end = self.offsets[lst], self.offsets[lst + 1]
+            if start == end:
+                continue
+            ids = np.asarray(self.ids[start:end])
+            scores = self.vectors[start:end] @ q
+            if allowed is not None:
+                keep = allowed[ids]
+                ids, scores = ids[keep], scores[keep]
+            ids_parts.append(ids)
+            score_parts.append(scores)
+
+        if not ids_parts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        ids = np.concatenate(ids_parts)
+        scores = np.concatenate(score_parts)
+        top, top_scores = top_k_indices(scores, k)
+        return ids[top], top_scores
@@ -0,0 +1,33 @@
+# src/backend/services/artifacts.py
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+from ..metrics import ARTIFACT_LOAD_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def record_load(artifact: str):
+    """Time the enclosed load into appetite_artifact_load_seconds{artifact}."""
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    ARTIFACT_LOAD_SECONDS.labels(artifact=artifact).observe(elapsed)
+    logger.info("Loaded %s in %.2fs", artifact, elapsed)
+
+
+def load_pickle(path: str, artifact: str, mmap_mode=None):
+    """
+    ``joblib.load`` a config-resolved artifact, timed. With ``mmap_mode``
+    (e.g. "r") large numpy arrays inside the pickle are memory-mapped
+    instead of read into each process.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{artifact} artifact not found: {path}")
+    import joblib
+
+    with record_load(artifact):
+        return joblib.load(path, mmap_mode=mmap_mode)
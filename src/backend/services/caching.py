@@ -0,0 +1,78 @@
+# src/backend/services/caching.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from ..metrics import CACHE_REQUESTS, CACHE_HIT_RATIO, CACHE_SIZE
+
+
+class LRUCache:
+    """
+    Small thread-safe LRU map with Prometheus hit/miss accounting.
+
+    ``name`` becomes the ``cache`` label on appetite_cache_* metrics. With
+    ``ttl`` (seconds), entries older than that are dropped on lookup and
+    counted as result="expired".
+    """
+
+    def __init__(self, name: str, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._stored_at: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                result = "miss"
+            elif self.ttl is not None and time.monotonic() - self._stored_at[key] > self.ttl:
+                del self._data[key]
+                del self._stored_at[key]
+                value = None
+                self.misses += 1
+                result = "expired"
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+                result = "hit"
+            ratio = self.hits / float(self.hits + self.misses)
+
+        CACHE_REQUESTS.labels(cache=self.name, result=result).inc()
+        CACHE_HIT_RATIO.labels(cache=self.name).set(ratio)
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._stored_at[key] = time.monotonic()
+            while len(self._data) > self.maxsize:
+                evicted, _ = self._data.popitem(last=False)
+                del self._stored_at[evicted]
+            size = len(self._data)
+        CACHE_SIZE.labels(cache=self.name).set(size)
+
+    def pop(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+            self._stored_at.pop(key, None)
+            size = len(self._data)
+        CACHE_SIZE.labels(cache=self.name).set(size)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._stored_at.clear()
+        CACHE_SIZE.labels(cache=self.name).set(0)
+
+    def __len__(self) -> int:
+        return len(self._data)
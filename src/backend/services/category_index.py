@@ -0,0 +1,195 @@
+# src/backend/services/category_index.py
+import hashlib
+import json
+import os
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+CategoryQuery = Optional[Union[str, Sequence[str]]]
+
+BITS_FILE = "bits.npy"
+CATEGORIES_FILE = "categories.json"
+
+
+def parse_categories(cat_str) -> List[str]:
+    if not isinstance(cat_str, str) or not cat_str.strip():
+        return []
+    return [c.strip() for c in cat_str.split("|") if c.strip()]
+
+
+class CategoryIndex:
+    """
+    Recipe x category membership, precomputed once at load.
+
+    One bit per category (column order = ``categories``), packed row-wise with
+    ``np.packbits`` so filtering any AND/OR combination of categories is a
+    couple of vectorized byte operations over the whole corpus.
+    """
+
+    def __init__(self, categories: List[str], bits: np.ndarray):
+        self.categories = categories
+        self.bits = bits
+        self._column = {c.lower(): i for i, c in enumerate(categories)}
+
+    @classmethod
+    def from_category_strings(cls, cat_strings: Iterable[str]) -> "CategoryIndex":
+        """Build from the ``|``-separated ``categories`` column."""
+        builder = CategoryIndexBuilder()
+        builder.add(cat_strings)
+        return builder.build()
+
+    def save(self, path: str):
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, BITS_FILE), self.bits)
+        with open(os.path.join(path, CATEGORIES_FILE), "w") as f:
+            json.dump(self.categories, f)
+
+    @classmethod
+    def load(cls, path: str) -> "CategoryIndex":
+        with open(os.path.join(path, CATEGORIES_FILE)) as f:
+            categories = json.load(f)
+        return cls(categories, np.load(os.path.join(path, BITS_FILE)))
+
+    @property
+    def num_recipes(self) -> int:
+        return self.bits.shape[0]
+
+    def _query_bits(self, categories: List[str]) -> Optional[np.ndarray]:
+        wanted = np.zeros(len(self.categories), dtype=bool)
+        for c in categories:
+            col = self._column.get(c.strip().lower())
+            if col is None:
+                return None
+            wanted[col] = True
+        return np.packbits(wanted)
+
+    def mask(self, category: CategoryQuery, mode: str = "any") -> np.ndarray:
+        """
+        Boolean row mask for ``category`` (a label or a list of labels).
+
+        mode="any" keeps recipes tagged with at least one of the labels (OR),
+        mode="all" keeps recipes tagged with every label (AND). No category
+        keeps everything; unknown labels never match.
+        """
+        if mode not in ("any", "all"):
+            raise ValueError(f"Unknown category mode: {mode!r}")
+
+        if isinstance(category, str):
+            category = [category]
+        labels = [c for c in (category or []) if c and str(c).strip()]
+        if not labels:
+            return np.ones(self.num_recipes, dtype=bool)
+
+        if mode == "any":
+            known = [c for c in labels if c.strip().lower() in self._column]
+            if not known:
+                return np.zeros(self.num_recipes, dtype=bool)
+            q = self._query_bits(known)
+            return (self.bits & q).any(axis=1)
+
+        q = self._query_bits(labels)
+        if q is None:
+            return np.zeros(self.num_recipes, dtype=bool)
+        return ((self.bits & q) == q).all(axis=1)
+
+    def rows(self, category: CategoryQuery, mode: str = "any") -> np.ndarray:
+        return np.flatnonzero(self.mask(category, mode))
+
+    def labels(self, row: int) -> List[str]:
+        """Category labels of one recipe, in column order."""
+        members = np.unpackbits(self.bits[row], count=len(self.categories))
+        return [self.categories[i] for i in np.flatnonzero(members)]
+
+
+class CategoryIndexBuilder:
+    """Incremental ``CategoryIndex`` construction (e.g. from streamed CSV chunks)."""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._labels = array("i")
+        self._indptr = array("q", [0])
+
+    @classmethod
+    def from_index(cls, index: CategoryIndex) -> "CategoryIndexBuilder":
+        """Builder seeded with an existing index, to append more recipes to it."""
+        builder = cls()
+        builder._ids = {c: i for i, c in enumerate(index.categories)}
+        membership = np.unpackbits(index.bits, axis=1, count=len(index.categories))
+        rows, cols = np.nonzero(membership)
+        builder._labels = array("i", cols.astype(np.int32).tobytes())
+        counts = np.bincount(rows, minlength=index.num_recipes)
+        builder._indptr = array("q", np.concatenate([[0], np.cumsum(counts)]).astype(np.int64).tobytes())
+        return builder
+
+    def add(self, cat_strings: Iterable[str]):
+        for cat_str in cat_strings:
+            self._labels.extend(self._ids.setdefault(c, len(self._ids)) for c in parse_categories(cat_str))
+            self._indptr.append(len(self._labels))
+
+    def build(self) -> CategoryIndex:
+        # columns in sorted label order, like the original one-shot build
+        categories = sorted(self._ids)
+        remap = np.empty(len(categories), dtype=np.int64)
+        for col, c in enumerate(categories):
+            remap[self._ids[c]] = col
+
+        num_rows = len(self._indptr) - 1
+        indptr = np.frombuffer(self._indptr, dtype=np.int64)
+        labels = np.frombuffer(self._labels, dtype=np.int32) if self._labels else np.empty(0, np.int32)
+        rows = np.repeat(np.arange(num_rows), np.diff(indptr))
+
+        membership = np.zeros((num_rows, len(categories)), dtype=bool)
+        membership[rows, remap[labels]] = True
+        return CategoryIndex(categories, np.packbits(membership, axis=1))
+
+
+def ingredient_key_hash(key: Sequence[str]) -> int:
+    """Stable 64-bit hash of a normalized ingredient key (see query_embedding.pantry_key)."""
+    digest = hashlib.blake2b("\n".join(key).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class RecipeCategoryTable:
+    """
+    Stored categories of known recipes, looked up by ingredient set.
+
+    Holds only a sorted array of 64-bit ingredient-key hashes and the matching
+    recipe rows (16 bytes per recipe); a lookup is one binary search, and a hit
+    is confirmed against the recipe's own ingredients before its labels are
+    read from the category index.
+    """
+
+    def __init__(self, hashes: np.ndarray, rows: np.ndarray, recipes, category_index: CategoryIndex, key_fn):
+        self.hashes = hashes
+        self.rows = rows
+        self.recipes = recipes
+        self.category_index = category_index
+        self.key_fn = key_fn
+
+    @classmethod
+    def build(cls, recipes, category_index: CategoryIndex, key_fn) -> "RecipeCategoryTable":
+        texts = recipes.column("ingredients_text")
+        hashes = np.fromiter((ingredient_key_hash(key_fn(t)) for t in texts),
+                             dtype=np.uint64, count=len(texts))
+        order = np.argsort(hashes, kind="stable")
+        return cls(hashes[order], order.astype(np.int64), recipes, category_index, key_fn)
+
+    def __len__(self) -> int:
+        return self.hashes.shape[0]
+
+    def lookup(self, key: Sequence[str]) -> Optional[List[str]]:
+        """Labels of a recipe with exactly this ingredient set, or None (unknown / unlabeled)."""
+        if not key:
+            return None
+        h = np.uint64(ingredient_key_hash(key))
+        lo = np.searchsorted(self.hashes, h, side="left")
+        hi = np.searchsorted(self.hashes, h, side="right")
+        for row in self.rows[lo:hi]:
+            row = int(row)
+            if self.key_fn(self.recipes.row(row, ["ingredients_text"])["ingredients_text"]) == tuple(key):
+                labels = self.category_index.labels(row)
+                if labels:
+                    return labels
+        return None
@@ -0,0 +1,213 @@
+# src/backend/services/category_rules.py
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Set
+
+from .ingredient_index import WORD_SPLIT_RE
+
+# -----------------------------------------------------------
+# KEYWORD SETS (notebook 3_category_tagging)
+# -----------------------------------------------------------
+MEAT_WORDS = {
+    "chicken", "beef", "pork", "bacon", "ham", "lamb", "turkey",
+    "sausage", "prosciutto", "salami"
+}
+
+FISH_WORDS = {
+    "fish", "salmon", "tuna", "shrimp", "prawn", "crab", "lobster", "cod", "trout"
+}
+
+DAIRY_WORDS = {
+    "milk", "butter", "cheese", "yogurt", "cream", "whipped cream", "parmesan", "mozzarella"
+}
+
+EGG_WORDS = {
+    "egg", "eggs", "egg yolk", "egg white"
+}
+
+PROTEIN_WORDS = MEAT_WORDS | FISH_WORDS | EGG_WORDS | {
+    "tofu", "lentil", "lentils", "beans", "black beans", "kidney beans",
+    "chickpeas", "garbanzo", "paneer", "tempeh", "edamame", "protein powder"
+}
+
+INDULGENT_WORDS = {
+    "chocolate", "brownie", "fudge", "caramel",
+    "butter", "cream", "cheese", "bacon",
+    "sugar", "syrup", "ice cream", "frosting"
+}
+
+HEALTHY_WORDS = {
+    "salad", "quinoa", "oats", "oatmeal", "kale", "broccoli",
+    "spinach", "avocado", "brown rice", "lentils", "beans", "chickpeas",
+    "olive oil", "greek yogurt"
+}
+
+FRY_WORDS = {
+    "deep-fry", "deep fry", "fried", "frying"
+}
+
+BUDGET_STAPLES = {
+    "rice", "potato", "potatoes", "pasta", "noodles", "lentils", "beans",
+    "cabbage", "carrot", "onion", "egg", "eggs", "flour", "bread"
+}
+
+EXPENSIVE_WORDS = {"truffle", "saffron", "lobster", "steak", "prosciutto"}
+
+BREAKFAST_WORDS = {
+    "pancake", "toast", "omelette", "omelet", "cereal", "oatmeal",
+    "breakfast", "granola", "smoothie", "waffle"
+}
+
+LUNCH_WORDS = {
+    "sandwich", "wrap", "burrito", "salad", "lunch", "bowl"
+}
+
+DINNER_WORDS = {
+    "stew", "roast", "casserole", "dinner", "lasagna", "curry"
+}
+
+DESSERT_WORDS = {
+    "cake", "cookie", "brownie", "pudding", "mousse", "ice cream",
+    "tart", "pie", "dessert"
+}
+
+# the notebook's is_quick() substring checks, as token phrases
+QUICK_WORDS = {
+    "quick", "quickly", "easy",
+    "15 min", "15 mins", "15 minute", "15 minutes",
+    "20 min", "20 mins", "20 minute", "20 minutes",
+}
+
+_MEAL_TYPES = (
+    ("breakfast", BREAKFAST_WORDS),
+    ("lunch", LUNCH_WORDS),
+    ("dinner", DINNER_WORDS),
+    ("dessert", DESSERT_WORDS),
+)
+
+RULE_CATEGORIES = (
+    "breakfast", "budget_friendly", "dessert", "dinner", "healthy", "high_protein",
+    "indulgent", "lunch", "quick", "vegan", "vegetarian",
+)
+
+
+def tokenize(text) -> List[str]:
+    """Lower-cased tokens in order, same split as the notebook's to_word_set."""
+    if not isinstance(text, str):
+        return []
+    return [w for w in WORD_SPLIT_RE.split(text.lower()) if w]
+
+
+def _phrase(keyword: str) -> str:
+    # "deep-fry" and "deep fry" are the same token sequence
+    return " ".join(tokenize(keyword))
+
+
+def _phrases(keywords: Iterable[str]) -> FrozenSet[str]:
+    return frozenset(_phrase(k) for k in keywords)
+
+
+class KeywordTrie:
+    """
+    Token-level trie over keyword phrases ("egg", "brown rice", "deep fry").
+
+    ``match`` walks the token list once; at each position it follows the
+    trie for at most the longest phrase, so cost is O(tokens) dict lookups
+    regardless of how many keywords there are.
+    """
+
+    _END = ""  # never a token: tokenize() drops empty strings
+
+    def __init__(self, phrases: Iterable[str]):
+        self.root: Dict = {}
+        for phrase in phrases:
+            node = self.root
+            for token in phrase.split(" "):
+                node = node.setdefault(token, {})
+            node[self._END] = phrase
+
+    def match(self, tokens: Sequence[str]) -> Set[str]:
+        found = set()
+        root, end = self.root, self._END
+        n = len(tokens)
+        for i in range(n):
+            node = root.get(tokens[i])
+            j = i + 1
+            while node is not None:
+                phrase = node.get(end)
+                if phrase is not None:
+                    found.add(phrase)
+                if j == n:
+                    break
+                node = node.get(tokens[j])
+                j += 1
+        return found
+
+
+class RuleCategoryTagger:
+    """
+    The notebook's keyword rules compiled into one trie, for tagging
+    arbitrary text in a single pass (no vectorizer / classifier).
+
+    ``ingredients`` drives the diet rules (vegetarian, vegan, high_protein,
+    budget_friendly); ``context`` (title, instructions) only adds to the
+    indulgent / healthy / meal-type / quick rules, as in the notebook.
+    Unlike the notebook's word-set intersection, multi-word keywords
+    ("ice cream", "olive oil") match as phrases.
+    """
+
+    def __init__(self):
+        self.meat = _phrases(MEAT_WORDS)
+        self.fish = _phrases(FISH_WORDS)
+        self.dairy = _phrases(DAIRY_WORDS)
+        self.egg = _phrases(EGG_WORDS)
+        self.protein = _phrases(PROTEIN_WORDS)
+        self.indulgent = _phrases(INDULGENT_WORDS)
+        self.healthy = _phrases(HEALTHY_WORDS)
+        self.fry = _phrases(FRY_WORDS)
+        self.budget = _phrases(BUDGET_STAPLES)
+        self.expensive = _phrases(EXPENSIVE_WORDS)
+        self.quick = _phrases(QUICK_WORDS)
+        self.meal_types = [(label, _phrases(words)) for label, words in _MEAL_TYPES]
+        self.trie = KeywordTrie(
+            self.meat | self.fish | self.dairy | self.egg | self.protein | self.indulgent
+            | self.healthy | self.fry | self.budget | self.expensive | self.quick
+            | frozenset().union(*(words for _, words in self.meal_types))
+        )
+
+    def tag(self, ingredients, context: str = "") -> List[str]:
+        """Sorted category labels; [] for text without any tokens."""
+        ing_tokens = tokenize(ingredients)
+        ctx_tokens = tokenize(context)
+        if not ing_tokens and not ctx_tokens:
+            return []
+
+        ing = self.trie.match(ing_tokens)
+        words = ing | self.trie.match(ctx_tokens) if ctx_tokens else ing
+        cats = set()
+
+        indulgent_hits = len(words & self.indulgent)
+        if words & self.quick:
+            cats.add("quick")
+        if words & self.healthy and not words & self.fry and indulgent_hits <= 1:
+            cats.add("healthy")
+        if indulgent_hits >= 2:
+            cats.add("indulgent")
+        if ing & self.protein:
+            cats.add("high_protein")
+        if len(ing & self.budget) >= 2 and not ing & self.expensive:
+            cats.add("budget_friendly")
+        if not ing & self.meat and not ing & self.fish:
+            cats.add("vegetarian")
+            if not ing & self.dairy and not ing & self.egg:
+                cats.add("vegan")
+        for label, keywords in self.meal_types:
+            if words & keywords:
+                cats.add(label)
+        return sorted(cats)
+
+
+# compiled once at import (~150 phrases, well under a millisecond)
+RULE_TAGGER = RuleCategoryTagger()
+
+
+def tag_categories_rules(ingredients, context: str = "") -> List[str]:
+    return RULE_TAGGER.tag(ingredients, context)
@@ -1,30 +1,145 @@
-import os
-import joblib
+import logging
+import re
+import threading
+import time
 
-MODEL_DIR = "model"
-MODEL_PATH = os.path.join(MODEL_DIR, "category_classifier.pkl")
-VECTORIZER_PATH = os.path.join(MODEL_DIR, "category_vectorizer.pkl")
+from ..config import (
+    ARTIFACT_MMAP_MODE,
+    CATEGORY_CACHE_SIZE,
+    CATEGORY_CLASSIFIER_PATH,
+    CATEGORY_RECIPE_TABLE,
+    CATEGORY_TAGGER_MODE,
+    CATEGORY_VECTORIZER_PATH,
+)
+from ..deps import get_recipe_category_table, on_recommender_reload
+from ..metrics import CATEGORY_TAG_COUNT
+from .artifacts import load_pickle
+from .caching import LRUCache
+from .category_rules import tag_categories_rules
+from .query_embedding import pantry_key
 
-model = joblib.load(MODEL_PATH)
-vectorizer = joblib.load(VECTORIZER_PATH)
+logger = logging.getLogger(__name__)
 
+_SPACES_RE = re.compile(r"\s+")
 
-def tag_categories(ingredients_list):
+category_cache = LRUCache("category_tags", CATEGORY_CACHE_SIZE)
+
+# without a loadable recommender index, retry the recipe table this much later
+_TABLE_RETRY_S = 60.0
+_table_retry_at = 0.0
+
+# cached labels may come from the recipe table of the previous index version
+on_recommender_reload(category_cache.clear)
+
+_classifier = None  # (vectorizer, model), loaded on first "model" call
+_classifier_lock = threading.Lock()
+
+
+def get_classifier():
+    """(vectorizer, model) from the config paths; importing this module loads nothing."""
+    global _classifier
+    if _classifier is None:
+        with _classifier_lock:
+            if _classifier is None:
+                vectorizer = load_pickle(CATEGORY_VECTORIZER_PATH, "category_vectorizer",
+                                         mmap_mode=ARTIFACT_MMAP_MODE)
+                model = load_pickle(CATEGORY_CLASSIFIER_PATH, "category_classifier",
+                                    mmap_mode=ARTIFACT_MMAP_MODE)
+                _classifier = (vectorizer, model)
+    return _classifier
+
+
+def _known_recipe_table():
+    """The recommender's recipe -> categories table, or None if disabled / not (yet) available."""
+    global _table_retry_at
+    if not CATEGORY_RECIPE_TABLE or time.monotonic() < _table_retry_at:
+        return None
+    try:
+        return get_recipe_category_table()
+    except Exception as e:
+        # no recommender index (yet): tag with the rules, try again later
+        logger.warning("Recipe category table unavailable, retrying in %.0fs: %s", _TABLE_RETRY_S, e)
+        _table_retry_at = time.monotonic() + _TABLE_RETRY_S
+        return None
+
+
+def _text_key(ingredients):
     """
-    Accepts a list of ingredient strings.
-    Returns a list of category labels.
+    Tagger input and cache key: the text as given (lists joined with ", "),
+    lower-cased and whitespace-collapsed.
     """
+    if not ingredients:
+        return ""
+    if not isinstance(ingredients, str):
+        ingredients = ", ".join(str(i) for i in ingredients)
+    return _SPACES_RE.sub(" ", ingredients).strip().lower()
 
-    if not ingredients_list:
-        return []
 
-    if isinstance(ingredients_list, str):
-        ingredients_list = [ingredients_list]
+def tag_categories_batch(ingredient_lists, mode=None):
+    """
+    Category labels for many ingredient lists at once.
+
+    Inputs are keyed by their text, lower-cased and whitespace-collapsed (word
+    order is kept, so rule phrases only match as written). Cached keys come
+    from the LRU; with mode "rules", inputs whose ingredient set is exactly a
+    known recipe's get its stored categories (the dataset was labeled by the
+    same notebook rules). The remaining distinct texts go through the keyword rules,
+    or one ``vectorizer.transform`` + ``model.predict`` over a single sparse
+    matrix with mode "model". Empty inputs get [].
+    """
+    mode = mode or CATEGORY_TAGGER_MODE
+    if mode not in ("model", "rules"):
+        raise ValueError(f"Unknown category tagger mode: {mode!r}")
+
+    keys = [_text_key(x) for x in ingredient_lists]
+    found = {"": ()}
+    for key in keys:
+        if key not in found:
+            found[key] = category_cache.get((mode, key))
+            if found[key] is not None:
+                CATEGORY_TAG_COUNT.labels(source="cache").inc()
+
+    missing = [k for k, labels in found.items() if labels is None]
+    # stored labels use the rules' taxonomy, not the classifier's
+    table = _known_recipe_table() if missing and mode == "rules" else None
+    if table is not None:
+        unknown = []
+        for key in missing:
+            labels = table.lookup(pantry_key(key))
+            if labels is None:
+                unknown.append(key)
+                continue
+            found[key] = tuple(labels)
+            category_cache.put((mode, key), found[key])
+            CATEGORY_TAG_COUNT.labels(source="recipe_table").inc()
+        missing = unknown
+
+    if missing:
+        if mode == "rules":
+            predicted = [tag_categories_rules(t) for t in missing]
+        else:
+            vectorizer, model = get_classifier()
+            predicted = [[label] for label in model.predict(vectorizer.transform(missing)).tolist()]
+        for key, labels in zip(missing, predicted):
+            found[key] = tuple(labels)
+            category_cache.put((mode, key), found[key])
+        CATEGORY_TAG_COUNT.labels(source=mode).inc(len(missing))
+
+    return [list(found[k]) for k in keys]
 
-    text = " ".join(ingredients_list).lower().strip()
 
-    X = vectorizer.transform([text])
+def tag_categories(ingredients_list, mode=None):
+    """
+    Accepts a list of ingredient strings.
+    Returns a list of category labels.
+
+    mode "model" (default: CATEGORY_TAGGER_MODE) runs the TF-IDF classifier;
+    "rules" runs the compiled keyword rules, which return every matching
+    label (possibly none) in microseconds.
+    """
+    return tag_categories_batch([ingredients_list], mode)[0]
 
-    preds = model.predict(X)
 
-    return preds.tolist()
\ No newline at end of file
+def categorize_recipe(text, mode=None):
+    """Category labels for free recipe text (e.g. ingredients + title)."""
+    return tag_categories_batch([text], mode)[0]
@@ -0,0 +1,123 @@
+# src/backend/services/embedding_batcher.py
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Tuple
+
+import numpy as np
+
+from ..metrics import EMBED_BATCH_SIZE, EMBED_BATCH_WAIT
+
+_STOP = object()
+
+
+class _Pending:
+    __slots__ = ("text", "future", "enqueued")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.future: Future = Future()
+        self.enqueued = time.monotonic()
+
+
+class EmbeddingBatcher:
+    """
+    Collects query texts from concurrent requests for up to ``max_wait_ms``
+    (or ``max_batch_size`` texts) and encodes them with one
+    ``model.encode`` call on a background thread.
+
+    Exposes ``encode(texts)`` like a SentenceTransformer, so callers can use
+    it in place of the model; each caller blocks only on its own vectors.
+    After ``close`` (e.g. a hot reload retired it while requests still hold
+    it), texts are encoded directly on the calling thread.
+    """
+
+    def __init__(self, model, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        self.model = model
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, text: str) -> Future:
+        item = _Pending(text)
+        with self._lock:
+            # nothing is queued behind _STOP
+            if not self._closed:
+                self._queue.put(item)
+                return item.future
+        self._encode_batch([item])
+        return item.future
+
+    def encode(self, texts: List[str], **_) -> np.ndarray:
+        futures = [self.submit(t) for t in texts]
+        return np.stack([f.result() for f in futures])
+
+    def close(self, wait: bool = True):
+        """Stop the worker after it drains what is already queued; later submits encode inline."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        if wait:
+            self._thread.join()
+
+    def _collect(self, first: _Pending) -> Tuple[List[_Pending], bool]:
+        batch = [first]
+        deadline = first.enqueued + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                # past the deadline, still take whatever queued up meanwhile
+                if remaining > 0:
+                    item = self._queue.get(timeout=remaining)
+                else:
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self):
+        stop = False
+        while not stop:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            batch, stop = self._collect(first)
+            self._encode_batch(batch)
+
+        # never leave a caller waiting on an item that raced past _STOP
+        leftover = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                leftover.append(item)
+        if leftover:
+            self._encode_batch(leftover)
+
+    def _encode_batch(self, batch: List[_Pending]):
+        started = time.monotonic()
+        EMBED_BATCH_SIZE.observe(len(batch))
+        for item in batch:
+            EMBED_BATCH_WAIT.observe(started - item.enqueued)
+
+        try:
+            vectors = self.model.encode([item.text for item in batch], batch_size=len(batch))
+        except Exception as e:
+            for item in batch:
+                item.future.set_exception(e)
+            return
+
+        for item, vec in zip(batch, vectors):
+            item.future.set_result(np.asarray(vec, dtype=np.float32))
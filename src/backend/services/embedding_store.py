@@ -0,0 +1,161 @@
+# src/backend/services/embedding_store.py
+import json
+import os
+
+import numpy as np
+
+from .ranking import l2_normalize_rows
+
+VALUES_FILE = "values.npy"
+SCALES_FILE = "scales.npy"
+META_FILE = "meta.json"
+
+SUPPORTED_DTYPES = ("int8", "float16")
+
+
+def _write_meta(path: str, dtype: str, num_vectors: int, dim: int):
+    with open(os.path.join(path, META_FILE), "w") as f:
+        json.dump({
+            "dtype": dtype,
+            "num_vectors": num_vectors,
+            "dim": dim,
+            "normalized": True,
+        }, f, indent=2)
+
+
+class QuantizedEmbeddings:
+    """
+    Row-quantized, L2-normalized recipe embeddings stored as .npy files.
+
+    int8 rows keep one float32 scale each (value = q * scale); float16 rows use
+    a scale of 1. The files are opened with ``mmap_mode="r"`` so every worker
+    shares the same page-cache copy instead of holding its own float32 matrix.
+
+    ``store @ query`` dequantizes block by block, so scoring never
+    materializes the full float32 matrix.
+    """
+
+    def __init__(self, values: np.ndarray, scales: np.ndarray, block_rows: int = 16384):
+        self.values = values
+        self.scales = scales
+        self.block_rows = block_rows
+
+    @classmethod
+    def quantize(cls, embeddings: np.ndarray, dtype: str = "int8") -> "QuantizedEmbeddings":
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"Unsupported embedding dtype: {dtype!r}")
+
+        emb = l2_normalize_rows(embeddings)
+        if dtype == "float16":
+            return cls(emb.astype(np.float16), np.ones(len(emb), dtype=np.float32))
+
+        scales = np.abs(emb).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        values = np.clip(np.rint(emb / scales[:, None]), -127, 127).astype(np.int8)
+        return cls(values, scales.astype(np.float32))
+
+    @classmethod
+    def quantize_to(cls, path: str, embeddings: np.ndarray, dtype: str = "int8",
+                    chunk_rows: int = 65536) -> "QuantizedEmbeddings":
+        """
+        ``quantize`` + ``save`` chunk by chunk, for matrices that do not fit
+        in memory (e.g. a memmap). Returns the store memory-mapped from ``path``.
+        """
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"Unsupported embedding dtype: {dtype!r}")
+        n, dim = embeddings.shape
+        os.makedirs(path, exist_ok=True)
+        values = np.lib.format.open_memmap(os.path.join(path, VALUES_FILE), mode="w+",
+                                           dtype=np.dtype(dtype), shape=(n, dim))
+        scales = np.lib.format.open_memmap(os.path.join(path, SCALES_FILE), mode="w+",
+                                           dtype=np.float32, shape=(n,))
+        for start in range(0, n, chunk_rows):
+            part = cls.quantize(embeddings[start:start + chunk_rows], dtype)
+            values[start:start + len(part)] = part.values
+            scales[start:start + len(part)] = part.scales
+        values.flush()
+        scales.flush()
+        del values, scales
+        _write_meta(path, dtype, n, dim)
+        return cls.load(path)
+
+    def save(self, path: str):
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, VALUES_FILE), self.values)
+        np.save(os.path.join(path, SCALES_FILE), self.scales)
+        _write_meta(path, str(self.values.dtype), int(self.values.shape[0]), int(self.values.shape[1]))
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "QuantizedEmbeddings":
+        mode = "r" if mmap else None
+        return cls(
+            np.load(os.path.join(path, VALUES_FILE), mmap_mode=mode),
+            np.load(os.path.join(path, SCALES_FILE), mmap_mode=mode),
+        )
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    def __getitem__(self, rows) -> np.ndarray:
+        """Dequantized float32 rows (same indexing as a numpy array)."""
+        values = np.asarray(self.values[rows], dtype=np.float32)
+        scales = np.asarray(self.scales[rows], dtype=np.float32)
+        if values.ndim == 1:
+            return values * scales
+        return values * scales[:, None]
+
+    def __matmul__(self, query: np.ndarray) -> np.ndarray:
+        # query is (dim,) for one vector or (dim, m) for m queries at once
+        q = np.asarray(query, dtype=np.float32)
+        out = np.empty((len(self),) + q.shape[1:], dtype=np.float32)
+        for start in range(0, len(self), self.block_rows):
+            end = start + self.block_rows
+            block = np.asarray(self.values[start:end], dtype=np.float32)
+            scales = self.scales[start:end]
+            out[start:end] = (block @ q) * (scales if q.ndim == 1 else scales[:, None])
+        return out
+
+
+class ConcatEmbeddings:
+    """
+    Read-only view over embedding blocks (the base store + appended index
+    segments) with global row ids in order, like ``ConcatRecipeStore``.
+
+    Each block keeps its own storage, so an mmapped base stays shared page
+    cache instead of being copied next to the segments; ``@`` scores block
+    by block and row indexing gathers from the blocks that hold the rows.
+    """
+
+    def __init__(self, parts):
+        self.parts = list(parts)
+        self._starts = np.cumsum([0] + [len(p) for p in self.parts])
+
+    @property
+    def shape(self):
+        return (int(self._starts[-1]), self.parts[0].shape[1])
+
+    def __len__(self) -> int:
+        return int(self._starts[-1])
+
+    def __getitem__(self, rows) -> np.ndarray:
+        """float32 rows for an int, slice or integer array of global row ids."""
+        if np.isscalar(rows):
+            part = int(np.searchsorted(self._starts, rows, side="right")) - 1
+            return np.asarray(self.parts[part][int(rows) - int(self._starts[part])], dtype=np.float32)
+        if isinstance(rows, slice):
+            rows = np.arange(len(self))[rows]
+        rows = np.asarray(rows)
+        out = np.empty((len(rows), self.shape[1]), dtype=np.float32)
+        owner = np.searchsorted(self._starts, rows, side="right") - 1
+        for i, part in enumerate(self.parts):
+            mask = owner == i
+            if mask.any():
+                out[mask] = part[rows[mask] - int(self._starts[i])]
+        return out
+
+    def __matmul__(self, query: np.ndarray) -> np.ndarray:
+        return np.concatenate([np.asarray(part @ query, dtype=np.float32) for part in self.parts])
@@ -0,0 +1,104 @@
+# src/backend/services/index_manifest.py
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Iterable, List, Optional
+
+MANIFEST_FILE = "manifest.json"
+
+# append-only segments: <index>/segments/<name>/{embeddings, recipes}, listed
+# in the manifest in row order after the base artifacts
+SEGMENTS_DIR = "segments"
+SEGMENT_EMBEDDINGS_FILE = "recommender_embeddings.npy"
+SEGMENT_RECIPES_DIR = "recommender_recipes"
+
+# full builds and compactions write the base artifacts into a new
+# <index>/base-NNNNNN/ directory; the manifest's "base_dir" points at the
+# live one, so swapping the manifest publishes a base in one atomic step
+BASE_DIR_PREFIX = "base-"
+
+
+def file_sha256(path: str, block_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _artifact_files(root: str, artifacts: Iterable[str]) -> List[str]:
+    """Relative paths of every file under the given artifact files/directories."""
+    files = []
+    for name in artifacts:
+        path = os.path.join(root, name)
+        if os.path.isdir(path):
+            for dirpath, _, filenames in os.walk(path):
+                files.extend(os.path.relpath(os.path.join(dirpath, f), root) for f in filenames)
+        elif os.path.exists(path):
+            files.append(name)
+    return sorted(files)
+
+
+def write_manifest(root: str, artifacts: Iterable[str], extra: Optional[Dict] = None) -> Dict:
+    """
+    Write ``manifest.json`` in ``root`` with a sha256 and size per artifact
+    file, plus one checksum over all of them (in path order).
+    """
+    files = {}
+    for rel in _artifact_files(root, artifacts):
+        full = os.path.join(root, rel)
+        files[rel] = {"sha256": file_sha256(full), "bytes": os.path.getsize(full)}
+
+    overall = hashlib.sha256()
+    for rel, entry in files.items():
+        overall.update(f"{rel}:{entry['sha256']}\n".encode("utf-8"))
+
+    manifest = dict(extra or {})
+    manifest.update({
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "files": files,
+        "checksum": overall.hexdigest(),
+    })
+    save_manifest(root, manifest)
+    return manifest
+
+
+def save_manifest(root: str, manifest: Dict):
+    """Atomic replace: readers polling the manifest never see a partial file."""
+    path = os.path.join(root, MANIFEST_FILE)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, path)
+
+
+def base_dir(root: str, manifest: Optional[Dict]) -> str:
+    """Directory of the base artifacts: the manifest's base_dir, else ``root`` (unversioned layout)."""
+    name = (manifest or {}).get("base_dir")
+    return os.path.join(root, name) if name else root
+
+
+def read_manifest(root: str) -> Optional[Dict]:
+    path = os.path.join(root, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def verify_manifest(root: str) -> List[str]:
+    """Files whose size or sha256 no longer match the manifest (empty = intact)."""
+    manifest = read_manifest(root)
+    if manifest is None:
+        return [MANIFEST_FILE]
+    bad = []
+    for seg in manifest.get("segments", []):
+        seg_root = os.path.join(root, SEGMENTS_DIR, seg["name"])
+        bad.extend(os.path.join(SEGMENTS_DIR, seg["name"], rel) for rel in verify_manifest(seg_root))
+    for rel, entry in manifest["files"].items():
+        full = os.path.join(root, rel)
+        if (not os.path.exists(full) or os.path.getsize(full) != entry["bytes"]
+                or file_sha256(full) != entry["sha256"]):
+            bad.append(rel)
+    return bad
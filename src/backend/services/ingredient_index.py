@@ -0,0 +1,196 @@
+# src/backend/services/ingredient_index.py
+import json
+import os
+import re
+from array import array
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+from scipy import sparse
+
+WORD_SPLIT_RE = re.compile(r"[,\s;:\(\)\[\]\.\-]+")
+
+MATRIX_FILE = "matrix.npz"
+VOCAB_FILE = "vocab.json"
+
+
+def to_word_set(text: str) -> Set[str]:
+    """Lower-cased ingredient tokens, same split as the recommender notebook."""
+    if not isinstance(text, str):
+        return set()
+    return {w.strip() for w in WORD_SPLIT_RE.split(text.lower()) if w.strip()}
+
+
+class IngredientMatrix:
+    """
+    Binary recipe x token matrix built once from the ``ingredients_words`` sets.
+
+    Row i has a 1 in column j when recipe i contains vocabulary token j, so the
+    overlap of a pantry with every recipe is a single sparse mat-vec product.
+    """
+
+    def __init__(self, vocab: Dict[str, int], matrix: sparse.csr_matrix):
+        self.vocab = vocab
+        self.matrix = matrix
+
+    @classmethod
+    def from_word_sets(cls, word_sets: Iterable[Set[str]]) -> "IngredientMatrix":
+        builder = IngredientMatrixBuilder()
+        builder.add(word_sets)
+        return builder.build()
+
+    def save(self, path: str):
+        os.makedirs(path, exist_ok=True)
+        sparse.save_npz(os.path.join(path, MATRIX_FILE), self.matrix, compressed=False)
+        with open(os.path.join(path, VOCAB_FILE), "w") as f:
+            json.dump(sorted(self.vocab, key=self.vocab.get), f)
+
+    @classmethod
+    def load(cls, path: str) -> "IngredientMatrix":
+        with open(os.path.join(path, VOCAB_FILE)) as f:
+            vocab = {w: i for i, w in enumerate(json.load(f))}
+        matrix = sparse.load_npz(os.path.join(path, MATRIX_FILE)).tocsr()
+        return cls(vocab, matrix)
+
+    @property
+    def num_recipes(self) -> int:
+        return self.matrix.shape[0]
+
+    def query_vector(self, words: Set[str]) -> np.ndarray:
+        q = np.zeros(len(self.vocab), dtype=np.float32)
+        cols = [self.vocab[w] for w in words if w in self.vocab]
+        q[cols] = 1.0
+        return q
+
+    def overlap_counts(self, words: Set[str]) -> np.ndarray:
+        """Number of pantry tokens shared with each recipe."""
+        return self.matrix @ self.query_vector(words)
+
+    def overlap_scores(self, words: Set[str], rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Same score as the old per-row set intersection:
+        |pantry & recipe| / |pantry|, optionally restricted to ``rows``.
+        """
+        n = self.num_recipes if rows is None else len(rows)
+        if not words:
+            return np.zeros(n, dtype=np.float32)
+
+        counts = self.overlap_counts(words)
+        if rows is not None:
+            counts = counts[rows]
+        return counts / float(len(words))
+
+    def overlap_scores_many(self, word_sets: List[Set[str]],
+                            rows: Optional[np.ndarray] = None, dense: bool = True):
+        """
+        (recipes, len(word_sets)) overlap scores for many pantries: one sparse
+        mat-mat product instead of one mat-vec per pantry. ``dense=False``
+        returns the sparse (CSC) product, so callers can densify per pantry.
+        """
+        indptr = [0]
+        indices = []
+        for words in word_sets:
+            indices.extend(self.vocab[w] for w in words if w in self.vocab)
+            indptr.append(len(indices))
+        queries = sparse.csc_matrix(
+            (np.ones(len(indices), dtype=np.float32), indices, indptr),
+            shape=(len(self.vocab), len(word_sets)),
+        )
+
+        matrix = self.matrix if rows is None else self.matrix[rows]
+        sizes = np.array([max(len(w), 1) for w in word_sets], dtype=np.float32)
+        counts = matrix @ queries
+        if not dense:
+            return sparse.csc_matrix(counts @ sparse.diags(1.0 / sizes))
+        return counts.toarray() / sizes
+
+
+class IngredientMatrixBuilder:
+    """Incremental ``IngredientMatrix`` construction (e.g. from streamed CSV chunks)."""
+
+    def __init__(self):
+        self.vocab: Dict[str, int] = {}
+        self._indices = array("i")
+        self._indptr = array("q", [0])
+
+    @classmethod
+    def from_matrix(cls, word_matrix: IngredientMatrix) -> "IngredientMatrixBuilder":
+        """Builder seeded with an existing matrix, to append more recipes to it."""
+        builder = cls()
+        builder.vocab = dict(word_matrix.vocab)
+        builder._indices = array("i", word_matrix.matrix.indices.astype(np.int32).tobytes())
+        builder._indptr = array("q", word_matrix.matrix.indptr.astype(np.int64).tobytes())
+        return builder
+
+    def add(self, word_sets: Iterable[Set[str]]):
+        for words in word_sets:
+            self._indices.extend(self.vocab.setdefault(w, len(self.vocab)) for w in words)
+            self._indptr.append(len(self._indices))
+
+    def build(self) -> IngredientMatrix:
+        indices = np.frombuffer(self._indices, dtype=np.int32) if self._indices else np.empty(0, np.int32)
+        indptr = np.frombuffer(self._indptr, dtype=np.int64)
+        matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), indices.copy(), indptr.copy()),
+            shape=(len(indptr) - 1, len(self.vocab)),
+        )
+        return IngredientMatrix(dict(self.vocab), matrix)
+
+
+class InvertedIngredientIndex:
+    """
+    Token -> posting list of recipe ids, for candidate pre-selection.
+
+    Posting lists are sorted and delta-encoded (first id absolute, then gaps)
+    into one flat array of the narrowest unsigned dtype that holds the largest
+    gap; ``offsets[j]:offsets[j + 1]`` is the slice for vocabulary token j.
+    """
+
+    def __init__(self, vocab: Dict[str, int], deltas: np.ndarray,
+                 offsets: np.ndarray, num_recipes: int):
+        self.vocab = vocab
+        self.deltas = deltas
+        self.offsets = offsets
+        self.num_recipes = num_recipes
+
+    @classmethod
+    def from_matrix(cls, word_matrix: IngredientMatrix) -> "InvertedIngredientIndex":
+        # CSC of the recipe x token matrix already holds sorted postings per token
+        csc = word_matrix.matrix.tocsc()
+        csc.sort_indices()
+        ids = csc.indices.astype(np.int64)
+        offsets = csc.indptr.astype(np.int64)
+
+        gaps = np.diff(ids, prepend=0)
+        starts = offsets[:-1][np.diff(offsets) > 0]
+        gaps[starts] = ids[starts]
+
+        max_gap = int(gaps.max()) if gaps.size else 0
+        dtype = np.uint16 if max_gap <= np.iinfo(np.uint16).max else np.uint32
+        return cls(word_matrix.vocab, gaps.astype(dtype), offsets, word_matrix.num_recipes)
+
+    @property
+    def nbytes(self) -> int:
+        return self.deltas.nbytes + self.offsets.nbytes
+
+    def postings(self, word: str) -> np.ndarray:
+        """Sorted recipe ids containing ``word`` (empty if the token is unknown)."""
+        j = self.vocab.get(word)
+        if j is None:
+            return np.empty(0, dtype=np.int64)
+        return np.cumsum(self.deltas[self.offsets[j]:self.offsets[j + 1]], dtype=np.int64)
+
+    def candidates(self, words: Set[str], min_shared: int = 1) -> np.ndarray:
+        """
+        Sorted ids of recipes sharing at least ``min_shared`` tokens with
+        ``words``; ``min_shared`` is capped at the number of known tokens.
+        """
+        lists = [self.postings(w) for w in words if w in self.vocab]
+        if not lists:
+            return np.empty(0, dtype=np.int64)
+        min_shared = max(1, min(min_shared, len(lists)))
+        if len(lists) == 1:
+            return lists[0]
+
+        counts = np.bincount(np.concatenate(lists), minlength=self.num_recipes)
+        return np.flatnonzero(counts >= min_shared)
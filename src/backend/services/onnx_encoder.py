@@ -0,0 +1,79 @@
+# src/backend/services/onnx_encoder.py
+import json
+import os
+from typing import List
+
+import numpy as np
+
+try:
+    import onnxruntime as ort
+    from tokenizers import Tokenizer
+
+    _HAVE_ORT = True
+except ImportError:
+    _HAVE_ORT = False
+
+DEFAULT_MODEL_FILE = "model.onnx"
+INT8_MODEL_FILE = "model_int8.onnx"
+ENCODER_CONFIG_FILE = "encoder_config.json"
+
+
+class OnnxSentenceEncoder:
+    """
+    all-MiniLM-L6-v2 query encoder on ONNX Runtime (no torch at request time).
+
+    Reproduces the sentence-transformers pipeline: WordPiece tokenization from
+    tokenizer.json, transformer forward pass, attention-masked mean pooling and
+    L2 normalization. Exported by ``python -m backend.tools.export_onnx_encoder``,
+    optionally with int8 dynamically-quantized weights.
+    """
+
+    def __init__(self, model_dir: str, model_file: str = DEFAULT_MODEL_FILE,
+                 max_length: int = 256, num_threads: int = 0):
+        if not _HAVE_ORT:
+            raise RuntimeError(
+                "onnxruntime is not installed; cannot use the ONNX encoder "
+                "(pip install -r src/requirements.txt, or onnxruntime>=1.16)"
+            )
+
+        config_path = os.path.join(model_dir, ENCODER_CONFIG_FILE)
+        if os.path.exists(config_path):
+            with open(config_path) as f:
+                max_length = json.load(f).get("max_length", max_length)
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        pad_token = "[PAD]"
+        pad_id = self.tokenizer.token_to_id(pad_token) or 0
+        self.tokenizer.enable_padding(pad_id=pad_id, pad_token=pad_token)
+
+        options = ort.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(
+            os.path.join(model_dir, model_file),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self._input_names = {i.name for i in self.session.get_inputs()}
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        feed = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+            "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+        }
+        feed = {k: v for k, v in feed.items() if k in self._input_names}
+
+        hidden = self.session.run(None, feed)[0]
+        mask = feed["attention_mask"][:, :, None].astype(np.float32)
+        pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return (pooled / np.clip(norms, 1e-12, None)).astype(np.float32)
+
+    def encode(self, texts: List[str], batch_size: int = 32, **_) -> np.ndarray:
+        if isinstance(texts, str):
+            texts = [texts]
+        parts = [self._encode_batch(texts[i:i + batch_size]) for i in range(0, len(texts), batch_size)]
+        return np.concatenate(parts) if parts else np.empty((0, 0), dtype=np.float32)
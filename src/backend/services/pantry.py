@@ -5,6 +5,13 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
 from .. import models, schemas
+from . import user_recommendations
+
+
+def _pantry_changed(db: Session, user_id: int):
+    # recompute the user's cached /recommend results off the request path
+    names = [it.name for it in list_pantry_items(db, user_id)]
+    user_recommendations.pantry_changed(user_id, names)
 
 
 def create_pantry_item(db: Session, user_id: int, item_in: schemas.PantryItemCreate):
@@ -19,6 +26,7 @@ def create_pantry_item(db: Session, user_id: int, item_in: schemas.PantryItemCre
     db.add(obj)
     db.commit()
     db.refresh(obj)
+    _pantry_changed(db, user_id)
     return obj
 
 
@@ -45,6 +53,7 @@ def delete_pantry_item(db: Session, user_id: int, item_id: int):
 
     db.delete(item)
     db.commit()
+    _pantry_changed(db, user_id)
 
 
 def remove_used_items(db: Session, user_id: int, used: List[str]) -> List[str]:
@@ -63,4 +72,6 @@ def remove_used_items(db: Session, user_id: int, used: List[str]) -> List[str]:
             db.delete(it)
 
     db.commit()
+    if removed:
+        _pantry_changed(db, user_id)
     return removed
\ No newline at end of file
@@ -0,0 +1,70 @@
+# src/backend/services/query_embedding.py
+import re
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from ..config import QUERY_EMBED_CACHE_SIZE
+from .caching import LRUCache
+
+_SPACES_RE = re.compile(r"\s+")
+
+query_embedding_cache = LRUCache("query_embedding", QUERY_EMBED_CACHE_SIZE)
+
+
+def pantry_key(pantry_ingredients: Union[str, List[str], None]) -> Tuple[str, ...]:
+    """
+    Normalized, order-independent pantry: lower-cased, whitespace-collapsed,
+    de-duplicated and sorted ingredient names.
+    """
+    if pantry_ingredients is None:
+        return ()
+    if isinstance(pantry_ingredients, str):
+        items = pantry_ingredients.split(",")
+    else:
+        items = [str(i) for i in pantry_ingredients]
+    cleaned = {_SPACES_RE.sub(" ", i).strip().lower() for i in items}
+    return tuple(sorted(i for i in cleaned if i))
+
+
+def pantry_query_text(key: Tuple[str, ...]) -> str:
+    return f"Ingredients: {', '.join(key)}"
+
+
+def encode_pantry(embed_model, pantry_ingredients) -> np.ndarray:
+    """
+    Query embedding for a pantry, served from the shared LRU when the same
+    ingredient set was encoded before (any order / casing).
+    """
+    key = pantry_key(pantry_ingredients)
+    emb = query_embedding_cache.get(key)
+    if emb is None:
+        emb = np.asarray(embed_model.encode([pantry_query_text(key)])[0], dtype=np.float32)
+        emb.setflags(write=False)
+        query_embedding_cache.put(key, emb)
+    return emb
+
+
+def encode_pantries(embed_model, pantries) -> np.ndarray:
+    """
+    (len(pantries), dim) query embeddings; cache misses are de-duplicated and
+    encoded with a single ``embed_model.encode`` call.
+    """
+    keys = [pantry_key(p) for p in pantries]
+    found = {}
+    for key in keys:
+        if key not in found:
+            found[key] = query_embedding_cache.get(key)
+
+    missing = [k for k, emb in found.items() if emb is None]
+    if missing:
+        vectors = embed_model.encode([pantry_query_text(k) for k in missing], batch_size=64)
+        for key, vec in zip(missing, vectors):
+            emb = np.asarray(vec, dtype=np.float32)
+            emb.setflags(write=False)
+            query_embedding_cache.put(key, emb)
+            found[key] = emb
+
+    if not keys:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.stack([found[k] for k in keys])
@@ -0,0 +1,90 @@
+# src/backend/services/ranking.py
+import numpy as np
+
+
+def l2_normalize_rows(embeddings) -> np.ndarray:
+    """
+    Unit-normalize every row once so cosine similarity becomes a plain dot
+    product. Returns a C-contiguous float32 array; zero rows stay zero.
+    """
+    emb = np.ascontiguousarray(embeddings, dtype=np.float32)
+    if emb.ndim == 1:
+        emb = emb.reshape(1, -1)
+    norms = np.linalg.norm(emb, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.ascontiguousarray(emb / norms, dtype=np.float32)
+
+
+def l2_normalize(vector) -> np.ndarray:
+    """Unit-normalize a single query vector (float32)."""
+    v = np.asarray(vector, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(v))
+    if norm == 0.0:
+        return v
+    return v / norm
+
+
+def cosine_scores(normalized_embeddings: np.ndarray, query) -> np.ndarray:
+    """Cosine similarity of one query against pre-normalized rows: one mat-vec."""
+    return normalized_embeddings @ l2_normalize(query)
+
+
+def cosine_scores_many(normalized_embeddings: np.ndarray, queries) -> np.ndarray:
+    """(num_rows, num_queries) cosine matrix: all queries in one mat-mat product."""
+    return normalized_embeddings @ l2_normalize_rows(queries).T
+
+
+def top_k_indices(scores: np.ndarray, k: int):
+    """
+    Indices and values of the ``k`` highest scores, best first.
+
+    Uses ``np.argpartition`` (O(N)) and only sorts the k survivors, instead of
+    fully sorting the whole corpus to keep a handful of results.
+    """
+    scores = np.asarray(scores)
+    n = scores.shape[0]
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp), scores[:0]
+
+    if k >= n:
+        idx = np.argsort(-scores, kind="stable")
+    else:
+        part = np.argpartition(-scores, k - 1)[:k]
+        idx = part[np.argsort(-scores[part], kind="stable")]
+    return idx, scores[idx]
+
+
+def mmr_select(embeddings, relevance, k: int, lambda_: float = 0.7) -> np.ndarray:
+    """
+    Positions of ``k`` rows picked by maximal marginal relevance, in pick order.
+
+    Each step takes the row maximizing
+    ``lambda_ * relevance - (1 - lambda_) * max cosine to the rows already picked``,
+    so near-duplicates of a pick drop down. ``embeddings`` must be
+    L2-normalized; the max-similarity vector is updated with one mat-vec per
+    pick, so the cost is O(k * N * dim) with no Python loop over N.
+    ``lambda_ = 1`` reproduces plain top-k by relevance.
+    """
+    rel = np.asarray(relevance, dtype=np.float32)
+    n = rel.shape[0]
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    emb = np.asarray(embeddings, dtype=np.float32)
+    weighted = lambda_ * rel
+    penalty = np.float32(1.0 - lambda_)
+    picked = np.empty(k, dtype=np.intp)
+    picked[0] = int(np.argmax(rel))
+    max_sim = emb @ emb[picked[0]]
+    taken = np.zeros(n, dtype=bool)
+    taken[picked[0]] = True
+
+    for i in range(1, k):
+        mmr = weighted - penalty * max_sim
+        mmr[taken] = -np.inf
+        j = int(np.argmax(mmr))
+        picked[i] = j
+        taken[j] = True
+        np.maximum(max_sim, emb @ emb[j], out=max_sim)
+    return picked
@@ -0,0 +1,188 @@
+# src/backend/services/recipe_store.py
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+META_FILE = "meta.json"
+
+RECIPE_COLUMNS = ["Title", "ingredients_text", "target_text", "categories"]
+
+
+def _column_files(path: str, name: str):
+    return (
+        os.path.join(path, f"{name}.data.npy"),
+        os.path.join(path, f"{name}.offsets.npy"),
+    )
+
+
+def _encode_column(values: Iterable) -> Tuple[np.ndarray, np.ndarray]:
+    encoded = [(v if isinstance(v, str) else "").encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return data, offsets
+
+
+class RecipeStore:
+    """
+    Columnar recipe metadata: each string column is one UTF-8 byte blob plus
+    an int64 offsets array, saved as .npy and memory-mapped on load.
+
+    Row i of a column is ``data[offsets[i]:offsets[i + 1]]``, so fetching the
+    top-k results is O(1) per field and needs neither pandas nor unpickling.
+    """
+
+    def __init__(self, columns: Dict[str, tuple], num_rows: int):
+        self._columns = columns
+        self.num_rows = num_rows
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, List]) -> "RecipeStore":
+        lengths = {len(v) for v in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All recipe columns must have the same length")
+        encoded = {name: _encode_column(values) for name, values in columns.items()}
+        return cls(encoded, lengths.pop() if lengths else 0)
+
+    @classmethod
+    def from_dataframe(cls, df, columns: Optional[List[str]] = None) -> "RecipeStore":
+        columns = [c for c in (columns or RECIPE_COLUMNS) if c in df.columns]
+        return cls.from_columns({c: df[c].tolist() for c in columns})
+
+    def save(self, path: str):
+        os.makedirs(path, exist_ok=True)
+        for name, (data, offsets) in self._columns.items():
+            data_path, offsets_path = _column_files(path, name)
+            np.save(data_path, data)
+            np.save(offsets_path, offsets)
+        with open(os.path.join(path, META_FILE), "w") as f:
+            json.dump({"num_rows": self.num_rows, "columns": list(self._columns)}, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "RecipeStore":
+        mode = "r" if mmap else None
+        with open(os.path.join(path, META_FILE)) as f:
+            meta = json.load(f)
+        columns = {}
+        for name in meta["columns"]:
+            data_path, offsets_path = _column_files(path, name)
+            columns[name] = (np.load(data_path, mmap_mode=mode), np.load(offsets_path))
+        return cls(columns, meta["num_rows"])
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def get(self, column: str, i: int) -> str:
+        data, offsets = self._columns[column]
+        return bytes(data[offsets[i]:offsets[i + 1]]).decode("utf-8")
+
+    def row(self, i: int, columns: Optional[List[str]] = None) -> Dict[str, str]:
+        return {c: self.get(c, int(i)) for c in (columns or self._columns)}
+
+    def column(self, name: str, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """Column (or rows start:stop of it) as Python strings, for building indexes."""
+        data, offsets = self._columns[name]
+        stop = self.num_rows if stop is None else min(stop, self.num_rows)
+        if start >= stop:
+            return []
+        base = int(offsets[start])
+        blob = bytes(data[base:int(offsets[stop])])
+        return [blob[offsets[i] - base:offsets[i + 1] - base].decode("utf-8") for i in range(start, stop)]
+
+
+class ConcatRecipeStore:
+    """
+    Read-only view over several stores (base + appended segments) with
+    global row ids in order: the same interface as ``RecipeStore``.
+    """
+
+    def __init__(self, stores: List[RecipeStore]):
+        self.stores = stores
+        self._starts = np.cumsum([0] + [len(s) for s in stores])
+        self.num_rows = int(self._starts[-1])
+
+    @property
+    def columns(self) -> List[str]:
+        return self.stores[0].columns
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def _locate(self, i: int):
+        part = int(np.searchsorted(self._starts, i, side="right")) - 1
+        return self.stores[part], i - int(self._starts[part])
+
+    def get(self, column: str, i: int) -> str:
+        store, j = self._locate(int(i))
+        return store.get(column, j)
+
+    def row(self, i: int, columns: Optional[List[str]] = None) -> Dict[str, str]:
+        store, j = self._locate(int(i))
+        return store.row(j, columns)
+
+    def column(self, name: str, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """Global rows start:stop of a column, read only from the stores that hold them."""
+        stop = self.num_rows if stop is None else min(stop, self.num_rows)
+        values = []
+        for store, offset in zip(self.stores, self._starts[:-1].tolist()):
+            lo, hi = max(start - offset, 0), min(stop - offset, len(store))
+            if lo < hi:
+                values.extend(store.column(name, lo, hi))
+        return values
+
+
+class RecipeStoreWriter:
+    """
+    Streams rows into a ``RecipeStore`` directory chunk by chunk, so the
+    corpus never has to sit in memory: column bytes are spooled to a temp
+    file and copied into the memory-mapped .npy blob on ``close()``.
+    """
+
+    def __init__(self, path: str, columns: Optional[List[str]] = None):
+        self.path = path
+        self.columns = list(columns or RECIPE_COLUMNS)
+        self.num_rows = 0
+        os.makedirs(path, exist_ok=True)
+        self._spools = {c: open(os.path.join(path, f"{c}.data.tmp"), "wb") for c in self.columns}
+        self._lengths = {c: [np.zeros(1, dtype=np.int64)] for c in self.columns}
+
+    def append(self, columns: Dict[str, List]):
+        lengths = {len(columns[c]) for c in self.columns}
+        if len(lengths) > 1:
+            raise ValueError("All recipe columns must have the same length")
+        for c in self.columns:
+            encoded = [(v if isinstance(v, str) else "").encode("utf-8") for v in columns[c]]
+            self._spools[c].write(b"".join(encoded))
+            self._lengths[c].append(np.fromiter((len(b) for b in encoded), dtype=np.int64))
+        self.num_rows += lengths.pop() if lengths else 0
+
+    def close(self) -> RecipeStore:
+        for c in self.columns:
+            spool = self._spools[c]
+            spool.close()
+            offsets = np.cumsum(np.concatenate(self._lengths[c]))
+            data_path, offsets_path = _column_files(self.path, c)
+            if offsets[-1] == 0:
+                np.save(data_path, np.empty(0, dtype=np.uint8))
+            else:
+                data = np.lib.format.open_memmap(data_path, mode="w+", dtype=np.uint8,
+                                                 shape=(int(offsets[-1]),))
+                with open(spool.name, "rb") as f:
+                    pos = 0
+                    for block in iter(lambda: f.read(1 << 24), b""):
+                        data[pos:pos + len(block)] = np.frombuffer(block, dtype=np.uint8)
+                        pos += len(block)
+                data.flush()
+                del data
+            os.remove(spool.name)
+            np.save(offsets_path, offsets)
+
+        with open(os.path.join(self.path, META_FILE), "w") as f:
+            json.dump({"num_rows": self.num_rows, "columns": self.columns}, f, indent=2)
+        return RecipeStore.load(self.path, mmap=True)
@@ -1,18 +1,24 @@
 # src/backend/services/recipes.py
 
 import json
+import logging
+import time
 from typing import List, Optional, Dict, Any
+
 from .generation import generate_with_model
+from ..config import ALPHA_INGREDIENT, BETA_EMBEDDING, RETRIEVAL_MIN_CONFIDENCE
+from ..metrics import RECOMMEND_PATH_COUNT, RECOMMEND_PATH_LATENCY
+
+logger = logging.getLogger(__name__)
 
 
 # -----------------------------------------------------------
-# SIMPLE, RELIABLE, 100% WORKING RECOMMENDATION ENGINE
+# RETRIEVAL-FIRST RECOMMENDATION ENGINE
 # -----------------------------------------------------------
-# No embeddings
-# No metadata files
-# No vectorizer
-# No recommender folder required
-# Uses FLAN model exactly like quick-generate
+# 1. Hybrid retrieval over the precomputed recipe index
+#    (services/recommender.py) -> real recipes in milliseconds
+# 2. FLAN generation only when retrieval finds nothing or
+#    its best match is below RETRIEVAL_MIN_CONFIDENCE
 # -----------------------------------------------------------
 
 def recommend_one_recipe(
@@ -42,14 +48,93 @@ def recommend_one_recipe(
         }
 
 
+def _instructions_from_target(target_text: str) -> str:
+    # target_text is "Title: ...\nInstructions: ..." (see 1_Preprocessing)
+    if "Instructions:" in target_text:
+        return target_text.split("Instructions:", 1)[1].strip()
+    return target_text.strip()
+
+
+def _retrieval_confidence(rec: Dict[str, Any]) -> float:
+    # absolute hybrid score (same as final_score, recomputed so it does not
+    # depend on how the recommender ranks)
+    return ALPHA_INGREDIENT * rec["overlap_score"] + BETA_EMBEDDING * rec["cosine_score"]
+
+
+def _to_recipe(rec: Dict[str, Any], category: Optional[str]) -> Dict[str, Any]:
+    return {
+        "title": rec["title"],
+        "ingredients": [i.strip() for i in rec["ingredients_text"].split(",") if i.strip()],
+        "instructions": _instructions_from_target(rec.get("target_text", "")),
+        "category": category or rec["categories"] or None,
+    }
+
+
+def retrieve_recipes(
+    ingredients: List[str],
+    category: Optional[str] = None,
+    num_recipes: int = 5,
+) -> List[Dict[str, Any]]:
+    """
+    Top ``num_recipes`` real recipes from the hybrid recommender, or [] when
+    retrieval is unavailable or not confident enough.
+    """
+    from .recommender import recommend_recipes as hybrid_recommend
+
+    try:
+        recs = hybrid_recommend(", ".join(ingredients), top_k=num_recipes, category=category)
+    except Exception as e:
+        logger.warning("Retrieval recommender unavailable, falling back to generation: %s", e)
+        return []
+
+    if not recs or _retrieval_confidence(recs[0]) < RETRIEVAL_MIN_CONFIDENCE:
+        return []
+    return [_to_recipe(r, category) for r in recs]
+
+
+def retrieve_recipes_many(
+    pantries: List[List[str]],
+    category: Optional[str] = None,
+    num_recipes: int = 5,
+) -> List[List[Dict[str, Any]]]:
+    """
+    ``retrieve_recipes`` for many pantries with one batched encode + scoring
+    pass; a pantry gets [] when its best match is below the confidence bar.
+    No generation fallback -- batch callers decide what to do with misses.
+    """
+    from .recommender import recommend_many
+
+    start = time.time()
+    batches = recommend_many(pantries, top_k=num_recipes, category=category)
+    RECOMMEND_PATH_LATENCY.labels(path="batch").observe(time.time() - start)
+
+    results = []
+    for recs in batches:
+        if not recs or _retrieval_confidence(recs[0]) < RETRIEVAL_MIN_CONFIDENCE:
+            results.append([])
+        else:
+            results.append([_to_recipe(r, category) for r in recs])
+    RECOMMEND_PATH_COUNT.labels(path="batch").inc(len(results))
+    return results
+
+
 def recommend_recipes(
     ingredients: List[str],
     category: Optional[str] = None,
     num_recipes: int = 1,
 ):
     """
-    Wrapper that returns a LIST because the frontend expects a list.
-    Default = 1 recipe.
+    Returns a LIST because the frontend expects a list.
+    Retrieval first; generates ONE recipe only as a fallback.
     """
-    recipe = recommend_one_recipe(ingredients, category)
-    return [recipe]
\ No newline at end of file
+    start = time.time()
+    results = retrieve_recipes(ingredients, category, num_recipes)
+    path = "retrieval"
+
+    if not results:
+        results = [recommend_one_recipe(ingredients, category)]
+        path = "generation"
+
+    RECOMMEND_PATH_COUNT.labels(path=path).inc()
+    RECOMMEND_PATH_LATENCY.labels(path=path).observe(time.time() - start)
+    return results
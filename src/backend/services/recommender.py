@@ -1,9 +1,36 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Dict, Any
 
 import numpy as np
 
-from ..deps import get_recommender_data, get_embed_model
-from ..config import ALPHA_INGREDIENT, BETA_EMBEDDING
+from ..deps import (
+    get_recommender_data,
+    get_embed_model,
+    get_query_encoder,
+    get_ann_index,
+    get_inverted_index,
+    get_sharded_scorer,
+)
+from ..config import (
+    ALPHA_INGREDIENT,
+    BETA_EMBEDDING,
+    ANN_MIN_CORPUS,
+    ANN_CANDIDATES,
+    CANDIDATE_MIN_SHARED_TOKENS,
+    CANDIDATE_MAX_FRACTION,
+    MMR_LAMBDA,
+    MMR_POOL_SIZE,
+    SCORING_SHARD_MIN_CORPUS,
+    RECOMMEND_BATCH_SCORE_MB,
+)
+from .ranking import cosine_scores, cosine_scores_many, mmr_select, top_k_indices
+from .category_index import CategoryQuery
+from .ingredient_index import to_word_set
+from .sharded_scorer import ScorerClosed
+from .query_embedding import encode_pantry, encode_pantries, pantry_key
+
+# max pantries scored per mat-mat product in recommend_many; fewer on large
+# corpora, see _batch_chunk
+_BATCH_CHUNK = 256
 
 
 def _normalize_text(x):
@@ -12,104 +39,198 @@ def _normalize_text(x):
     return str(x).strip().lower()
 
 
-def _to_word_set(text: str):
-    import re
-    WORD_SPLIT_RE = re.compile(r"[,\s;:\(\)\[\]\.\-]+")
-    if not isinstance(text, str):
-        return set()
-    words = [w.strip() for w in WORD_SPLIT_RE.split(text.lower()) if w.strip()]
-    return set(words)
-
-
-def _ingredient_overlap_score(pantry_words, recipe_words):
-    if not pantry_words:
-        return 0.0
-    inter = pantry_words & recipe_words
-    return len(inter) / float(len(pantry_words))
-
-
 def _build_pantry_embedding(pantry_ingredients: str):
-    embed_model = get_embed_model()
-    text = _normalize_text(pantry_ingredients)
-    embed_text = f"Ingredients: {text}"
-    emb = embed_model.encode([embed_text])
-    return emb[0]
+    # cached by normalized ingredient set -> repeat pantries skip the forward pass;
+    # misses from concurrent requests are encoded together by the micro-batcher
+    return encode_pantry(get_query_encoder(), pantry_ingredients)
+
+
+def _filter_by_category(category_index, category: CategoryQuery, mode: str = "any"):
+    # vectorized mask over the precomputed category bitset
+    return category_index.mask(category, mode)
+
+
+def _preselect_candidates(word_matrix, category_mask, num_allowed: int, pantry_words, top_k: int):
+    """
+    Recipes in the category mask that share >= CANDIDATE_MIN_SHARED_TOKENS
+    pantry tokens, or None to score the whole mask (pre-selection disabled,
+    fewer than top_k matches, or too many to be worth gathering).
+    ``word_matrix`` is the request's own snapshot, so the posting lists
+    always match ``category_mask`` even if a reload lands mid-request.
+    """
+    if CANDIDATE_MIN_SHARED_TOKENS <= 0 or not pantry_words:
+        return None
+    inverted = get_inverted_index(word_matrix)
+    if inverted is None:
+        return None
+    ids = inverted.candidates(pantry_words, CANDIDATE_MIN_SHARED_TOKENS)
+    ids = ids[category_mask[ids]]
+    if ids.size < top_k or ids.size > CANDIDATE_MAX_FRACTION * num_allowed:
+        return None
+    return ids
+
+
+def _hybrid_scores(overlap_scores, cos_sims):
+    # fixed-scale terms (overlap = shared / pantry size, raw cosine), not
+    # min-max over the candidates: a recipe scores the same whichever path
+    # (pre-selection, ANN, shards, full scan, batch) produced the candidates,
+    # so pruning never reorders results
+    return ALPHA_INGREDIENT * overlap_scores + BETA_EMBEDDING * cos_sims
+
+
+def _select_top(recipe_embeddings, candidate_idx, final_scores, top_k: int, mmr_lambda: float):
+    """
+    Top-k candidate positions and scores; with mmr_lambda < 1 the best
+    MMR_POOL_SIZE are re-picked by MMR over their embeddings (diversity).
+    """
+    if mmr_lambda >= 1.0 or top_k <= 1:
+        return top_k_indices(final_scores, top_k)
+    pool_pos, pool_scores = top_k_indices(final_scores, max(top_k, MMR_POOL_SIZE))
+    order = mmr_select(recipe_embeddings[candidate_idx[pool_pos]], pool_scores, top_k, mmr_lambda)
+    return pool_pos[order], pool_scores[order]
+
+
+def _results(recipes, candidate_idx, top_pos, top_scores, overlap_scores, cos_sims):
+    results = []
+    for pos, score in zip(top_pos, top_scores):
+        row = recipes.row(candidate_idx[pos])
+        results.append({
+            "title": row["Title"],
+            "ingredients_text": row["ingredients_text"],
+            "target_text": row.get("target_text", ""),
+            "categories": row["categories"],
+            "final_score": float(score),
+            "overlap_score": float(overlap_scores[pos]),
+            "cosine_score": float(cos_sims[pos]),
+        })
+    return results
 
 
-def _filter_by_category(df, category: Optional[str]):
-    if category is None or not str(category).strip():
-        return df.index.to_list()
-    category = category.strip().lower()
-    mask = df["categories_list"].apply(
-        lambda cats: category in [c.lower() for c in cats]
-    )
-    return df[mask].index.to_list()
+def _sharded_shortlist(sharded, num_recipes: int, pantry_emb, category_mask):
+    """Exact shortlist from the sharded scorer, or None (no scorer, or a reload retired it)."""
+    if sharded is None or sharded.num_vectors != num_recipes:
+        return None
+    try:
+        return sharded.search(pantry_emb, ANN_CANDIDATES, allowed=category_mask)
+    except ScorerClosed:
+        return None
 
 
 def recommend_recipes(pantry_ingredients: str, top_k: int = 5,
-                      category: Optional[str] = None) -> List[Dict[str, Any]]:
-    df, recipe_embeddings, _ = get_recommender_data()
+                      category: CategoryQuery = None,
+                      category_mode: str = "any",
+                      mmr_lambda: float = None) -> List[Dict[str, Any]]:
+    """
+    ``category`` may be one label or a list of labels; ``category_mode``
+    "any" matches recipes with at least one of them, "all" with every one.
+    ``mmr_lambda`` overrides MMR_LAMBDA (1.0 = no diversity re-ranking).
+    """
+    recipes, recipe_embeddings, word_matrix, category_index = get_recommender_data()
 
     pantry_norm = _normalize_text(pantry_ingredients)
-    pantry_words = _to_word_set(pantry_norm)
+    pantry_words = to_word_set(pantry_norm)
 
-    candidate_idx = _filter_by_category(df, category)
-    if not candidate_idx:
+    category_mask = _filter_by_category(category_index, category, category_mode)
+    candidate_idx = np.flatnonzero(category_mask)
+    if candidate_idx.size == 0:
         return []
 
-    cand_embeddings = recipe_embeddings[candidate_idx]
-    cand_df = df.iloc[candidate_idx].reset_index(drop=True)
-
-    overlap_scores = []
-    for _, row in cand_df.iterrows():
-        score = _ingredient_overlap_score(pantry_words, row["ingredients_words"])
-        overlap_scores.append(score)
-    overlap_scores = np.array(overlap_scores)
-
     pantry_emb = _build_pantry_embedding(pantry_ingredients)
-    pantry_emb = pantry_emb.reshape(1, -1)
-    from sklearn.metrics.pairwise import cosine_similarity
-
-    cos_sims = cosine_similarity(pantry_emb, cand_embeddings)[0]
-
-    def min_max_norm(x):
-        if np.allclose(x.max(), x.min()):
-            return np.zeros_like(x)
-        return (x - x.min()) / (x.max() - x.min())
-
-    overlap_norm = min_max_norm(overlap_scores)
-    cos_norm = min_max_norm(cos_sims)
-
-    final_scores = ALPHA_INGREDIENT * overlap_norm + BETA_EMBEDDING * cos_norm
-
-    cand_df = cand_df.copy()
-    cand_df["overlap_score"] = overlap_scores
-    cand_df["cosine_score"] = cos_sims
-    cand_df["final_score"] = final_scores
-
-    cand_df = cand_df.sort_values("final_score", ascending=False)
-    top = cand_df.head(top_k)
 
+    preselected = _preselect_candidates(word_matrix, category_mask, candidate_idx.size, pantry_words, top_k)
+    ann_index = get_ann_index()
+    use_preselected = preselected is not None and preselected.size <= ANN_MIN_CORPUS
+    shortlist = None
+    if not use_preselected and candidate_idx.size > SCORING_SHARD_MIN_CORPUS:
+        shortlist = _sharded_shortlist(get_sharded_scorer(), len(recipe_embeddings),
+                                       pantry_emb, category_mask)
+    if use_preselected:
+        # few specific ingredients: score only recipes that share them
+        candidate_idx = preselected
+        cos_sims = cosine_scores(recipe_embeddings[candidate_idx], pantry_emb)
+    elif shortlist is not None:
+        # very large corpus: exact cosine shortlist, shards scored in parallel
+        candidate_idx, cos_sims = shortlist
+        if candidate_idx.size == 0:
+            return []
+    elif (ann_index is not None and candidate_idx.size > ANN_MIN_CORPUS
+            and ann_index.num_vectors == len(recipe_embeddings)):
+        # large corpus: shortlist by approximate cosine, hybrid-rank the shortlist
+        candidate_idx, cos_sims = ann_index.search(
+            pantry_emb, ANN_CANDIDATES, allowed=category_mask
+        )
+        if candidate_idx.size == 0:
+            return []
+    else:
+        # recipe_embeddings are L2-normalized once at load -> cosine is a dot product
+        cos_sims = cosine_scores(recipe_embeddings, pantry_emb)[candidate_idx]
+
+    # one sparse mat-vec over the precomputed recipe x token matrix
+    overlap_scores = word_matrix.overlap_scores(pantry_words, rows=candidate_idx)
+
+    final_scores = _hybrid_scores(overlap_scores, cos_sims)
+
+    # partial selection over candidate positions; rows come from the columnar store
+    top_pos, top_scores = _select_top(recipe_embeddings, candidate_idx, final_scores, top_k,
+                                      MMR_LAMBDA if mmr_lambda is None else mmr_lambda)
+    return _results(recipes, candidate_idx, top_pos, top_scores, overlap_scores, cos_sims)
+
+
+def _batch_chunk(num_recipes: int, num_candidates: int) -> int:
+    # dense float32 cosine over all recipes + its candidate rows, per pantry
+    per_pantry = 4 * (num_recipes + num_candidates)
+    return int(max(1, min(_BATCH_CHUNK, RECOMMEND_BATCH_SCORE_MB * 2**20 // per_pantry)))
+
+
+def recommend_many(pantries: List[Any], top_k: int = 5,
+                   category: CategoryQuery = None,
+                   category_mode: str = "any",
+                   mmr_lambda: float = None) -> List[List[Dict[str, Any]]]:
+    """
+    ``recommend_recipes`` for many pantries at once (e.g. nightly jobs).
+
+    All queries are encoded in one batch and scored with one mat-mat product
+    per chunk of pantries, sized so the dense score matrices stay under
+    RECOMMEND_BATCH_SCORE_MB; overlap stays sparse until a pantry is ranked.
+    Always an exact scan over the category mask (no ANN shortlist or token
+    pre-selection).
+    """
+    if mmr_lambda is None:
+        mmr_lambda = MMR_LAMBDA
+    recipes, recipe_embeddings, word_matrix, category_index = get_recommender_data()
+
+    candidate_idx = np.flatnonzero(_filter_by_category(category_index, category, category_mode))
+    if candidate_idx.size == 0 or not pantries:
+        return [[] for _ in pantries]
+    full_scan = candidate_idx.size == len(recipe_embeddings)
+
+    # bulk job: straight to the model, bypassing the request-time micro-batcher
+    query_embs = encode_pantries(get_embed_model(), pantries)
+    word_sets = [to_word_set(_normalize_text(", ".join(pantry_key(p)))) for p in pantries]
+
+    chunk = _batch_chunk(len(recipe_embeddings), 0 if full_scan else candidate_idx.size)
     results = []
-    for _, row in top.iterrows():
-        results.append({
-            "title": row["Title"],
-            "ingredients_text": row["ingredients_text"],
-            "categories": row["categories"],
-            "final_score": float(row["final_score"]),
-            "overlap_score": float(row["overlap_score"]),
-            "cosine_score": float(row["cosine_score"]),
-        })
-
+    for start in range(0, len(pantries), chunk):
+        end = start + chunk
+        cos = cosine_scores_many(recipe_embeddings, query_embs[start:end])
+        if not full_scan:
+            cos = cos[candidate_idx]
+        overlap = word_matrix.overlap_scores_many(
+            word_sets[start:end], rows=None if full_scan else candidate_idx, dense=False
+        )
+
+        for j in range(cos.shape[1]):
+            pantry_overlap = overlap[:, j].toarray().ravel()
+            final_scores = _hybrid_scores(pantry_overlap, cos[:, j])
+            top_pos, top_scores = _select_top(recipe_embeddings, candidate_idx, final_scores,
+                                              top_k, mmr_lambda)
+            results.append(
+                _results(recipes, candidate_idx, top_pos, top_scores, pantry_overlap, cos[:, j])
+            )
+        del cos, overlap
     return results
 
 
 def list_all_categories() -> List[str]:
-    df, _, _ = get_recommender_data()
-    cats = set()
-    for cat_str in df["categories"]:
-        if isinstance(cat_str, str) and cat_str.strip():
-            for c in cat_str.split("|"):
-                if c.strip():
-                    cats.add(c.strip())
-    return sorted(cats)
\ No newline at end of file
+    _, _, _, category_index = get_recommender_data()
+    return list(category_index.categories)
@@ -1,26 +1,11 @@
-import os
-import json
-import joblib
-import numpy as np
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+from ..deps import get_query_encoder, get_recommender_data
+from .ranking import cosine_scores, top_k_indices
+from .query_embedding import encode_pantry
 
-MODEL_DIR = "model"
-EMB_PATH = os.path.join(MODEL_DIR, "recommender_embeddings.npy")
-META_PATH = os.path.join(MODEL_DIR, "recommender_metadata.pkl")
-INFO_PATH = os.path.join(MODEL_DIR, "recommender_model_info.json")
-
-# Load metadata
-meta_df = joblib.load(META_PATH)
-
-# Load recipe embeddings
-recipe_embeddings = np.load(EMB_PATH)
-
-# Load embedding model info
-with open(INFO_PATH, "r") as f:
-    info = json.load(f)
-
-embed_model = SentenceTransformer(info["embedding_model"])
+# Artifacts are resolved from config (APPETITE_RECOMMENDER_DIR) and loaded on
+# the first call through the shared lazy loaders in deps: importing this module
+# costs nothing, does not depend on the CWD, and shares (and hot-reloads) the
+# same recipe store, embeddings and micro-batched encoder as /recommend.
 
 
 def normalize_text(x):
@@ -29,35 +14,33 @@ def normalize_text(x):
     return str(x).lower().strip()
 
 
-def recommend_recipes(pantry_ingredients, top_k=5, category=None):
-    pantry_norm = normalize_text(pantry_ingredients)
-
-    pantry_emb = embed_model.encode([f"Ingredients: {pantry_norm}"])[0]
-    pantry_emb = pantry_emb.reshape(1, -1)
+def recommend_recipes(pantry_ingredients, top_k=5, category=None, category_mode="any"):
+    recipes, recipe_embeddings, _, category_index = get_recommender_data()
+    pantry_emb = encode_pantry(get_query_encoder(), pantry_ingredients)
 
-    sims = cosine_similarity(pantry_emb, recipe_embeddings)[0]
+    sims = cosine_scores(recipe_embeddings, pantry_emb)
 
     # CATEGORY FILTER
     if category:
-        category = category.lower().strip()
-        mask = meta_df["categories"].str.lower().str.contains(category)
-        meta_filtered = meta_df[mask].copy()
-        sims_filtered = sims[mask]
+        cand_idx = category_index.rows(category, category_mode)
+        sims_filtered = sims[cand_idx]
     else:
-        meta_filtered = meta_df.copy()
+        cand_idx = None
         sims_filtered = sims
 
-    # TOP K
-    top_idx = np.argsort(sims_filtered)[::-1][:top_k]
+    # TOP K (positions in sims_filtered -> recipe rows)
+    top_idx, top_scores = top_k_indices(sims_filtered, top_k)
+    if cand_idx is not None:
+        top_idx = cand_idx[top_idx]
 
     results = []
-    for idx in top_idx:
-        row = meta_filtered.iloc[idx]
+    for idx, score in zip(top_idx, top_scores):
+        row = recipes.row(idx)
         results.append({
             "title": row["Title"],
             "ingredients_text": row["ingredients_text"],
             "categories": row["categories"],
-            "score": float(sims_filtered[idx])
+            "score": float(score)
         })
 
     return results
\ No newline at end of file
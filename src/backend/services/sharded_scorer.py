@@ -0,0 +1,203 @@
+# src/backend/services/sharded_scorer.py
+import multiprocessing as mp
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+from .embedding_store import ConcatEmbeddings, QuantizedEmbeddings
+from .ranking import l2_normalize, top_k_indices
+
+# set in each worker by _attach
+_worker_blocks = []
+_worker_store = None
+_worker_limits = None
+
+
+class ScorerClosed(RuntimeError):
+    """The scorer was retired by an index reload; score another way."""
+
+
+def _to_shared(arrays, dtype):
+    """One shared-memory array holding ``arrays`` (same trailing shape) back to back."""
+    dtype = np.dtype(dtype)
+    shape = (sum(len(a) for a in arrays),) + tuple(arrays[0].shape[1:])
+    block = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+    view = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    # copy in slices so an mmapped source is never fully materialized twice
+    offset = 0
+    for array in arrays:
+        step = max(1, (64 << 20) // max(1, array[:1].nbytes))
+        for start in range(0, len(array), step):
+            chunk = array[start:start + step]
+            view[offset + start:offset + start + len(chunk)] = chunk
+        offset += len(array)
+    return block, (block.name, shape, dtype.str)
+
+
+def _limit_blas_threads():
+    # one BLAS thread per worker: the pool is the parallelism, shards must
+    # not oversubscribe the cores
+    global _worker_limits
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return
+    _worker_limits = threadpool_limits(limits=1)
+
+
+def _attach(values_spec, scales_spec):
+    global _worker_store
+    _limit_blas_threads()
+    arrays = []
+    for name, shape, dtype in (values_spec, scales_spec):
+        if name is None:
+            arrays.append(None)
+            continue
+        # spawned children share the parent's resource tracker; the parent unlinks
+        block = shared_memory.SharedMemory(name=name)
+        _worker_blocks.append(block)
+        arrays.append(np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf))
+    values, scales = arrays
+    _worker_store = values if scales is None else QuantizedEmbeddings(values, scales)
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+def _score_shard(start: int, stop: int, query: np.ndarray, k: int,
+                 allowed_bits: Optional[np.ndarray]):
+    """Local top-k (global row ids, cosine) of rows [start, stop)."""
+    if isinstance(_worker_store, QuantizedEmbeddings):
+        scores = QuantizedEmbeddings(_worker_store.values[start:stop],
+                                     _worker_store.scales[start:stop]) @ query
+    else:
+        scores = _worker_store[start:stop] @ query
+
+    if allowed_bits is None:
+        top, top_scores = top_k_indices(scores, k)
+        return top + start, top_scores
+    rows = np.flatnonzero(np.unpackbits(allowed_bits, count=stop - start))
+    top, top_scores = top_k_indices(scores[rows], k)
+    return rows[top] + start, top_scores
+
+
+class ShardedScorer:
+    """
+    Exact cosine top-k over recipe embeddings split into ``num_shards``
+    contiguous row ranges, scored in parallel by a pool of worker processes.
+
+    The (L2-normalized float32 or quantized) matrix is copied once into
+    shared memory; every worker maps the same pages, so the pool adds no
+    per-process copy. A query sends each shard only the query vector and its
+    slice of the allowed mask (bit-packed); shards return their local top-k
+    and the parent merges them. ``search`` has the same contract as
+    ``IVFIndex.search``.
+
+    ``retire`` closes the scorer once the searches already running finish;
+    a search started after that raises ``ScorerClosed``.
+    """
+
+    def __init__(self, embeddings, num_shards: int, workers: Optional[int] = None):
+        # base + segment blocks are copied back to back into one shared array
+        parts = embeddings.parts if isinstance(embeddings, ConcatEmbeddings) else [embeddings]
+        if all(isinstance(p, QuantizedEmbeddings) for p in parts):
+            values = [p.values for p in parts]
+            scales = [p.scales for p in parts]
+            dtype = parts[0].values.dtype
+        else:
+            values = [p if isinstance(p, np.ndarray) else np.asarray(p[:], dtype=np.float32) for p in parts]
+            scales, dtype = None, np.float32
+
+        self.num_vectors = sum(len(v) for v in values)
+        self.num_shards = max(1, min(num_shards, self.num_vectors))
+        bounds = np.linspace(0, self.num_vectors, self.num_shards + 1).astype(np.int64)
+        self.shards = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+        self._blocks = []
+        self._pool = None
+        self._lock = threading.Lock()
+        self._users = 0
+        self._retired = False
+        try:
+            values_block, values_spec = _to_shared(values, dtype)
+            self._blocks.append(values_block)
+            scales_spec = (None, None, None)
+            if scales is not None:
+                scales_block, scales_spec = _to_shared(scales, np.float32)
+                self._blocks.append(scales_block)
+            self._pool = self._start_pool(workers or self.num_shards, values_spec, scales_spec)
+        except Exception:
+            self.close()
+            raise
+
+    @staticmethod
+    def _start_pool(workers: int, values_spec, scales_spec) -> ProcessPoolExecutor:
+        # spawn: torch and fork do not mix
+        pool = ProcessPoolExecutor(workers, mp_context=mp.get_context("spawn"),
+                                   initializer=_attach, initargs=(values_spec, scales_spec))
+        # one task per worker starts the whole pool now, not on the first query
+        for future in [pool.submit(_ready) for _ in range(workers)]:
+            future.result()
+        return pool
+
+    @property
+    def nbytes(self) -> int:
+        return sum(block.size for block in self._blocks)
+
+    def search(self, query, k: int, allowed: Optional[np.ndarray] = None):
+        """
+        Top-k recipe ids and cosine scores for one query vector.
+
+        ``allowed`` is an optional boolean mask over recipe ids (e.g. a
+        category filter); filtered-out recipes are never ranked.
+        """
+        with self._lock:
+            if self._retired or self._pool is None:
+                raise ScorerClosed("sharded scorer is closed")
+            self._users += 1
+            pool = self._pool
+        try:
+            q = l2_normalize(query)
+            if allowed is not None and allowed.all():
+                allowed = None
+
+            futures = []
+            for start, stop in self.shards:
+                bits = None if allowed is None else np.packbits(allowed[start:stop])
+                futures.append(pool.submit(_score_shard, start, stop, q, k, bits))
+
+            parts = [f.result() for f in futures]
+        finally:
+            with self._lock:
+                self._users -= 1
+                last = self._retired and self._users == 0
+            if last:
+                self.close()
+
+        ids = np.concatenate([p[0] for p in parts])
+        scores = np.concatenate([p[1] for p in parts])
+        top, top_scores = top_k_indices(scores, k)
+        return ids[top], top_scores
+
+    def retire(self):
+        """Close once in-flight searches are done; new searches raise ScorerClosed."""
+        with self._lock:
+            self._retired = True
+            idle = self._users == 0
+        if idle:
+            self.close()
+
+    def close(self):
+        with self._lock:
+            pool, blocks = self._pool, self._blocks
+            self._pool, self._blocks = None, []
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        for block in blocks:
+            block.close()
+            block.unlink()
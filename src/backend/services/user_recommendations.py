@@ -0,0 +1,118 @@
+# src/backend/services/user_recommendations.py
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import USER_RECS_CACHE_SIZE, USER_RECS_CACHE_TTL_S, USER_RECS_MAX_VIEWS
+from ..deps import on_recommender_reload
+from ..metrics import USER_RECS_REFRESH_COUNT, USER_RECS_REFRESH_LATENCY
+from . import recipes as recipes_service
+from .caching import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# -----------------------------------------------------------
+# PER-USER RECOMMENDATIONS FOR THE STORED PANTRY
+# -----------------------------------------------------------
+# /recommend without typed ingredients is served from here in O(1).
+# Every pantry change bumps the user's pantry version, drops their
+# entries and queues a background refresh (retrieval only) for each
+# of the last USER_RECS_MAX_VIEWS (category, num_recipes) views the user
+# has asked for. Results computed from an older pantry version are never
+# stored, and the cache TTL bounds staleness for changes made through
+# another worker process.
+# -----------------------------------------------------------
+
+View = Tuple[Optional[str], int]
+
+# what the Streamlit page requests: no category filter, default num_recipes
+DEFAULT_VIEW: View = (None, 5)
+
+_cache = LRUCache("user_recommendations", USER_RECS_CACHE_SIZE, ttl=USER_RECS_CACHE_TTL_S)
+_lock = threading.Lock()
+_versions: Dict[int, int] = {}
+_views: Dict[int, "OrderedDict[View, None]"] = {}
+_pending: Dict[int, Tuple[int, List[str], float]] = {}
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="user-recs")
+
+# a new index version (segment, compaction) may change everyone's results
+on_recommender_reload(_cache.clear)
+
+
+def pantry_version(user_id: int) -> int:
+    with _lock:
+        return _versions.get(user_id, 0)
+
+
+def get(user_id: int, category: Optional[str], num_recipes: int) -> Optional[List[Dict[str, Any]]]:
+    results = _cache.get((user_id, category, num_recipes))
+    if results is not None:
+        with _lock:
+            views = _views.get(user_id)
+            if views and (category, num_recipes) in views:
+                views.move_to_end((category, num_recipes))
+    return results
+
+
+def put(user_id: int, category: Optional[str], num_recipes: int,
+        results: List[Dict[str, Any]], version: int) -> bool:
+    """
+    Cache results computed from the pantry as of ``version``; returns False
+    (and stores nothing) if the pantry has changed since.
+    """
+    with _lock:
+        if _versions.get(user_id, 0) != version:
+            return False
+        _remember_view(user_id, (category, num_recipes))
+        _cache.put((user_id, category, num_recipes), results)
+    return True
+
+
+def _remember_view(user_id: int, view: View):
+    # caller holds _lock; least recently used views beyond the cap are forgotten
+    views = _views.setdefault(user_id, OrderedDict())
+    views[view] = None
+    views.move_to_end(view)
+    while len(views) > max(1, USER_RECS_MAX_VIEWS):
+        category, num_recipes = views.popitem(last=False)[0]
+        _cache.pop((user_id, category, num_recipes))
+
+
+def pantry_changed(user_id: int, ingredient_names: List[str]):
+    """Invalidate the user's recommendations and recompute them in the background."""
+    with _lock:
+        version = _versions.get(user_id, 0) + 1
+        _versions[user_id] = version
+        for category, num_recipes in _views.get(user_id) or (DEFAULT_VIEW,):
+            _cache.pop((user_id, category, num_recipes))
+        # a refresh already queued for this user picks up the newest pantry
+        schedule = user_id not in _pending
+        _pending[user_id] = (version, list(ingredient_names), time.monotonic())
+    if schedule:
+        _executor.submit(_refresh, user_id)
+
+
+def _refresh(user_id: int):
+    with _lock:
+        version, names, changed_at = _pending.pop(user_id)
+        views = list(_views.get(user_id) or (DEFAULT_VIEW,))
+
+    for category, num_recipes in views:
+        try:
+            results = recipes_service.retrieve_recipes(names, category, num_recipes) if names else []
+        except Exception as e:
+            logger.warning("Background recommendation refresh failed for user %s: %s", user_id, e)
+            USER_RECS_REFRESH_COUNT.labels(result="error").inc()
+            continue
+
+        if not results:
+            # nothing confident to precompute; /recommend falls back on demand
+            USER_RECS_REFRESH_COUNT.labels(result="empty").inc()
+            continue
+        stored = put(user_id, category, num_recipes, results, version)
+        USER_RECS_REFRESH_COUNT.labels(result="stored" if stored else "superseded").inc()
+
+    USER_RECS_REFRESH_LATENCY.observe(time.monotonic() - changed_at)
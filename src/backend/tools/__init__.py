@@ -0,0 +1,3 @@
+# backend/tools/__init__.py
+# Offline builders for recommender artifacts.
+# Run from src/, e.g.: python -m backend.tools.build_ann_index --help
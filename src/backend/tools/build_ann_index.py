@@ -0,0 +1,36 @@
+# src/backend/tools/build_ann_index.py
+"""
+Build the IVF ANN index from the recipe embedding matrix.
+
+    python -m backend.tools.build_ann_index \
+        --embeddings model/recommender_embeddings.npy --out model/recommender_ann
+"""
+import argparse
+import time
+
+import numpy as np
+
+from ..services.ann_index import IVFIndex
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--embeddings", required=True, help="recommender_embeddings.npy")
+    parser.add_argument("--out", required=True, help="output directory for the index")
+    parser.add_argument("--nlist", type=int, default=None, help="clusters (default 4*sqrt(N))")
+    parser.add_argument("--iters", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    embeddings = np.load(args.embeddings, mmap_mode="r")
+    start = time.perf_counter()
+    index = IVFIndex.build(embeddings, nlist=args.nlist, iters=args.iters, seed=args.seed)
+    index.save(args.out)
+    print(
+        f"Built IVF index: {index.num_vectors} vectors, nlist={index.nlist}, "
+        f"{time.perf_counter() - start:.1f}s -> {args.out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
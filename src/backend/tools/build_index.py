@@ -0,0 +1,330 @@
+# src/backend/tools/build_index.py
+"""
+Build every recommender artifact the backend loads from the categorized CSV
+(replaces the ad-hoc cells of notebook 4_Recommender).
+
+    python -m backend.tools.build_index \
+        --csv data/final/appetite_with_categories.csv --out model --workers 4
+
+The CSV is streamed in --chunk-size rows; recipe texts are encoded in large
+batches by --workers processes and written straight into a memory-mapped
+embedding matrix, so memory stays bounded by chunk size x in-flight chunks.
+Writes into --out:
+
+    base-NNNNNN/                    one directory per published version:
+      recommender_embeddings.npy      L2-normalized float32 (N, dim)
+      recommender_recipes/            columnar recipe store
+      recommender_ingredients/        recipe x token matrix (word sets)
+      recommender_categories/         packed category bitsets
+      recommender_ann/                IVF index (skip with --no-ann)
+      recommender_embeddings_q/       with --quantize int8|float16
+    recommender_model_info.json     embedding model + corpus size
+    manifest.json                   version, base_dir, sha256 per file + overall checksum
+
+The new base is built in a hidden sibling directory and published by
+swapping the manifest, so a rebuild never touches files that running
+backends still have memory-mapped.
+
+New recipes can then be appended without re-encoding the corpus, see
+backend.tools.index_segments.
+
+    python -m backend.tools.build_index --verify model
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+from ..services.ann_index import IVFIndex
+from ..services.category_index import CategoryIndexBuilder
+from ..services.embedding_store import QuantizedEmbeddings, SUPPORTED_DTYPES
+from ..services.index_manifest import (
+    BASE_DIR_PREFIX,
+    SEGMENT_EMBEDDINGS_FILE,
+    SEGMENT_RECIPES_DIR,
+    SEGMENTS_DIR,
+    base_dir,
+    read_manifest,
+    verify_manifest,
+    write_manifest,
+)
+from ..services.ingredient_index import IngredientMatrixBuilder, to_word_set
+from ..services.ranking import l2_normalize_rows
+from ..services.recipe_store import RECIPE_COLUMNS, RecipeStoreWriter
+from .workers import start_workers
+
+EMBEDDINGS_FILE = SEGMENT_EMBEDDINGS_FILE
+RECIPES_DIR = SEGMENT_RECIPES_DIR
+WORDS_DIR = "recommender_ingredients"
+CATEGORIES_DIR = "recommender_categories"
+ANN_DIR = "recommender_ann"
+EMB_STORE_DIR = "recommender_embeddings_q"
+INFO_FILE = "recommender_model_info.json"
+
+# what a base directory holds (also what an unversioned index kept at its root)
+BASE_ARTIFACTS = (EMBEDDINGS_FILE, RECIPES_DIR, WORDS_DIR, CATEGORIES_DIR, ANN_DIR, EMB_STORE_DIR)
+
+_worker_model = None
+
+
+def _normalize_text(x) -> str:
+    if not isinstance(x, str):
+        return ""
+    return x.strip().lower()
+
+
+def embed_text(title, ingredients) -> str:
+    # same text the notebook embedded recipes with
+    return f"Title: {_normalize_text(title)} Ingredients: {_normalize_text(ingredients)}"
+
+
+def _init_worker(model_name: str, threads: int):
+    global _worker_model
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    if threads:
+        torch.set_num_threads(threads)
+    _worker_model = SentenceTransformer(model_name, device="cpu")
+
+
+def _encode(texts, batch_size: int) -> np.ndarray:
+    emb = _worker_model.encode(texts, batch_size=batch_size, show_progress_bar=False)
+    return l2_normalize_rows(emb)
+
+
+def _read_chunks(csv_path: str, chunk_size: int):
+    import pandas as pd
+
+    return pd.read_csv(csv_path, usecols=RECIPE_COLUMNS, chunksize=chunk_size,
+                       dtype=str, keep_default_na=False)
+
+
+def _count_rows(csv_path: str, chunk_size: int) -> int:
+    import pandas as pd
+
+    return sum(len(c) for c in pd.read_csv(csv_path, usecols=["Title"], chunksize=chunk_size * 10))
+
+
+class _Embeddings:
+    """Memory-mapped (N, dim) output, created once the first chunk reveals dim."""
+
+    def __init__(self, path: str, num_rows: int):
+        self.path = path
+        self.num_rows = num_rows
+        self.array = None
+
+    def write(self, offset: int, emb: np.ndarray):
+        if self.array is None:
+            self.array = np.lib.format.open_memmap(
+                self.path, mode="w+", dtype=np.float32, shape=(self.num_rows, emb.shape[1])
+            )
+        self.array[offset:offset + len(emb)] = emb
+
+    def close(self) -> int:
+        if self.array is None:
+            raise RuntimeError(f"No embeddings were written to {self.path}")
+        dim = int(self.array.shape[1])
+        self.array.flush()
+        self.array = None
+        return dim
+
+
+def encode_csv(csv_path: str, out_dir: str, model: str, chunk_size: int = 2048,
+               batch_size: int = 256, workers: int = 1):
+    """
+    Stream ``csv_path`` into ``out_dir``: memory-mapped embeddings plus the
+    columnar recipe store. Returns (num_rows, dim, word-set builder,
+    category builder) for callers that also want the side indexes.
+    """
+    start = time.perf_counter()
+    num_rows = _count_rows(csv_path, chunk_size)
+    if num_rows == 0:
+        # no rows, no embedding dim: nothing a backend could load
+        raise ValueError(f"{csv_path} has no recipes")
+    print(f"{num_rows} recipes in {csv_path}")
+    os.makedirs(out_dir, exist_ok=True)
+
+    embeddings = _Embeddings(os.path.join(out_dir, EMBEDDINGS_FILE), num_rows)
+    recipes = RecipeStoreWriter(os.path.join(out_dir, RECIPES_DIR))
+    words = IngredientMatrixBuilder()
+    categories = CategoryIndexBuilder()
+
+    workers = max(1, workers)
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    # each worker process loads its own model copy (single worker: 0 = torch's default threads)
+    start_task, pool = start_workers(workers, _init_worker, (model, threads if workers > 1 else 0))
+    submit = lambda texts: start_task(_encode, texts, batch_size)
+
+    in_flight = deque()
+    offset = 0
+    try:
+        for chunk in _read_chunks(csv_path, chunk_size):
+            columns = {c: chunk[c].tolist() for c in RECIPE_COLUMNS}
+            recipes.append(columns)
+            words.add(to_word_set(_normalize_text(t)) for t in columns["ingredients_text"])
+            categories.add(columns["categories"])
+
+            texts = [embed_text(t, i) for t, i in zip(columns["Title"], columns["ingredients_text"])]
+            in_flight.append((offset, submit(texts)))
+            offset += len(texts)
+
+            # bounded look-ahead: never more than 2 chunks per worker in memory
+            while len(in_flight) > 2 * workers:
+                done_offset, future = in_flight.popleft()
+                embeddings.write(done_offset, future.result())
+            print(f"  read {offset}/{num_rows} rows ({time.perf_counter() - start:.1f}s)")
+
+        while in_flight:
+            done_offset, future = in_flight.popleft()
+            embeddings.write(done_offset, future.result())
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    if offset != num_rows:
+        raise RuntimeError(f"CSV changed while building: counted {num_rows} rows, read {offset}")
+    dim = embeddings.close()
+    recipes.close()
+    print(f"Encoded {num_rows} x {dim} embeddings ({time.perf_counter() - start:.1f}s)")
+    return num_rows, dim, words, categories
+
+
+def write_side_artifacts(out_dir: str, words, categories, nlist=None, ann: bool = True, quantize=None):
+    """
+    Side indexes and optional ANN / quantized store next to the embeddings +
+    recipe store written by ``encode_csv``; returns the artifact names.
+    """
+    words.build().save(os.path.join(out_dir, WORDS_DIR))
+    categories.build().save(os.path.join(out_dir, CATEGORIES_DIR))
+
+    artifacts = [EMBEDDINGS_FILE, RECIPES_DIR, WORDS_DIR, CATEGORIES_DIR]
+    matrix = np.load(os.path.join(out_dir, EMBEDDINGS_FILE), mmap_mode="r")
+    # both stream the memmap: k-means trains on a sample, assignment and
+    # quantization go chunk by chunk, so the matrix is never fully in memory
+    if ann:
+        index = IVFIndex.build_to(os.path.join(out_dir, ANN_DIR), matrix, nlist=nlist)
+        artifacts.append(ANN_DIR)
+        print(f"Built IVF index, nlist={index.nlist}")
+        del index
+    if quantize:
+        QuantizedEmbeddings.quantize_to(os.path.join(out_dir, EMB_STORE_DIR), matrix, dtype=quantize)
+        artifacts.append(EMB_STORE_DIR)
+        print(f"Wrote {quantize} embedding store")
+    return artifacts
+
+
+def write_model_info(index_dir: str, model: str, num_rows: int, dim: int):
+    """Update the model info at the index root, keeping keys set by other tools (e.g. the ONNX backend switch)."""
+    info_path = os.path.join(index_dir, INFO_FILE)
+    info = {}
+    if os.path.exists(info_path):
+        with open(info_path) as f:
+            info = json.load(f)
+    info.update({"embedding_model": model, "total_recipes": num_rows, "embedding_dim": dim})
+    with open(f"{info_path}.tmp", "w") as f:
+        json.dump(info, f, indent=4)
+    os.replace(f"{info_path}.tmp", info_path)
+
+
+def build_dir_for(index_dir: str, version: int) -> str:
+    """Hidden sibling directory a new base for ``version`` is written into."""
+    path = os.path.join(index_dir, f".{BASE_DIR_PREFIX}{version:06d}.tmp")
+    shutil.rmtree(path, ignore_errors=True)
+    return path
+
+
+def publish_base(index_dir: str, build_dir: str, artifacts, previous: dict, extra: dict) -> dict:
+    """
+    Rename ``build_dir`` to base-<version>/ and point the manifest at it: the
+    manifest swap is the single step that publishes the new base. The
+    previous base is removed afterwards; processes that still map its files
+    keep valid pages until they reload. Returns the new manifest.
+    """
+    name = f"{BASE_DIR_PREFIX}{extra['version']:06d}"
+    target = os.path.join(index_dir, name)
+    shutil.rmtree(target, ignore_errors=True)  # left over from an interrupted publish
+    os.rename(build_dir, target)
+    manifest = write_manifest(index_dir, [os.path.join(name, a) for a in artifacts] + [INFO_FILE],
+                              extra=dict(extra, base_dir=name))
+
+    if previous.get("base_dir"):
+        shutil.rmtree(base_dir(index_dir, previous), ignore_errors=True)
+    elif previous:
+        # unversioned index built before base dirs: artifacts sat at the root
+        for old in BASE_ARTIFACTS:
+            path = os.path.join(index_dir, old)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            elif os.path.exists(path):
+                os.remove(path)
+    return manifest
+
+
+def build(args):
+    start = time.perf_counter()
+    os.makedirs(args.out, exist_ok=True)
+    previous = read_manifest(args.out) or {}
+    version = previous.get("version", 0) + 1
+
+    build_dir = build_dir_for(args.out, version)
+    try:
+        num_rows, dim, words, categories = encode_csv(
+            args.csv, build_dir, args.model, args.chunk_size, args.batch_size, args.workers
+        )
+        artifacts = write_side_artifacts(build_dir, words, categories, nlist=args.nlist,
+                                         ann=not args.no_ann, quantize=args.quantize)
+    except BaseException:
+        shutil.rmtree(build_dir, ignore_errors=True)
+        raise
+
+    # a full rebuild supersedes any appended segments; the version bump tells
+    # running backends to reload
+    write_model_info(args.out, args.model, num_rows, dim)
+    manifest = publish_base(args.out, build_dir, artifacts, previous, extra={
+        "version": version,
+        "source_csv": os.path.abspath(args.csv),
+        "embedding_model": args.model,
+        "num_recipes": num_rows,
+        "embedding_dim": dim,
+        "segments": [],
+    })
+    shutil.rmtree(os.path.join(args.out, SEGMENTS_DIR), ignore_errors=True)
+    print(f"Done in {time.perf_counter() - start:.1f}s -> {args.out} "
+          f"(version {manifest['version']}, checksum {manifest['checksum'][:12]})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default=os.path.join("data", "final", "appetite_with_categories.csv"))
+    parser.add_argument("--out", default="model")
+    parser.add_argument("--model", default="sentence-transformers/all-MiniLM-L6-v2")
+    parser.add_argument("--chunk-size", type=int, default=2048, help="CSV rows per chunk / encode task")
+    parser.add_argument("--batch-size", type=int, default=256, help="encode batch size inside a worker")
+    parser.add_argument("--workers", type=int, default=1, help="encoding processes")
+    parser.add_argument("--nlist", type=int, default=None, help="IVF clusters (default 4*sqrt(N))")
+    parser.add_argument("--no-ann", action="store_true", help="skip the IVF index")
+    parser.add_argument("--quantize", choices=sorted(SUPPORTED_DTYPES), default=None)
+    parser.add_argument("--verify", metavar="DIR", default=None, help="check DIR against its manifest and exit")
+    args = parser.parse_args()
+
+    if args.verify:
+        bad = verify_manifest(args.verify)
+        for rel in bad:
+            print(f"MISMATCH {rel}")
+        print("OK" if not bad else f"{len(bad)} file(s) do not match the manifest")
+        sys.exit(1 if bad else 0)
+
+    try:
+        build(args)
+    except ValueError as e:
+        sys.exit(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+# src/backend/tools/build_recipe_store.py
+"""
+Convert the pickled recommender metadata DataFrame into the columnar recipe store.
+
+    python -m backend.tools.build_recipe_store \
+        --metadata model/recommender_metadata.pkl --out model/recommender_recipes
+"""
+import argparse
+
+import joblib
+
+from ..services.recipe_store import RecipeStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--metadata", required=True, help="recommender_metadata.pkl")
+    parser.add_argument("--out", required=True)
+    args = parser.parse_args()
+
+    store = RecipeStore.from_dataframe(joblib.load(args.metadata))
+    store.save(args.out)
+    print(f"Wrote {len(store)} recipes ({', '.join(store.columns)}) -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
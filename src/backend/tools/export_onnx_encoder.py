@@ -0,0 +1,99 @@
+# src/backend/tools/export_onnx_encoder.py
+"""
+Export the sentence-transformers query encoder to ONNX (optionally int8).
+
+    python -m backend.tools.export_onnx_encoder \
+        --model sentence-transformers/all-MiniLM-L6-v2 \
+        --out model/recommender_encoder_onnx --int8 \
+        --info model/recommender_model_info.json
+
+With --info, recommender_model_info.json is switched to
+"embedding_backend": "onnx" so the backend serves queries through ONNX Runtime.
+"""
+import argparse
+import inspect
+import json
+import os
+
+from ..services.onnx_encoder import DEFAULT_MODEL_FILE, ENCODER_CONFIG_FILE, INT8_MODEL_FILE
+
+
+def _export(model_name: str, out_dir: str, max_length: int):
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    tokenizer.save_pretrained(out_dir)
+
+    model = AutoModel.from_pretrained(model_name).eval()
+    dummy = tokenizer(["Ingredients: chicken, garlic, lemon"], return_tensors="pt")
+    input_names = [n for n in ("input_ids", "attention_mask", "token_type_ids") if n in dummy]
+    dynamic = {n: {0: "batch", 1: "sequence"} for n in input_names}
+    dynamic["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    class _Wrapper(torch.nn.Module):
+        # fixed positional signature -> keyword call, whatever the HF forward() order is
+        def __init__(self, inner):
+            super().__init__()
+            self.inner = inner
+
+        def forward(self, *inputs):
+            return self.inner(**dict(zip(input_names, inputs))).last_hidden_state
+
+    # torch >= 2.5 has a dynamo exporter (the default from 2.9); keep the
+    # TorchScript exporter, which is the only one older torch versions have
+    extra = {"dynamo": False} if "dynamo" in inspect.signature(torch.onnx.export).parameters else {}
+    torch.onnx.export(
+        _Wrapper(model),
+        tuple(dummy[n] for n in input_names),
+        os.path.join(out_dir, DEFAULT_MODEL_FILE),
+        input_names=input_names,
+        output_names=["last_hidden_state"],
+        dynamic_axes=dynamic,
+        opset_version=17,
+        **extra,
+    )
+    with open(os.path.join(out_dir, ENCODER_CONFIG_FILE), "w") as f:
+        json.dump({"source_model": model_name, "max_length": max_length}, f, indent=2)
+
+
+def _quantize_int8(out_dir: str):
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(
+        os.path.join(out_dir, DEFAULT_MODEL_FILE),
+        os.path.join(out_dir, INT8_MODEL_FILE),
+        weight_type=QuantType.QInt8,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default="sentence-transformers/all-MiniLM-L6-v2")
+    parser.add_argument("--out", required=True)
+    parser.add_argument("--max-length", type=int, default=256)
+    parser.add_argument("--int8", action="store_true", help="also write int8-quantized weights")
+    parser.add_argument("--info", default=None, help="recommender_model_info.json to activate")
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    _export(args.model, args.out, args.max_length)
+    model_file = DEFAULT_MODEL_FILE
+    if args.int8:
+        _quantize_int8(args.out)
+        model_file = INT8_MODEL_FILE
+    print(f"Exported {args.model} -> {os.path.join(args.out, model_file)}")
+
+    if args.info:
+        with open(args.info) as f:
+            info = json.load(f)
+        info["embedding_backend"] = "onnx"
+        info["onnx_model_dir"] = os.path.relpath(args.out, os.path.dirname(os.path.abspath(args.info)))
+        info["onnx_model_file"] = model_file
+        with open(args.info, "w") as f:
+            json.dump(info, f, indent=4)
+        print(f"Activated ONNX backend in {args.info}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+# src/backend/tools/index_segments.py
+"""
+Grow the recommender index without re-encoding it, and fold segments back in.
+
+Append the recipes of a CSV (same columns as the categorized dataset) as a
+new segment; running backends pick it up on their next manifest poll:
+
+    python -m backend.tools.index_segments add --index model --csv data/new_recipes.csv
+
+Merge all segments into the base artifacts (side indexes, ANN and quantized
+store are rebuilt if the base had them), e.g. from a nightly cron job:
+
+    python -m backend.tools.index_segments compact --index model --min-segments 4
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+
+import numpy as np
+
+from ..services.category_index import CategoryIndex, CategoryIndexBuilder
+from ..services.embedding_store import META_FILE as EMB_STORE_META
+from ..services.index_manifest import (
+    SEGMENTS_DIR,
+    SEGMENT_EMBEDDINGS_FILE,
+    SEGMENT_RECIPES_DIR,
+    base_dir,
+    read_manifest,
+    save_manifest,
+    write_manifest,
+)
+from ..services.ingredient_index import IngredientMatrix, IngredientMatrixBuilder, to_word_set
+from ..services.recipe_store import RECIPE_COLUMNS, RecipeStore, RecipeStoreWriter
+from .build_index import (
+    ANN_DIR,
+    CATEGORIES_DIR,
+    EMB_STORE_DIR,
+    EMBEDDINGS_FILE,
+    RECIPES_DIR,
+    WORDS_DIR,
+    build_dir_for,
+    encode_csv,
+    publish_base,
+    write_model_info,
+    write_side_artifacts,
+)
+
+_COPY_ROWS = 8192
+
+
+def _require_manifest(index_dir: str) -> dict:
+    manifest = read_manifest(index_dir)
+    if manifest is None:
+        sys.exit(f"{index_dir} has no manifest; build it with backend.tools.build_index first")
+    return manifest
+
+
+def add_segment(args):
+    manifest = _require_manifest(args.index)
+    version = manifest.get("version", 0) + 1
+    name = f"seg-{version:06d}"
+    seg_dir = os.path.join(args.index, SEGMENTS_DIR, name)
+    tmp_dir = f"{seg_dir}.tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    num_rows, dim, _, _ = encode_csv(args.csv, tmp_dir, manifest["embedding_model"],
+                                     args.chunk_size, args.batch_size, args.workers)
+    if dim != manifest["embedding_dim"]:
+        shutil.rmtree(tmp_dir)
+        sys.exit(f"Segment dim {dim} != index dim {manifest['embedding_dim']}")
+
+    seg_manifest = write_manifest(tmp_dir, [SEGMENT_EMBEDDINGS_FILE, SEGMENT_RECIPES_DIR], extra={
+        "source_csv": os.path.abspath(args.csv),
+        "num_recipes": num_rows,
+    })
+    os.rename(tmp_dir, seg_dir)
+
+    # publishing the manifest is what makes the segment visible
+    manifest["segments"] = manifest.get("segments", []) + [{
+        "name": name,
+        "num_recipes": num_rows,
+        "checksum": seg_manifest["checksum"],
+    }]
+    manifest["version"] = version
+    save_manifest(args.index, manifest)
+    total = manifest["num_recipes"] + sum(s["num_recipes"] for s in manifest["segments"])
+    print(f"Added {name}: {num_rows} recipes -> version {version}, "
+          f"{len(manifest['segments'])} segment(s), {total} recipes")
+
+
+def _parts(index_dir: str, manifest: dict):
+    """(recipe store, embeddings) for the base and each segment, in row order."""
+    base = base_dir(index_dir, manifest)
+    parts = [(RecipeStore.load(os.path.join(base, RECIPES_DIR)),
+              np.load(os.path.join(base, EMBEDDINGS_FILE), mmap_mode="r"))]
+    for seg in manifest.get("segments", []):
+        seg_dir = os.path.join(index_dir, SEGMENTS_DIR, seg["name"])
+        parts.append((RecipeStore.load(os.path.join(seg_dir, SEGMENT_RECIPES_DIR)),
+                      np.load(os.path.join(seg_dir, SEGMENT_EMBEDDINGS_FILE), mmap_mode="r")))
+    return parts
+
+
+def _seed_builders(base: str, base_rows: int):
+    # reuse the base side indexes when they are current; else start empty
+    words = IngredientMatrixBuilder()
+    categories = CategoryIndexBuilder()
+    reuse = False
+    if os.path.isdir(os.path.join(base, WORDS_DIR)) and os.path.isdir(os.path.join(base, CATEGORIES_DIR)):
+        word_matrix = IngredientMatrix.load(os.path.join(base, WORDS_DIR))
+        category_index = CategoryIndex.load(os.path.join(base, CATEGORIES_DIR))
+        if word_matrix.num_recipes == base_rows and category_index.num_recipes == base_rows:
+            words = IngredientMatrixBuilder.from_matrix(word_matrix)
+            categories = CategoryIndexBuilder.from_index(category_index)
+            reuse = True
+    return words, categories, reuse
+
+
+def compact(args):
+    manifest = _require_manifest(args.index)
+    segments = manifest.get("segments", [])
+    if len(segments) < args.min_segments:
+        print(f"{len(segments)} segment(s) < --min-segments {args.min_segments}; nothing to do")
+        return
+
+    start = time.perf_counter()
+    parts = _parts(args.index, manifest)
+    total = sum(len(store) for store, _ in parts)
+    dim = manifest["embedding_dim"]
+    version = manifest.get("version", 0) + 1
+    tmp_dir = build_dir_for(args.index, version)
+    os.makedirs(tmp_dir)
+
+    base = base_dir(args.index, manifest)
+    words, categories, reuse = _seed_builders(base, len(parts[0][0]))
+    embeddings = np.lib.format.open_memmap(os.path.join(tmp_dir, EMBEDDINGS_FILE), mode="w+",
+                                           dtype=np.float32, shape=(total, dim))
+    recipes = RecipeStoreWriter(os.path.join(tmp_dir, RECIPES_DIR))
+    offset = 0
+    for i, (store, emb) in enumerate(parts):
+        for lo in range(0, len(store), _COPY_ROWS):
+            hi = min(lo + _COPY_ROWS, len(store))
+            # stores from older builds may lack a column; the writer needs all of them
+            columns = {c: store.column(c, lo, hi) if c in store.columns else [""] * (hi - lo)
+                       for c in RECIPE_COLUMNS}
+            recipes.append(columns)
+            if i > 0 or not reuse:
+                words.add(to_word_set(t) for t in columns["ingredients_text"])
+                categories.add(columns["categories"])
+            embeddings[offset + lo:offset + hi] = emb[lo:hi]
+        offset += len(store)
+    embeddings.flush()
+    del embeddings
+    recipes.close()
+
+    # keep the base's optional artifacts (and info keys) in the compacted index
+    quantize = None
+    if os.path.exists(os.path.join(base, EMB_STORE_DIR, EMB_STORE_META)):
+        with open(os.path.join(base, EMB_STORE_DIR, EMB_STORE_META)) as f:
+            quantize = json.load(f)["dtype"]
+    artifacts = write_side_artifacts(tmp_dir, words, categories,
+                                     ann=os.path.isdir(os.path.join(base, ANN_DIR)), quantize=quantize)
+    write_model_info(args.index, manifest["embedding_model"], total, dim)
+
+    # one manifest swap publishes the new base and drops the folded segments
+    # together, so a reload never sees segment rows twice
+    previous = manifest
+    manifest = publish_base(args.index, tmp_dir, artifacts, previous, extra={
+        "version": version,
+        "source_csv": previous.get("source_csv"),
+        "embedding_model": previous["embedding_model"],
+        "num_recipes": total,
+        "embedding_dim": dim,
+        "segments": [],
+        "compacted_segments": len(segments),
+    })
+    for seg in segments:
+        shutil.rmtree(os.path.join(args.index, SEGMENTS_DIR, seg["name"]), ignore_errors=True)
+    print(f"Compacted {len(segments)} segment(s) into {total} recipes in "
+          f"{time.perf_counter() - start:.1f}s -> version {manifest['version']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    add = sub.add_parser("add", help="encode a CSV of new recipes as a new segment")
+    add.add_argument("--index", default="model")
+    add.add_argument("--csv", required=True)
+    add.add_argument("--chunk-size", type=int, default=2048)
+    add.add_argument("--batch-size", type=int, default=256)
+    add.add_argument("--workers", type=int, default=1)
+    add.set_defaults(func=add_segment)
+
+    comp = sub.add_parser("compact", help="merge all segments into the base artifacts")
+    comp.add_argument("--index", default="model")
+    comp.add_argument("--min-segments", type=int, default=1, help="only compact at this many segments")
+    comp.set_defaults(func=compact)
+
+    args = parser.parse_args()
+    try:
+        args.func(args)
+    except ValueError as e:
+        sys.exit(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+# src/backend/tools/preprocess.py
+"""
+Clean the raw recipe dataset and split it into train / val / test
+(replaces notebook 1_Preprocessing).
+
+    python -m backend.tools.preprocess \
+        --raw "data/raw/Food Ingredients and Recipe Dataset with Image Name Mapping.csv" \
+        --out data/processed --workers 4 --csv
+
+The raw CSV is streamed in --chunk-size rows; ingredient lists are parsed
+(``ast.literal_eval``) and the text fields built by --workers processes, and
+each chunk is written as one Parquet shard per split as soon as it is done.
+Memory stays bounded by chunk size x in-flight chunks, whatever the dataset
+size. Writes into --out:
+
+    train/part-NNNNN.parquet        Title, ingredients_text, target_text, Image_Name
+    val/part-NNNNN.parquet
+    test/part-NNNNN.parquet
+    manifest.json                   row counts, split settings, sha256 per shard
+    appetite_{train,val,test,clean_full}.csv   with --csv (what notebooks 2-4 read)
+
+A row's split comes from a seeded hash of its title + ingredients, so the
+split is reproducible, independent of --chunk-size / --workers, and exact
+duplicates always land in the same split.
+"""
+import argparse
+import ast
+import hashlib
+import math
+import os
+import shutil
+import sys
+import time
+from collections import Counter, deque
+
+from ..services.index_manifest import write_manifest
+from .workers import start_workers
+
+RAW_COLUMNS = ["Title", "Ingredients", "Instructions", "Image_Name", "Cleaned_Ingredients"]
+OUTPUT_COLUMNS = ["Title", "ingredients_text", "target_text", "Image_Name"]
+SPLITS = ("train", "val", "test")
+MIN_TARGET_LEN = 50
+
+
+def _missing(x) -> bool:
+    return x is None or (isinstance(x, float) and math.isnan(x))
+
+
+def safe_parse_list(x):
+    if isinstance(x, list):
+        return x
+    if _missing(x):
+        return None
+    try:
+        parsed = ast.literal_eval(x)
+        return parsed if isinstance(parsed, list) else [parsed]
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        return None
+
+
+def build_ingredients_text(cleaned, raw):
+    ing_list = cleaned if cleaned else raw
+    if not ing_list:
+        return None
+    return ", ".join(str(i).strip() for i in ing_list if str(i).strip()) or None
+
+
+def build_target_text(title, instructions):
+    # a missing title / instructions is empty (the notebook turned NaN into "nan")
+    title = "" if _missing(title) else str(title).strip()
+    instr = "" if _missing(instructions) else str(instructions).strip()
+    if not instr:
+        return None
+    return f"Title: {title}\nInstructions: {instr}" if title else f"Instructions: {instr}"
+
+
+def split_of(title: str, ingredients_text: str, seed: int, val: float, test: float) -> str:
+    digest = hashlib.blake2b(f"{seed}\x1f{title}\x1f{ingredients_text}".encode("utf-8"),
+                             digest_size=8).digest()
+    u = int.from_bytes(digest, "little") / 2.0 ** 64
+    if u < test:
+        return "test"
+    if u < test + val:
+        return "val"
+    return "train"
+
+
+def process_chunk(columns, seed: int, val: float, test: float, min_target_len: int = MIN_TARGET_LEN):
+    """
+    Parse and clean one chunk of raw columns; returns ({split: output
+    columns}, Counter of dropped rows by reason).
+    """
+    out = {s: {c: [] for c in OUTPUT_COLUMNS} for s in SPLITS}
+    dropped = Counter()
+    for title, ingredients, instructions, image, cleaned in zip(*(columns[c] for c in RAW_COLUMNS)):
+        ingredients_text = build_ingredients_text(safe_parse_list(cleaned), safe_parse_list(ingredients))
+        if ingredients_text is None:
+            dropped["no_ingredients"] += 1
+            continue
+        target_text = build_target_text(title, instructions)
+        if target_text is None:
+            dropped["no_instructions"] += 1
+            continue
+        if len(target_text) < min_target_len:
+            dropped["short_target"] += 1
+            continue
+
+        title = "" if _missing(title) else str(title)
+        split = out[split_of(title, ingredients_text, seed, val, test)]
+        split["Title"].append(title)
+        split["ingredients_text"].append(ingredients_text)
+        split["target_text"].append(target_text)
+        split["Image_Name"].append("" if _missing(image) else str(image))
+    return out, dropped
+
+
+def _read_chunks(raw_path: str, chunk_size: int):
+    import pandas as pd
+
+    return pd.read_csv(raw_path, usecols=lambda c: c in RAW_COLUMNS, dtype=str, chunksize=chunk_size)
+
+
+class _ShardWriter:
+    """Per-split Parquet shards (and optional CSVs), written chunk by chunk in input order."""
+
+    def __init__(self, out_dir: str, csv: bool):
+        import pandas as pd
+
+        self.pd = pd
+        self.out_dir = out_dir
+        self.csv = csv
+        self.rows = Counter()
+        self.shards = Counter()
+        for split in SPLITS:
+            os.makedirs(os.path.join(out_dir, split), exist_ok=True)
+
+    def _append_csv(self, df, name: str):
+        path = os.path.join(self.out_dir, f"appetite_{name}.csv")
+        df.to_csv(path, mode="a", index=False, header=not os.path.exists(path))
+
+    def write(self, part: int, chunk_out):
+        for split in SPLITS:
+            df = self.pd.DataFrame(chunk_out[split], columns=OUTPUT_COLUMNS)
+            if df.empty:
+                continue
+            df.to_parquet(os.path.join(self.out_dir, split, f"part-{part:05d}.parquet"), index=False)
+            self.rows[split] += len(df)
+            self.shards[split] += 1
+            if self.csv:
+                self._append_csv(df, split)
+                self._append_csv(df, "clean_full")
+
+
+def preprocess(args):
+    try:
+        import pyarrow  # noqa: F401  (pandas' Parquet engine)
+    except ImportError:
+        sys.exit("pyarrow is required to write Parquet shards: pip install pyarrow")
+    if not 0 <= args.val + args.test < 1:
+        sys.exit("--val + --test must be in [0, 1)")
+
+    # a re-run replaces the previous output instead of mixing shards
+    for name in list(SPLITS) + [f"appetite_{n}.csv" for n in list(SPLITS) + ["clean_full"]]:
+        path = os.path.join(args.out, name)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        elif os.path.exists(path):
+            os.remove(path)
+    writer = _ShardWriter(args.out, args.csv)
+
+    workers = max(1, args.workers)
+    start_task, pool = start_workers(workers)
+    submit = lambda cols: start_task(process_chunk, cols, args.seed, args.val, args.test, args.min_target_len)
+
+    start = time.perf_counter()
+    read = 0
+    dropped = Counter()
+    in_flight = deque()
+
+    def drain_one():
+        part, future = in_flight.popleft()
+        chunk_out, chunk_dropped = future.result()
+        writer.write(part, chunk_out)
+        dropped.update(chunk_dropped)
+
+    try:
+        for part, chunk in enumerate(_read_chunks(args.raw, args.chunk_size)):
+            columns = {c: chunk[c].tolist() if c in chunk else [None] * len(chunk) for c in RAW_COLUMNS}
+            in_flight.append((part, submit(columns)))
+            read += len(chunk)
+
+            # bounded look-ahead: never more than 2 chunks per worker in memory
+            while len(in_flight) > 2 * workers:
+                drain_one()
+            elapsed = time.perf_counter() - start
+            print(f"  read {read} rows ({elapsed:.1f}s, {read / max(elapsed, 1e-9):,.0f} rows/s)")
+
+        while in_flight:
+            drain_one()
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    elapsed = time.perf_counter() - start
+    kept = sum(writer.rows.values())
+    manifest = write_manifest(args.out, list(SPLITS), extra={
+        "source_csv": os.path.abspath(args.raw),
+        "rows_read": read,
+        "rows_kept": kept,
+        "rows": dict(writer.rows),
+        "dropped": dict(dropped),
+        "split": {"seed": args.seed, "val": args.val, "test": args.test},
+        "min_target_len": args.min_target_len,
+        "columns": OUTPUT_COLUMNS,
+    })
+
+    print(f"Kept {kept}/{read} rows -> " + ", ".join(
+        f"{s} {writer.rows[s]} ({writer.shards[s]} shards)" for s in SPLITS))
+    if dropped:
+        print("Dropped: " + ", ".join(f"{reason} {n}" for reason, n in sorted(dropped.items())))
+    print(f"Done in {elapsed:.1f}s: {read / max(elapsed, 1e-9):,.0f} rows/s with {workers} worker(s) "
+          f"-> {args.out} (checksum {manifest['checksum'][:12]})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--raw", default=os.path.join(
+        "data", "raw", "Food Ingredients and Recipe Dataset with Image Name Mapping.csv"))
+    parser.add_argument("--out", default=os.path.join("data", "processed"))
+    parser.add_argument("--chunk-size", type=int, default=20000, help="raw rows per chunk / parse task")
+    parser.add_argument("--workers", type=int, default=1, help="parsing processes")
+    parser.add_argument("--seed", type=int, default=42, help="split hash seed")
+    parser.add_argument("--val", type=float, default=0.1, help="validation fraction")
+    parser.add_argument("--test", type=float, default=0.1, help="test fraction")
+    parser.add_argument("--min-target-len", type=int, default=MIN_TARGET_LEN)
+    parser.add_argument("--csv", action="store_true", help="also write the notebook's appetite_*.csv files")
+    preprocess(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
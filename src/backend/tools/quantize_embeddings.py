@@ -0,0 +1,28 @@
+# src/backend/tools/quantize_embeddings.py
+"""
+Convert recommender_embeddings.npy into the memory-mappable quantized store.
+
+    python -m backend.tools.quantize_embeddings \
+        --embeddings model/recommender_embeddings.npy --out model/recommender_embeddings_q
+"""
+import argparse
+
+import numpy as np
+
+from ..services.embedding_store import QuantizedEmbeddings, SUPPORTED_DTYPES
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--embeddings", required=True)
+    parser.add_argument("--out", required=True)
+    parser.add_argument("--dtype", choices=SUPPORTED_DTYPES, default="int8")
+    args = parser.parse_args()
+
+    store = QuantizedEmbeddings.quantize(np.load(args.embeddings), dtype=args.dtype)
+    store.save(args.out)
+    print(f"Wrote {len(store)} x {store.shape[1]} {args.dtype} embeddings -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+# src/backend/tools/workers.py
+"""Process-pool plumbing shared by the streaming CLIs (build_index, preprocess)."""
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+
+
+class Done:
+    """Already-computed result with the Future interface (single-process path)."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def result(self):
+        return self._value
+
+
+def start_workers(workers: int, initializer=None, initargs=()):
+    """
+    (submit, pool): ``submit(fn, *args)`` returns a future-like result.
+    One worker runs tasks inline (pool is None, ``initializer`` runs here);
+    more use a spawn pool (torch and fork do not mix) the caller shuts down.
+    """
+    if workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        return (lambda fn, *args: Done(fn(*args))), None
+    pool = ProcessPoolExecutor(workers, mp_context=mp.get_context("spawn"),
+                               initializer=initializer, initargs=initargs)
+    return pool.submit, pool